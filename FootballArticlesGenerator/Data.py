@@ -1,8 +1,11 @@
 """Module storing class representation of data entities - player, score, etc."""
 
 # Python's libraries
-from typing import List
-from dataclasses import dataclass
+import os
+import collections.abc
+from typing import Callable, List, Dict, Mapping, Optional
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
 
 # Other parts of the code
 import Types
@@ -11,9 +14,56 @@ import Types
 Using dataclass(frozen=True) to guarantee immutability.
 Each data class has create static method (usually needs specific set of attributes), 
 which returns immutable instance (to prevent data from changing during the running of the code).
+Data classes are also slotted (add_slots) - instances have no __dict__, which makes them smaller.
 """
 
+# slots can be switched off by environment variable (e.g. to compare memory in benchmarks/slots_benchmark.py)
+USE_SLOTS: bool = os.getenv('FOOTBALL_ARTICLES_NO_SLOTS') is None
 
+
+def add_slots(cls):
+    """
+    Class decorator (applied on top of @dataclass) recreating the data class with __slots__.
+    Same as dataclass(slots=True) available since Python 3.10, which also supports weak references
+    (used by DataRegistry) and pickling of frozen classes.
+    :param cls: data class
+    :return: slotted data class
+    """
+    if not USE_SLOTS:
+        return cls
+
+    inherited_slots = set()
+    for base in cls.__mro__[1:-1]:
+        inherited_slots.update(base.__dict__.get('__slots__', ()))
+
+    field_names = tuple(f.name for f in fields(cls))
+    slots = tuple(name for name in field_names if name not in inherited_slots)
+    if '__weakref__' not in inherited_slots:
+        slots += ('__weakref__',)
+
+    cls_dict = dict(cls.__dict__)
+    for name in slots:
+        cls_dict.pop(name, None)   # removing class attributes (field defaults) which would conflict with slots
+    cls_dict.pop('__dict__', None)
+    cls_dict['__slots__'] = slots
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+
+    # default pickling of slots would use setattr, which is forbidden in frozen classes
+    def __getstate__(self):
+        return [getattr(self, name) for name in field_names]
+
+    def __setstate__(self, state):
+        for (name, value) in zip(field_names, state):
+            object.__setattr__(self, name, value)
+
+    slotted_cls.__getstate__ = __getstate__
+    slotted_cls.__setstate__ = __setstate__
+    return slotted_cls
+
+
+@add_slots
 @dataclass(frozen=True)
 class Score:
     """Data class to store information about score."""
@@ -57,6 +107,7 @@ class Score:
         return f'{self.goals_home}:{self.goals_away}'
 
 
+@add_slots
 @dataclass(frozen=True)
 class Venue:
     """Data class to store information about venue."""
@@ -84,6 +135,7 @@ class Venue:
             f"Attendance: {self.attendance}, Percentage of at.: {self.full_percentage}, "
 
 
+@add_slots
 @dataclass(frozen=True)
 class Country:
     """Data class to store information about country."""
@@ -101,6 +153,7 @@ class Country:
         return Country(id=id_, name=name_)
 
 
+@add_slots
 @dataclass(frozen=True)
 class Player:
     """Data class to store information about player."""
@@ -109,6 +162,11 @@ class Player:
     country: Country
     lineup_position_id: int
     number: int
+    # name forms derived from full_name - computed once in create
+    first_name: str = field(repr=False, compare=False)
+    last_name: str = field(repr=False, compare=False)
+    short_name: str = field(repr=False, compare=False)
+    full_name_reversed: str = field(repr=False, compare=False)
 
     @staticmethod
     def create(id_: int, full_name: str, country: Country, lineup_position_id: int, number: int):
@@ -121,29 +179,134 @@ class Player:
         :param number: Jersey number of the player.
         :return: Player
         """
+        (first_name, last_name) = Player.__init_name_parts(full_name)
+        short_name = first_name[0] + '. ' + last_name if first_name else last_name
+        full_name_reversed = first_name + ' ' + last_name if first_name else last_name
         return Player(id=id_, full_name=full_name, country=country,
-                      lineup_position_id=lineup_position_id, number=number)
+                      lineup_position_id=lineup_position_id, number=number,
+                      first_name=first_name, last_name=last_name, short_name=short_name,
+                      full_name_reversed=full_name_reversed)
+
+    @staticmethod
+    def __init_name_parts(full_name: str) -> (str, str):
+        """
+        Splits full name (last name first) into first name and last name.
+        First name is the last word, every word before is the last name (multi-part surnames).
+        Full name with only one word (e.g. some coaches) is considered as the last name.
+        :param full_name: Full name of the player.
+        :return: tuple of first name and last name
+        """
+        words = full_name.split() if full_name is not None else []
+        if len(words) == 0:
+            return '', ''
+        elif len(words) == 1:
+            return '', words[0]
+        else:
+            return words[-1], ' '.join(words[:-1])
 
     def get_full_name_reversed(self) -> str:
-        """Returns first name of the player from his full name."""
-        return self.get_first_name() + " " + self.get_last_name()
+        """Returns full name of the player with first name first."""
+        return self.full_name_reversed
 
     def get_first_name(self) -> str:
         """Returns first name of the player from his full name."""
-        return self.full_name.split()[-1]
+        return self.first_name
 
     def get_last_name(self) -> str:
         """Returns last name of the player from his full name."""
-        return self.full_name.split()[0]
+        return self.last_name
 
     def get_short_name(self) -> str:
-        """Returns last name of the player from his full name."""
-        return self.full_name.split()[1][0] + '. ' + self.full_name.split()[0]
+        """Returns initial of the first name and last name of the player (e.g. M. Doležal)."""
+        return self.short_name
 
     def __str__(self):
         return f"({self.full_name}, {self.number})"
 
 
+class LazyLineup(collections.abc.Sequence):
+    """Lineup of the team keeping raw records of players (e.g. from json file), Player is created only
+    when it is needed for the first time (lookup by id or number, indexing or iteration) and then reused.
+    It behaves as read-only list of players, so that Team.lineup works the same for every caller.
+    """
+
+    class Index(collections.abc.Mapping):
+        """Read-only index of the lazy lineup (id or jersey number -> Player), built from the records
+        (without creating any Player) on the first lookup."""
+
+        def __init__(self, lineup: 'LazyLineup', records: List[dict], get_key: Callable[[dict], Optional[int]]):
+            self.__lineup = lineup
+            self.__records = records
+            self.__get_key = get_key
+            self.__positions: Dict[int, int] = None
+
+        def __get_positions(self) -> Dict[int, int]:
+            """Returns positions of the players in the lineup according to their key."""
+            if self.__positions is None:
+                positions: Dict[int, int] = {}
+                for (position, record) in enumerate(self.__records):
+                    key = self.__get_key(record)
+                    if key is not None:
+                        positions.setdefault(key, position)   # first occurrence wins (same as in Team.create)
+                self.__positions = positions
+            return self.__positions
+
+        def __getitem__(self, key: int) -> Player:
+            return self.__lineup[self.__get_positions()[key]]
+
+        def __iter__(self):
+            return iter(self.__get_positions())
+
+        def __len__(self) -> int:
+            return len(self.__get_positions())
+
+    def __init__(self, records: List[dict], create_player: Callable[[dict], Player],
+                 get_id: Callable[[dict], int], get_number: Callable[[dict], Optional[int]]):
+        """
+        Initializes lineup from raw records, no Player is created yet.
+        :param records: Raw records of players in order of the lineup.
+        :param create_player: Function creating Player from the record.
+        :param get_id: Function returning id of the player from the record.
+        :param get_number: Function returning jersey number of the player from the record.
+        """
+        self.__records = records
+        self.__create_player = create_player
+        self.__players: List[Optional[Player]] = [None] * len(records)
+        self.players_by_id = LazyLineup.Index(self, records, get_id)
+        self.players_by_number = LazyLineup.Index(self, records, get_number)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        player = self.__players[index]
+        if player is None:
+            player = self.__create_player(self.__records[index])
+            self.__players[index] = player
+        return player
+
+    def __len__(self) -> int:
+        return len(self.__records)
+
+    def __eq__(self, other):
+        if not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    __hash__ = None   # mutable cache of players, same as list
+
+    def __reduce__(self):
+        """Lineup is pickled (and deep copied) as list of every player - records nor functions are not needed."""
+        return list, (list(self),)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def get_created_count(self) -> int:
+        """Returns number of players already created from the records."""
+        return sum(1 for p in self.__players if p is not None)
+
+
+@add_slots
 @dataclass(frozen=True)
 class Team:
     """Data class to store information about team."""
@@ -151,7 +314,10 @@ class Team:
     name: str
     country: Country
     type: Types.Team
-    lineup: List[Player]
+    lineup: List[Player]   # list of players or LazyLineup
+    # indices of the lineup - built once in create, read-only views to keep Team immutable
+    players_by_id: Mapping[int, Player] = field(repr=False, compare=False)
+    players_by_number: Mapping[int, Player] = field(repr=False, compare=False)
 
     @staticmethod
     def create(id_: int, name: str, country: Country, type_: Types.Team, lineup: List[Player]):
@@ -161,15 +327,50 @@ class Team:
         :param name: Name of the team.
         :param country: Country of the team.
         :param type_: Whether the team played home, or away.
-        :param lineup: List of players who attended the match.
+        :param lineup: List of players who attended the match (or LazyLineup - players are then created lazily).
         :return: Team
         """
-        return Team(id=id_, name=name, country=country, type=type_, lineup=lineup)
+        if isinstance(lineup, LazyLineup):   # lazy lineup has its own indices
+            return Team(id=id_, name=name, country=country, type=type_, lineup=lineup,
+                        players_by_id=lineup.players_by_id, players_by_number=lineup.players_by_number)
+
+        players_by_id: Dict[int, Player] = {}
+        players_by_number: Dict[int, Player] = {}
+        for player in lineup:
+            # first occurrence wins (same as the linear search through the lineup would do)
+            players_by_id.setdefault(player.id, player)
+            if player.number is not None:
+                players_by_number.setdefault(player.number, player)
+
+        return Team(id=id_, name=name, country=country, type=type_, lineup=lineup,
+                    players_by_id=MappingProxyType(players_by_id),
+                    players_by_number=MappingProxyType(players_by_number))
+
+    def get_player(self, id_: int) -> Optional[Player]:
+        """
+        Returns Player from the lineup according to his id.
+        :param id_: Id of the player.
+        :return: Player or None if the player is not in the lineup (e.g. coach).
+        """
+        return self.players_by_id.get(id_)
+
+    def get_player_by_number(self, number: int) -> Optional[Player]:
+        """
+        Returns Player from the lineup according to his jersey number.
+        :param number: Jersey number of the player.
+        :return: Player or None if no player of the lineup wears the number.
+        """
+        return self.players_by_number.get(number)
+
+    def __reduce__(self):
+        """Read-only indices can not be pickled (nor deep copied), Team is rebuilt from its lineup instead."""
+        return Team.create, (self.id, self.name, self.country, self.type, self.lineup)
 
     def __str__(self):
         return f"--Team-- Id: {self.id}, Name: {self.name}, type: {self.type.name}"
 
 
+@add_slots
 @dataclass(frozen=True)
 class Time:
     """Data class to store information about time."""
@@ -205,12 +406,17 @@ class Time:
         :param other: second previous Time
         :return: Number of minutes (flag -1 for non-defined values - between halves time can not be counted).
         """
-        if self.base > 45 and other.base <= 45:
+        if not self.is_first_half() and other.is_first_half():
             return -1
         else:
-            return (self.base + self.added) - (other.base-other.added)
+            return (self.base + self.added) - (other.base + other.added)
+
+    def is_first_half(self) -> bool:
+        """Returns whether the time belongs to the first half (added time of the first half included)."""
+        return self.base <= 45
 
 
+@add_slots
 @dataclass(frozen=True)
 class IncidentParent:
     """Data class to store information about incident."""
@@ -218,6 +424,7 @@ class IncidentParent:
     participant: Player
     team: Team
     time: Time
+    id: int = field(compare=False)   # id of the incident in the source data (None if unknown)
 
     def __lt__(self, other):
         """Sorting incidents according to their Time."""
@@ -232,6 +439,7 @@ class Incident:
     """Data class to store information about each type of incident.
     Each type of incident has it's own subclass (named same as the incident type).
     """
+    @add_slots
     @dataclass(frozen=True)
     class Goal(IncidentParent):
         """Data class to store information about goal incident."""
@@ -242,7 +450,7 @@ class Incident:
         @staticmethod
         def create(
                 participant: Player, team: Team, time: Time, current_score: Score,
-                assistance: Player, goal_type: Types.Goal):
+                assistance: Player, goal_type: Types.Goal, id_: int = None):
             """
             Creates immutable instance of incident - Incident.Goal.
             :param participant: Player who took part in the incident.
@@ -251,11 +459,13 @@ class Incident:
             :param current_score: Current score after the goal.
             :param assistance: Player who assisted the to the goal .
             :param goal_type: Type of the goal.
+            :param id_: Id of the incident in the source data.
             :return: Incident.Goal
             """
-            return Incident.Goal(type=Types.Incident.GOAL, participant=participant, team=team, time=time,
+            return Incident.Goal(type=Types.Incident.GOAL, participant=participant, team=team, time=time, id=id_,
                                  current_score=current_score, assistance=assistance, goal_type=goal_type)
 
+    @add_slots
     @dataclass(frozen=True)
     class Penalty(IncidentParent):
         """Data class to store information about penalty incident."""
@@ -263,7 +473,7 @@ class Incident:
         current_score: Score
 
         @staticmethod
-        def create(participant: Player, team: Team, time: Time, current_score: Score, scored: bool):
+        def create(participant: Player, team: Team, time: Time, current_score: Score, scored: bool, id_: int = None):
             """
             Creates immutable instance of incident - Incident.Penalty.
             :param participant: Player who took part in the incident.
@@ -271,48 +481,211 @@ class Incident:
             :param time: Time when the incident happened.
             :param current_score: Current score after the goal.
             :param scored: Boolean value if the penalty was scored or not.
+            :param id_: Id of the incident in the source data.
             :return: Incident.Penalty
             """
             return Incident.Penalty(type=Types.Incident.PENALTY_KICK, participant=participant, team=team, time=time,
-                                    scored=scored, current_score=current_score)
+                                    id=id_, scored=scored, current_score=current_score)
 
+    @add_slots
     @dataclass(frozen=True)
     class Card(IncidentParent):
         """Data class to store information about card incident."""
         card_type: Types.Card
 
         @staticmethod
-        def create(participant: Player, team: Team, time: Time, card_type: Types.Card):
+        def create(participant: Player, team: Team, time: Time, card_type: Types.Card, id_: int = None):
             """
             Creates immutable instance of incident - Incident.Card.
             :param participant: Player who took part in the incident.
             :param team: Team who took part in the incident (whose player took part in).
             :param time: Time when the incident happened.
             :param card_type: Type of the card.
+            :param id_: Id of the incident in the source data.
             :return: Incident.Card
             """
-            return Incident.Card(type=Types.Incident.CARD, participant=participant, team=team, time=time,
+            return Incident.Card(type=Types.Incident.CARD, participant=participant, team=team, time=time, id=id_,
                                  card_type=card_type)
 
+    @add_slots
     @dataclass(frozen=True)
     class Substitution(IncidentParent):
         """Data class to store information about substitution incident."""
         participant_in: Player
 
         @staticmethod
-        def create(participant: Player, team: Team, time: Time, participant_in: Player):
+        def create(participant: Player, team: Team, time: Time, participant_in: Player, id_: int = None):
             """
             Create immutable instance of incident - Incident.Substitution.
             :param participant: Player who went out of the pitch (got subbed out).
             :param team: Team who took part in the incident (whose player took part in).
             :param time: Time when the incident happened.
             :param participant_in: Player who went out on the pitch (got subbed in).
+            :param id_: Id of the incident in the source data.
             :return: Incident.Substitution
             """
             return Incident.Substitution(type=Types.Incident.SUBSTITUTION, participant=participant,
-                                         team=team, time=time, participant_in=participant_in)
+                                         team=team, time=time, id=id_, participant_in=participant_in)
 
 
+@add_slots
+@dataclass(frozen=True)
+class ScoreEvent:
+    """Data class to store one goal of the score timeline (scored penalties and own goals included)."""
+    incident_index: int = field(compare=False)   # index of the incident in Match.incidents
+    time: Time
+    team_type: Types.Team          # team whose score increased (opponent of the player for own goals)
+    score: Score                   # running score after the goal
+    leader: Optional[Types.Team]   # leading team after the goal, None for the draw
+    change: Types.ScoreChange
+    lead_change: bool              # lead switched from one team to the other (through the draw)
+
+    @staticmethod
+    def create(incident_index: int, time: Time, team_type: Types.Team, score: Score, leader: Optional[Types.Team],
+               change: Types.ScoreChange, lead_change: bool):
+        """
+        Creates immutable instance of ScoreEvent.
+        :param incident_index: Index of the goal in the incidents of the match.
+        :param time: Time when the goal was scored.
+        :param team_type: Team whose score increased.
+        :param score: Score after the goal.
+        :param leader: Leading team after the goal (None for the draw).
+        :param change: What the goal did with the score.
+        :param lead_change: Whether the scoring team took the lead after the other team was leading before.
+        :return: ScoreEvent
+        """
+        return ScoreEvent(incident_index=incident_index, time=time, team_type=team_type, score=score, leader=leader,
+                          change=change, lead_change=lead_change)
+
+    def __str__(self):
+        return f"-> {self.change.name} --- time: {self.time}, score: {self.score}, team: {self.team_type.name}"
+
+
+@add_slots
+@dataclass(frozen=True)
+class ScoreTimeline:
+    """Data class to store progression of the score of the match, computed once in one pass over the incidents."""
+    events: List[ScoreEvent]                      # every goal in order of the incidents
+    events_by_incident: Mapping[int, ScoreEvent]  # index of the incident -> its ScoreEvent
+    half_time_score: Score
+    second_half_score: Score                      # goals scored in the second half only
+    lead_changes: int
+    comeback_team: Optional[Types.Team]           # winning team which was losing during the match
+    longest_gap: int                              # most minutes between two goals in the same half (-1 if unknown)
+
+    @staticmethod
+    def create(incidents: List[IncidentParent]):
+        """
+        Creates immutable instance of ScoreTimeline from sorted incidents of the match.
+        :param incidents: Sorted list of incidents of the match.
+        :return: ScoreTimeline
+        """
+        events: List[ScoreEvent] = []
+        score = Score.create(0, 0)
+        half_time_score = score
+        last_leader: Optional[Types.Team] = None   # last team which was leading (not reset by the draw)
+        trailing_teams = set()
+        longest_gap = -1
+
+        for (index, inc) in enumerate(incidents):
+            if not (type(inc) is Incident.Goal or (type(inc) is Incident.Penalty and inc.scored)):
+                continue
+
+            previous_score = score
+            (team_type, score) = ScoreTimeline.__get_goal(inc, previous_score)
+            leader = ScoreTimeline.__get_leader(score)
+            change = ScoreTimeline.__get_change(team_type, ScoreTimeline.__get_leader(previous_score), leader)
+            lead_change = leader is not None and last_leader is not None and leader != last_leader
+
+            if leader is not None:
+                trailing_teams.add(Types.Team.AWAY if leader == Types.Team.HOME else Types.Team.HOME)
+                last_leader = leader
+            if inc.time.is_first_half():
+                half_time_score = score
+            if len(events) != 0:
+                longest_gap = max(longest_gap, inc.time.get_minutes_difference(events[-1].time))
+
+            events.append(ScoreEvent.create(incident_index=index, time=inc.time, team_type=team_type, score=score,
+                                            leader=leader, change=change, lead_change=lead_change))
+
+        final_leader = ScoreTimeline.__get_leader(score)
+        second_half_score = Score.create(score.goals_home - half_time_score.goals_home,
+                                         score.goals_away - half_time_score.goals_away)
+        return ScoreTimeline.create_from_events(events=events, half_time_score=half_time_score,
+                                                second_half_score=second_half_score,
+                                                lead_changes=sum(1 for e in events if e.lead_change),
+                                                comeback_team=final_leader if final_leader in trailing_teams else None,
+                                                longest_gap=longest_gap)
+
+    @staticmethod
+    def create_from_events(events: List[ScoreEvent], half_time_score: Score, second_half_score: Score,
+                           lead_changes: int, comeback_team: Optional[Types.Team], longest_gap: int):
+        """
+        Creates immutable instance of ScoreTimeline from already computed values (index of the events is created).
+        :return: ScoreTimeline
+        """
+        return ScoreTimeline(events=events, events_by_incident=MappingProxyType({e.incident_index: e for e in events}),
+                             half_time_score=half_time_score, second_half_score=second_half_score,
+                             lead_changes=lead_changes, comeback_team=comeback_team, longest_gap=longest_gap)
+
+    def __reduce__(self):
+        """Read-only index can not be pickled (nor deep copied), it is created again from the events instead."""
+        return ScoreTimeline.create_from_events, (self.events, self.half_time_score, self.second_half_score,
+                                                  self.lead_changes, self.comeback_team, self.longest_gap)
+
+    @staticmethod
+    def __get_goal(inc: IncidentParent, previous_score: Score) -> (Types.Team, Score):
+        """
+        Returns scoring team (team of the own goal is already its opponent) and running score after the goal.
+        Score of the incident is used only when it is consistent with the previous score (e.g. scored penalty
+        has no score in the source data), otherwise the goal is added to the previous score.
+        :param inc: Goal or scored penalty.
+        :param previous_score: Running score before the goal.
+        :return: tuple of Types.Team and Score
+        """
+        score = inc.current_score
+        if score.goals_home == previous_score.goals_home + 1 and score.goals_away == previous_score.goals_away:
+            return Types.Team.HOME, score
+        elif score.goals_away == previous_score.goals_away + 1 and score.goals_home == previous_score.goals_home:
+            return Types.Team.AWAY, score
+        elif inc.team.type == Types.Team.HOME:
+            return Types.Team.HOME, Score.create(previous_score.goals_home + 1, previous_score.goals_away)
+        else:
+            return Types.Team.AWAY, Score.create(previous_score.goals_home, previous_score.goals_away + 1)
+
+    @staticmethod
+    def __get_leader(score: Score) -> Optional[Types.Team]:
+        """Returns leading team according to the score (None for the draw)."""
+        if score.result == Types.Result.WIN:
+            return Types.Team.HOME
+        elif score.result == Types.Result.LOSS:
+            return Types.Team.AWAY
+        else:
+            return None
+
+    @staticmethod
+    def __get_change(team_type: Types.Team, previous_leader: Optional[Types.Team],
+                     leader: Optional[Types.Team]) -> Types.ScoreChange:
+        """Returns what the goal of the team did with the score."""
+        if leader is None:
+            return Types.ScoreChange.EQUALIZER
+        elif leader != team_type:
+            return Types.ScoreChange.REDUCE_DEFICIT
+        elif previous_leader == team_type:
+            return Types.ScoreChange.EXTEND_LEAD
+        else:
+            return Types.ScoreChange.GO_AHEAD
+
+    def get_event(self, incident_index: int) -> Optional[ScoreEvent]:
+        """
+        Returns ScoreEvent of the incident.
+        :param incident_index: Index of the incident in Match.incidents.
+        :return: ScoreEvent or None if the incident is not a goal
+        """
+        return self.events_by_incident.get(incident_index)
+
+
+@add_slots
 @dataclass(frozen=True)
 class Match:
     """Data class to store information about the whole match.
@@ -323,19 +696,44 @@ class Match:
     score: Score
     venue: Venue
     incidents: List[Incident]
+    time_start: Optional[str]   # start of the match in ISO format (None if unknown)
+    score_timeline: ScoreTimeline = field(repr=False, compare=False)   # derived from incidents
+    incidents_by_id: Mapping[int, Incident] = field(repr=False, compare=False)   # index of incidents with id
 
     @staticmethod
-    def create(team_home: Team, team_away: Team, score: Score, venue: Venue, incidents: List[Incident]):
+    def create(team_home: Team, team_away: Team, score: Score, venue: Venue, incidents: List[Incident],
+               incidents_by_id: Dict[int, Incident] = None, time_start: str = None):
         """
         Creates immutable instance of Match.
         :param team_home: Home team.
         :param team_away: Away team.
         :param score: Final score of the match.
         :param venue: Venue where the match was held.
-        :param incidents: List of incidents that occurred during the match.
+        :param incidents: Sorted list of incidents that occurred during the match.
+        :param incidents_by_id: Index of the incidents by their id, if it is already known (e.g. updated index
+        of the previous state of the match), it is built from the incidents otherwise.
+        :param time_start: Start of the match in ISO format (e.g. 2018-11-11T15:00:00+00:00).
         :return: Match
         """
-        return Match(team_home=team_home, team_away=team_away, score=score, venue=venue, incidents=incidents)
+        if incidents_by_id is None:
+            incidents_by_id = {inc.id: inc for inc in incidents if inc.id is not None}
+        return Match(team_home=team_home, team_away=team_away, score=score, venue=venue, incidents=incidents,
+                     time_start=time_start, score_timeline=ScoreTimeline.create(incidents),
+                     incidents_by_id=MappingProxyType(incidents_by_id))
+
+    def get_incident(self, id_: int) -> Optional[Incident]:
+        """
+        Returns incident according to its id from the source data.
+        :param id_: Id of the incident.
+        :return: Incident or None if the match has no incident with the id.
+        """
+        return self.incidents_by_id.get(id_)
+
+    def __reduce__(self):
+        """Score timeline and index of the incidents (read-only) are not pickled (nor deep copied),
+        they are computed again instead."""
+        return Match.create, (self.team_home, self.team_away, self.score, self.venue, self.incidents, None,
+                              self.time_start)
 
     def __str__(self):
         return f"MATCH DATA SUMMARY \n\t{self.team_home}\n\t{self.team_away}\n\t{self.score}\n\t{self.venue}\n" \
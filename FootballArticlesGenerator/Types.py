@@ -36,12 +36,23 @@ class Goal(Enum):
     OWN_GOAL = 3
 
 
+class ScoreChange(Enum):
+    GO_AHEAD = 0         # scoring team took the lead (from the draw)
+    EQUALIZER = 1
+    EXTEND_LEAD = 2      # scoring team was already leading
+    REDUCE_DEFICIT = 3   # scoring team is still losing
+
+
 class Message(Enum):
     GOAL = 0
     PENALTY_KICK_MISSED = 1
     CARD = 2
     SUBSTITUTION = 3
     RESULT = 4
+    SEASON_GOAL = 5
+    SUSPENSION = 6
+    MULTIPLE_SUBSTITUTION = 7   # compound message (MessageAggregator)
+    MULTIPLE_GOAL = 8           # compound message (MessageAggregator)
 
 
 class MessageSubtype(Enum):
@@ -97,3 +108,9 @@ class ExplicitEntityData(Enum):
     CURRENT_SCORE = 6
     TEAM_HOME = 7
     TEAM_AWAY = 8
+    GOAL_COUNT = 9
+    YELLOW_CARD_COUNT = 10
+    TEAM = 11
+    TIMES = 12
+    SUBSTITUTIONS = 13
+    SUBSTITUTION_COUNT = 14
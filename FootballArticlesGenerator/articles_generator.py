@@ -1,37 +1,148 @@
 """Generating the article and handles each module.
-Input is the name of the json file (string) and output is the article (stdout).
+Input is the name of the json file (string) or stream of matches and output is the article (stdout).
 """
 
 # Python's libraries
-from typing import List
+from typing import List, Iterable, Union
 import random
 
 # Other parts of the code
 import Data
 import data_initializer as di
+import match_cache as mc
+import season_statistics as ss
+import match_fingerprint as mf
 import document_planner as dp
+import plan_cache as pc
 import printer as p
 import sentence_planner as sp
 import linguistic_realiser as lr
 
 
-def generate_articles(file_name: str, short_output: bool, text_count: int, key: str):
+def generate_articles(file_name: Union[str, Iterable[Data.Match]], short_output: bool, text_count: int, key: str,
+                      cache: mc.MatchCache = None, statistics: ss.SeasonStatistics = None,
+                      fingerprints: mf.FingerprintStore = None, budget: dp.PlanBudget = None,
+                      plan_cache: pc.PlanCache = None, lazy_lineups: bool = False):
     """
     Core function for generating articles.
-    :param file_name: Name of the file.
+    :param file_name: Name of the file or iterable of matches or MatchFileResult (e.g.
+    DataInitializer.init_matches_data_stream or query SeasonStore.find_matches), which is consumed lazily
+    - one match at a time, match with an error is reported and skipped.
     :param detailed_output: Bool value whether detailed output should be printed.
     :param text_count: Number of texts we would like to generate.
+    :param cache: Cache of already initialized matches used for the file (None means no caching).
+    :param statistics: Season statistics updated by every match and mentioned in the articles (None means
+    no season statistics).
+    :param fingerprints: Fingerprints of already generated matches, unchanged matches are skipped (None means
+    that every match is generated).
+    :param budget: Limits of the length of the articles (None means that every incident is mentioned).
+    :param plan_cache: Cache of already created document plans (None means that every match is planned).
+    :param lazy_lineups: Whether players of the lineups of the file are created only when they are needed
+    (matches of the iterable are already initialized).
     """
 
+    if not isinstance(file_name, str):
+        try:
+            for match_data in file_name:
+                if isinstance(match_data, di.MatchFileResult):
+                    if match_data.error is not None:   # bad match is reported and skipped, the stream goes on
+                        error = match_data.error
+                        message = error.message if isinstance(error, di.FileFormatEx) else repr(error)
+                        print(f'{match_data.file_name}: {message}')
+                        continue
+                    match_data = match_data.match_data
+                generate_match_articles(match_data=match_data, short_output=short_output,
+                                        text_count=text_count, key=key, statistics=statistics,
+                                        fingerprints=fingerprints, budget=budget, plan_cache=plan_cache)
+        except di.FileFormatEx as fe:   # the stream itself is broken (e.g. array of matches is not closed)
+            print(fe.message)
+            exit(1)
+        return
+
     # transforming json file into inner representation of data as Data.Match class
     try:
-        match_data: Data.Match = di.DataInitializer.init_match_data(file_name)
+        match_data: Data.Match = di.DataInitializer.init_match_data(file_name, cache=cache, lazy_lineups=lazy_lineups)
     except di.FileFormatEx as fe:
         print(fe.message)
         exit(0)
 
+    generate_match_articles(match_data=match_data, short_output=short_output, text_count=text_count, key=key,
+                            statistics=statistics, fingerprints=fingerprints, budget=budget, plan_cache=plan_cache)
+
+
+def generate_articles_bulk(match_files: str, short_output: bool, text_count: int, key: str, workers: int = None,
+                           cache: mc.MatchCache = None, statistics: ss.SeasonStatistics = None,
+                           fingerprints: mf.FingerprintStore = None, budget: dp.PlanBudget = None,
+                           plan_cache: pc.PlanCache = None):
+    """
+    Generates articles for every match file from directory (or glob pattern).
+    Files are parsed in parallel processes, file that can not be parsed is reported and skipped.
+    :param match_files: Directory with json files or glob pattern.
+    :param short_output: Bool value whether only result articles should be printed.
+    :param text_count: Number of texts we would like to generate for each match.
+    :param key: Authorization key for Genja API.
+    :param workers: Number of worker processes parsing the files (default is number of processors).
+    :param cache: Cache of already initialized matches (None means no caching).
+    :param statistics: Season statistics updated by every match (in order the files are parsed)
+    and mentioned in the articles (None means no season statistics).
+    :param fingerprints: Fingerprints of already generated matches, unchanged matches are skipped (None means
+    that every match is generated).
+    :param budget: Limits of the length of the articles (None means that every incident is mentioned).
+    :param plan_cache: Cache of already created document plans (None means that every match is planned).
+    """
+
+    for result in di.DataInitializer.init_matches_data(match_files, workers=workers, cache=cache):
+        if result.error is not None:
+            message = result.error.message if isinstance(result.error, di.FileFormatEx) else repr(result.error)
+            print(f'{result.file_name}: {message}')
+            continue
+
+        print(f'MATCH FILE: {result.file_name}')
+        generate_match_articles(match_data=result.match_data, short_output=short_output,
+                                text_count=text_count, key=key, statistics=statistics, fingerprints=fingerprints,
+                                budget=budget, plan_cache=plan_cache)
+
+
+def generate_match_articles(match_data: Data.Match, short_output: bool, text_count: int, key: str,
+                            statistics: ss.SeasonStatistics = None, fingerprints: mf.FingerprintStore = None,
+                            budget: dp.PlanBudget = None, plan_cache: pc.PlanCache = None):
+    """
+    Generates articles for already initialized match data.
+    :param match_data: Data.Match
+    :param short_output: Bool value whether only result articles should be printed.
+    :param text_count: Number of texts we would like to generate.
+    :param key: Authorization key for Genja API.
+    :param statistics: Season statistics, the match is added into them (None means no season statistics).
+    :param fingerprints: Fingerprints of already generated matches - match unchanged since its last generation
+    is skipped, fingerprint of generated match is stored (None means that the match is always generated).
+    :param budget: Limits of the length of the articles, only the most important incidents are mentioned
+    (None means every incident).
+    :param plan_cache: Cache of already created document plans, plan of unchanged match is not created again
+    (None means that the match is always planned).
+    """
+
+    # fingerprint of the match is computed only once (for season statistics, skipping of unchanged matches
+    # and for plan cache)
+    fingerprint: str = None
+    if statistics is not None or fingerprints is not None or plan_cache is not None:
+        fingerprint = mf.MatchFingerprint.get_fingerprint(match_data)
+
+    # adding the match into season statistics (matches are added in order they are generated) even if it is skipped
+    # afterwards, so that the statistics of the restarted run contain every match (resent match is counted once)
+    match_statistics: ss.MatchStatistics = statistics.add_match(match_data, fingerprint) \
+        if statistics is not None else None
+
+    # skipping match which has not changed since the last time (e.g. resent by live feed)
+    if fingerprints is not None and fingerprints.is_unchanged(match_data, fingerprint):
+        return
+
     # transforming data into document plan (list of messages)
-    doc_plan: dp.DocumentPlan = dp.DocumentPlanner.plan_document(match_data)
+    if plan_cache is not None:
+        doc_plan: dp.DocumentPlan = plan_cache.get_plan(match_data, match_statistics, budget, aggregate=True,
+                                                        fingerprint=fingerprint)
+    else:
+        doc_plan: dp.DocumentPlan = dp.DocumentPlanner.plan_document(match_data, match_statistics, budget,
+                                                                     aggregate=True)
 
     # printing overview of the match
     if not short_output:
@@ -61,3 +172,7 @@ def generate_articles(file_name: str, short_output: bool, text_count: int, key:
             print(e.message)
             exit(0)
 
+    # match is stored only after every article was generated
+    if fingerprints is not None:
+        fingerprints.put(match_data, fingerprint)
+
@@ -0,0 +1,83 @@
+"""Benchmark of season-wide statistics - walking lists of Data.Incident of every match (the original way)
+compared to vectorized queries over columns of incident_store.IncidentStore.
+Columns of the example match are checked against its score timeline first.
+Run from FootballArticlesGenerator directory: python benchmarks/incident_store_benchmark.py
+"""
+
+# Python's libraries
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Other parts of the code
+import Types
+import Data
+import data_initializer as di
+import incident_store as ist
+import synthetic_data as sd
+
+EXAMPLE_MATCH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'MatchData',
+                             'example_match.json')
+
+
+def check_example_match():
+    """Checks the score after every incident of the example match (e.g. scored penalty in the 10th minute is 1:0)."""
+    match_data = di.DataInitializer.init_match_data(EXAMPLE_MATCH)
+    store = ist.IncidentStore.create([match_data])
+
+    expected = ['1:0', '1:1', '1:1', '2:1', '2:1', '2:1', '2:1', '3:1', '3:1', '3:1', '3:1', '3:1', '3:1']
+    actual = [f'{home}:{away}' for (home, away) in zip(store.columns['score_home'].tolist(),
+                                                        store.columns['score_away'].tolist())]
+    assert actual == expected, f'score columns {actual}, expected {expected}'
+    assert actual[-1] == str(match_data.score), 'score after the last incident is not the final score'
+
+
+def count_goals_per_player(matches: List[Data.Match]) -> Dict[int, int]:
+    """Counts goals of every player by walking incidents of every match."""
+    goals: Dict[int, int] = {}
+    for match_data in matches:
+        for inc in match_data.incidents:
+            if (type(inc) is Data.Incident.Goal and inc.goal_type != Types.Goal.OWN_GOAL) \
+                    or (type(inc) is Data.Incident.Penalty and inc.scored):
+                goals[inc.participant.id] = goals.get(inc.participant.id, 0) + 1
+    return goals
+
+
+def measure(function, repeat: int) -> float:
+    """Returns the best time of the function (in milliseconds) out of repeat runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-t", "--teams", default=16, type=int, help="Number of teams in the season.")
+    parser.add_argument("-i", "--incidents", default=60, type=int, help="Number of incidents in every match.")
+    parser.add_argument("-r", "--repeat", default=5, type=int, help="Number of repetitions of every measurement.")
+    args = parser.parse_args()
+
+    check_example_match()
+
+    matches = [di.DataInitializer.init_match_data_from_dict(m)
+               for m in sd.create_season(team_count=args.teams, incidents_per_match=args.incidents)]
+    store = ist.IncidentStore.create(matches)
+    assert count_goals_per_player(matches) == store.get_goals_per_player()
+
+    print(f'Season of {len(matches)} matches, {store.get_size()} incidents (goals per player, '
+          f'best of {args.repeat} runs)')
+    for (name, function) in (('walking incidents (original)', lambda: count_goals_per_player(matches)),
+                             ('incident store', store.get_goals_per_player)):
+        print(f'{name:<35}{measure(function, args.repeat):>10.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark of reading and decoding match json files - text stream with Python's json (the original way)
+compared to memory-mapped file with every installed decoder of json_backend.JsonBackend.
+Run from FootballArticlesGenerator directory: python benchmarks/json_backend_benchmark.py
+"""
+
+# Python's libraries
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Other parts of the code
+import data_initializer as di
+import json_backend as jb
+import synthetic_data as sd
+
+
+def measure(function, repeat: int) -> float:
+    """Returns the best time of the function (in milliseconds) out of repeat runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def read_text_stream(file_name: str):
+    """Original way of reading - text stream decoded by Python's json."""
+    with open(file_name, encoding='utf-8') as json_file:
+        return json.load(json_file)
+
+
+def read_mapped(file_name: str):
+    """Memory-mapped file decoded by the current decoder of JsonBackend."""
+    with jb.JsonBackend.map_file(file_name) as content:
+        return jb.JsonBackend.loads(content)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", "--incidents", default=10000, type=int, help="Number of incidents of the match.")
+    parser.add_argument("-r", "--repeat", default=20, type=int, help="Number of repetitions of every measurement.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, 'synthetic_match.json')
+        with open(file_name, 'w', encoding='utf-8') as json_file:
+            json.dump(sd.create_match(0, 1, args.incidents), json_file, ensure_ascii=False, indent=1)
+
+        print(f'Match with {args.incidents} incidents, file size {os.path.getsize(file_name) / 1024:.0f} kB, '
+              f'best of {args.repeat} runs')
+        print(f'{"decoding only - text stream + json":<45}{measure(lambda: read_text_stream(file_name), args.repeat):>10.2f} ms')
+
+        for backend in jb.JsonBackend.get_available():
+            jb.JsonBackend.use(backend)
+            print(f'{"decoding only - mmap + " + backend:<45}{measure(lambda: read_mapped(file_name), args.repeat):>10.2f} ms')
+
+        for backend in jb.JsonBackend.get_available():
+            jb.JsonBackend.use(backend)
+            print(f'{"init_match_data - mmap + " + backend:<45}'
+                  f'{measure(lambda: di.DataInitializer.init_match_data(file_name), args.repeat):>10.2f} ms')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Benchmark of rendering constituents into Geneea markup for many variants of the same article -
+markup built from morphological attributes for every constituent (the original way) compared to interned
+MorphParams with the markup rendered once, and the whole lexicalization of the variants for comparison.
+Run from FootballArticlesGenerator directory: python benchmarks/morph_params_benchmark.py
+"""
+
+# Python's libraries
+import argparse
+import os
+import random
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# Other parts of the code
+import Types
+import data_initializer as di
+import document_planner as dp
+import sentence_planner as sp
+
+
+def parse_morph_params(string_id: str) -> tuple:
+    """Original parsing of the morph string (done for every constituent)."""
+    if string_id == '':
+        return None, None, None, None, None
+    [case_id, tense_id, gender_id, ref_id, agr_id] = string_id.split('-')
+    return (None if case_id == '.' else Types.Morph.Case(int(case_id)),
+            None if tense_id == '.' else Types.Morph.Tense(int(tense_id)),
+            None if gender_id == '.' else Types.Morph.Gender(int(gender_id)),
+            None if ref_id == '.' else ref_id,
+            None if agr_id == '.' else agr_id)
+
+
+def render_original(params: tuple, constituent: str) -> str:
+    """Original rendering - header and parameter list built again for every constituent."""
+    (case, tense, gender, ref, agr) = params
+    mp: List[str] = []
+    if case is not None:
+        mp.append(f'Case={case.name.lower().capitalize()}')
+    if tense is not None:
+        mp.append(f'Tense={tense.name.lower().capitalize()}')
+    if gender == Types.Morph.Gender.MascA:
+        mp += ['Gender=Masc', 'Animacy=Anim']
+    elif gender == Types.Morph.Gender.MascI:
+        mp += ['Gender=Masc', 'Animacy=Inan']
+    elif gender is not None:
+        mp.append(f'Gender={gender.name.lower().capitalize()}')
+    if all(p is None for p in params):
+        return constituent
+
+    mp = ["'" + '|'.join(mp) + "'"]
+    if ref is not None:
+        mp.append(f'ref={ref}')
+    if agr is not None:
+        mp.append(f'agr={agr}')
+    return '{{' + f"'{constituent}'|morph(" + ', '.join(mp) + ')}}'
+
+
+def get_morph_strings() -> List[str]:
+    """Returns morph strings of every constituent of the sentence catalog (with repetitions)."""
+    strings = []
+    for bucket in sp.SENTENCE_CATALOG.buckets.values():
+        for sentence in bucket:
+            for c in sentence.constituents:
+                if isinstance(c, sp.Constituent):
+                    m = c.morph_params
+                    parts = [str(m.case.value) if m.case is not None else '.',
+                             str(m.tense.value) if m.tense is not None else '.',
+                             str(m.gender.value) if m.gender is not None else '.',
+                             m.ref or '.', m.agr or '.']
+                    strings.append('' if parts == ['.'] * 5 else '-'.join(parts))
+    return strings
+
+
+def measure(function) -> float:
+    """Returns time of the function in milliseconds."""
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-v", "--variants", default=1000, type=int, help="Number of variants of the article.")
+    parser.add_argument("-m", "--match_data", default=os.path.join('..', 'MatchData', 'example_match.json'),
+                        type=str, help="JSON file with match data.")
+    args = parser.parse_args()
+
+    strings = get_morph_strings()
+    constituents = [f'constituent{i}' for i in range(len(strings))]
+    for (s, c) in zip(strings, constituents):
+        assert render_original(parse_morph_params(s), c) == sp.MorphParams.create(s).apply_to_string(c), s
+
+    print(f'{args.variants} variants, {len(strings)} constituents ({len(set(strings))} distinct morph strings) '
+          f'per variant')
+
+    def original():
+        for _ in range(args.variants):
+            for (s, c) in zip(strings, constituents):
+                render_original(parse_morph_params(s), c)
+
+    def interned():
+        for _ in range(args.variants):
+            for (s, c) in zip(strings, constituents):
+                sp.MorphParams.create(s).apply_to_string(c)
+
+    def cached():
+        morph_params = [sp.MorphParams.create(s) for s in strings]
+        for _ in range(args.variants):
+            for (m, c) in zip(morph_params, constituents):
+                m.apply_to_string(c)
+
+    print(f'{"parse + render (original)":<45}{measure(original):>10.2f} ms')
+    print(f'{"interned MorphParams + cached markup":<45}{measure(interned):>10.2f} ms')
+    print(f'{"cached markup only (constituents)":<45}{measure(cached):>10.2f} ms')
+
+    match_data = di.DataInitializer.init_match_data(args.match_data)
+    doc_plan = dp.DocumentPlanner.plan_document(match_data, aggregate=True)
+    random.seed(10)
+    lexicalization = measure(lambda: [sp.SentencePlanner.lexicalize_article(doc_plan, match_data)
+                                      for _ in range(args.variants)])
+    print(f'{"lexicalization of the article":<45}{lexicalization:>10.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark of memory usage and construction time of data classes (Data and document_planner.Message)
+with and without slots. Builds every match of a synthetic season and plans document for each of them.
+Run from FootballArticlesGenerator directory: python benchmarks/slots_benchmark.py
+"""
+
+# Python's libraries
+import argparse
+import gc
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Other parts of the code
+import Data
+import data_initializer as di
+import document_planner as dp
+import synthetic_data as sd
+
+
+def build_season(season: list) -> (list, list):
+    """Builds matches and their document plans from season in the JSON format."""
+    matches = [di.DataInitializer.init_match_data_from_dict(m) for m in season]
+    plans = [dp.DocumentPlanner.plan_document(m) for m in matches]
+    return matches, plans
+
+
+def measure_season(team_count: int, incidents_per_match: int, repeat: int) -> (float, float, int):
+    """
+    Builds whole season of matches and their document plans.
+    :return: tuple of the best construction time (in seconds), memory of built objects (in MB)
+    and number of incidents
+    """
+    season = sd.create_season(team_count=team_count, incidents_per_match=incidents_per_match)
+
+    # time is measured without tracing memory (tracing slows down allocations)
+    duration = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        build_season(season)
+        duration = min(duration, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    (matches, plans) = build_season(season)
+    memory = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+    tracemalloc.stop()
+
+    return duration, memory, sum(len(m.incidents) for m in matches)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-t", "--teams", default=16, type=int, help="Number of teams in the season.")
+    parser.add_argument("-i", "--incidents", default=60, type=int, help="Number of incidents in every match.")
+    parser.add_argument("-r", "--repeat", default=5, type=int, help="Number of repetitions of time measurement.")
+    parser.add_argument("--single", action='store_true', help="Measures only current setting (used internally).")
+    args = parser.parse_args()
+
+    if args.single:
+        (duration, memory, incidents) = measure_season(args.teams, args.incidents, args.repeat)
+        print(f'{"slots" if Data.USE_SLOTS else "no slots":<10}{duration:>10.3f} s{memory:>10.1f} MB'
+              f'{incidents:>12} incidents')
+        return
+
+    # every variant runs in its own process, slots are decided when the classes are created
+    matches = args.teams * (args.teams - 1)
+    print(f'Season of {matches} matches, {args.incidents} incidents per match (construction + document planning, '
+          f'best of {args.repeat} runs)')
+    for no_slots in (True, False):
+        env = dict(os.environ)
+        env.pop('FOOTBALL_ARTICLES_NO_SLOTS', None)
+        if no_slots:
+            env['FOOTBALL_ARTICLES_NO_SLOTS'] = '1'
+        subprocess.run([sys.executable, os.path.abspath(__file__), '--single', '-t', str(args.teams),
+                        '-i', str(args.incidents), '-r', str(args.repeat)], env=env, check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Generator of synthetic match data in the same JSON format as MatchData/example_match.json (Livesport format).
+Used by benchmarks to create matches of arbitrary size and whole seasons of matches."""
+
+# Python's libraries
+import random
+from typing import List
+
+COUNTRY = {'id': 62, 'name': 'Czech Republic'}
+FIRST_NAMES = ['Jan', 'Martin', 'Michal', 'Tomáš', 'David', 'Jakub', 'Vojtěch', 'Milan', 'Lukáš', 'Petr']
+LAST_NAMES = ['Novák', 'Svoboda', 'Dvořák', 'Černý', 'Procházka', 'Kučera', 'Veselý', 'Horák', 'Němec', 'Marek',
+              'Pokorný', 'Král', 'Jelínek', 'Růžička', 'Beneš', 'Fiala', 'Sedláček', 'Doležal', 'Zeman', 'Kolář']
+PLAYERS_IN_LINEUP = 18   # 11 in starting lineup and 7 substitutes
+STARTING_LINEUP = 11
+
+
+def get_team_id(team_index: int) -> int:
+    """Returns id of the team given its index."""
+    return 800 + team_index
+
+
+def get_player_id(team_index: int, player_index: int) -> int:
+    """Returns id of the player given index of his team and his index in the lineup (players do not change teams)."""
+    return 100000 + team_index * 100 + player_index
+
+
+def create_lineup(team_index: int) -> List[dict]:
+    """
+    Creates lineup of the team (18 players and a coach), lineup is the same in every match of the team.
+    :param team_index: Index of the team.
+    :return: List of lineup records.
+    """
+    lineup = []
+    for i in range(PLAYERS_IN_LINEUP + 1):
+        name = LAST_NAMES[(team_index + i) % len(LAST_NAMES)] + ' ' + FIRST_NAMES[(team_index * 3 + i) % len(FIRST_NAMES)]
+        position = 1 if i < STARTING_LINEUP else 2
+        if i == PLAYERS_IN_LINEUP:
+            position = 52   # coach
+        lineup.append({'participant': {'fullName': name, 'id': get_player_id(team_index, i), 'countries': [COUNTRY]},
+                       'lineupPositionId': position, 'number': i + 1})
+    return lineup
+
+
+def create_match(home_index: int, away_index: int, incident_count: int, seed: int = 0) -> dict:
+    """
+    Creates match in the JSON format (as Python's dictionary) with approximately given number of incidents.
+    :param home_index: Index of home team.
+    :param away_index: Index of away team.
+    :param incident_count: Number of incidents (including child incidents - assistance, substitution in, etc.).
+    :param seed: Seed of the random generator.
+    :return: dict
+    """
+    rng = random.Random(seed)
+    teams = {0: home_index, 1: away_index}
+    goals = [0, 0]
+    incidents = []
+    next_id = 300000000
+
+    def add_incident(type_name: str, team: int, player_index: int, time: int, added: int, parent_id=None,
+                     value: str = None) -> int:
+        nonlocal next_id
+        next_id += 1
+        player_id = get_player_id(teams[team], player_index)
+        incidents.append({
+            'addedTime': added, 'id': next_id, 'parentId': parent_id, 'stageId': 12, 'time': time, 'timeSec': None,
+            'value': value, 'participant': {'fullName': None, 'id': player_id}, 'type': {'name': type_name},
+            'sortKey': len(incidents) + 1,
+            'eventParticipant': {'participant': [{'id': get_team_id(teams[team]), 'name': f'Team {teams[team]}'}]}})
+        return next_id
+
+    while len(incidents) < incident_count:
+        team = rng.randint(0, 1)
+        player = rng.randrange(STARTING_LINEUP)
+        minute = rng.randint(1, 90)
+        added = rng.randint(1, 4) if minute in (45, 90) and rng.random() < 0.5 else None
+        kind = rng.random()
+
+        if kind < 0.25:   # goal with assistance
+            goals[team] += 1
+            value = f'{goals[0]}:{goals[1]}'
+            parent = add_incident('Goal', team, player, minute, added, value=value)
+            add_incident('Assistance', team, (player + 1) % STARTING_LINEUP, minute, added, parent, value)
+        elif kind < 0.35:   # solo play goal
+            goals[team] += 1
+            add_incident('Goal', team, player, minute, added, value=f'{goals[0]}:{goals[1]}')
+        elif kind < 0.60:   # substitution
+            parent = add_incident('Substitution - Out', team, player, minute, added)
+            add_incident('Substitution - In', team, STARTING_LINEUP + rng.randrange(7), minute, added, parent)
+        elif kind < 0.85:   # yellow card
+            add_incident('Yellow Card', team, player, minute, added)
+        elif kind < 0.95:   # penalty kick (scored or missed)
+            parent = add_incident('Penalty Kick', team, player, minute, added)
+            if rng.random() < 0.75:
+                goals[team] += 1
+                add_incident('Penalty scored', team, player, minute, added, parent, f'{goals[0]}:{goals[1]}')
+            else:
+                add_incident('Penalty missed', team, player, minute, added, parent)
+        else:   # red card
+            add_incident('Red Card', team, player, minute, added)
+
+    return {
+        'url': f'https://www.livesport.cz/zapas/synthetic{seed}',
+        'time_start': '2018-11-11T15:00:00+00:00',
+        'participants': {
+            str(side): {'id': get_team_id(index), 'name': f'Team {index}', 'country_id': COUNTRY['id'],
+                        'country_name': COUNTRY['name'], 'type': 'home' if side == 0 else 'away',
+                        'participant_type': 'team'} for (side, index) in teams.items()},
+        'tournament_name': '1. Liga 2018/2019',
+        'tournament_template_country_name': 'Czech Republic',
+        'tournament_template_type_name': 'Soccer',
+        'venue_attendance': 4000, 'venue_capacity': 6000, 'venue_name': 'Synthetic Stadium', 'venue_town': 'Prague',
+        'score': {'0': {'1': goals[0]}, '1': {'1': goals[1]}},
+        'winner': {'0': 'win' if goals[0] > goals[1] else 'lost', '1': 'win' if goals[1] > goals[0] else 'lost'},
+        'stage': {'id': 3, 'name': 'Finished'},
+        'lineup': {str(side): create_lineup(index) for (side, index) in teams.items()},
+        'incidents': incidents
+    }
+
+
+def create_season(team_count: int = 16, incidents_per_match: int = 40, seed: int = 0) -> List[dict]:
+    """
+    Creates whole season of matches - every team plays every other team home and away.
+    :param team_count: Number of teams in the league.
+    :param incidents_per_match: Number of incidents in every match.
+    :param seed: Seed of the random generator.
+    :return: List of matches in the JSON format.
+    """
+    season = []
+    for home in range(team_count):
+        for away in range(team_count):
+            if home != away:
+                season.append(create_match(home, away, incidents_per_match, seed=seed + len(season)))
+    return season
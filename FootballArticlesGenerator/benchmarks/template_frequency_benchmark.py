@@ -0,0 +1,116 @@
+"""Benchmark of choosing templates by TemplateHandler with catalog scaled to thousands of templates -
+list frequency table scanned for every constituent (the original way) compared to frequency table keyed by id
+with constant time sampling of unused indices.
+Run from FootballArticlesGenerator directory: python benchmarks/template_frequency_benchmark.py
+"""
+
+# Python's libraries
+import argparse
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# Other parts of the code
+import sentence_planner as sp
+
+
+class ListTemplateHandler:
+    """Original bookkeeping of TemplateHandler - list of records scanned for every constituent,
+    used index removed from sorted list of unused indices and the other indices listed when every template was used.
+    """
+
+    frequency_table: List[list]   # records [id, unused indices, last used]
+    catalog: sp.TemplateCatalog
+
+    def __init__(self, catalog: sp.TemplateCatalog):
+        self.catalog = catalog
+        self.frequency_table = [[id_, list(range(count)), -1] for (id_, count) in catalog.counts.items()]
+
+    def get_template(self, id_: str) -> sp.Template:
+        possibilities = self.catalog.get_templates(id_, None)
+        freq = next(f for f in self.frequency_table if f[0] == id_)
+
+        if len(freq[1]) != 0:
+            chosen_index = random.choice(freq[1])
+        elif len(possibilities) == 1:
+            chosen_index = 0
+        else:
+            chosen_index = random.choice([i for i in range(len(possibilities)) if i != freq[2]])
+
+        freq[2] = chosen_index
+        if chosen_index in freq[1]:
+            freq[1].remove(chosen_index)
+        return possibilities[chosen_index]
+
+
+def create_catalog(id_count: int, templates_per_id: int) -> sp.TemplateCatalog:
+    """Creates catalog of words with the given number of ids, every id has the given number of templates."""
+    templates = {}
+    for i in range(id_count):
+        id_templates = tuple(sp.Template.create('w', f'word{i}', f'word{i}_{j}') for j in range(templates_per_id))
+        templates[id_templates[0].id] = id_templates
+    return sp.TemplateCatalog(templates, {}, {id_: len(t) for (id_, t) in templates.items()})
+
+
+def choose_templates(handler, ids: List[str]) -> List[sp.Template]:
+    """Chooses template for every id (handler is TemplateHandler or ListTemplateHandler)."""
+    if isinstance(handler, sp.TemplateHandler):
+        msg = SimpleNamespace(time=None)
+        return [handler.get_template(id_, None, msg) for id_ in ids]
+    return [handler.get_template(id_) for id_ in ids]
+
+
+def check_selection(ids: List[str], chosen: List[sp.Template], catalog: sp.TemplateCatalog):
+    """Checks rules of the selection - every template of the id is used once before any template is repeated
+    and the same template is never chosen twice in a row once every template was used."""
+    used = {}
+    for (id_, template) in zip(ids, chosen):
+        id_used = used.setdefault(id_, [])
+        count = catalog.counts[id_]
+        if len(id_used) < count:
+            assert template not in id_used, f'{template} repeated before every template of {id_} was used'
+        elif count > 1:
+            assert template != id_used[-1], f'{template} chosen twice in a row'
+        id_used.append(template)
+
+
+def measure(function, repeat: int) -> float:
+    """Returns the best time of the function (in milliseconds) out of repeat runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--ids", default=5000, type=int, help="Number of template ids in the catalog.")
+    parser.add_argument("-t", "--templates", default=4, type=int, help="Number of templates of every id.")
+    parser.add_argument("-c", "--choices", default=50000, type=int, help="Number of chosen templates.")
+    parser.add_argument("-r", "--repeat", default=5, type=int, help="Number of repetitions of every measurement.")
+    args = parser.parse_args()
+
+    catalog = create_catalog(args.ids, args.templates)
+    random.seed(10)
+    ids = [random.choice(list(catalog.counts)) for _ in range(args.choices)]
+
+    for handler_class in (ListTemplateHandler, sp.TemplateHandler):
+        check_selection(ids, choose_templates(handler_class(catalog), ids), catalog)
+
+    print(f'Catalog of {args.ids * args.templates} templates ({args.ids} ids), {args.choices} choices, '
+          f'best of {args.repeat} runs')
+    for (name, handler_class) in (('list frequency table (original)', ListTemplateHandler),
+                                  ('dict frequency table', sp.TemplateHandler)):
+        duration = measure(lambda: choose_templates(handler_class(catalog), ids), args.repeat)
+        print(f'{name:<35}{duration:>10.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
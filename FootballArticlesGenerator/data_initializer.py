@@ -2,83 +2,507 @@
 
 # Python's libraries
 import json
-from typing import List
-from dataclasses import dataclass
+import os
+import bisect
+import re
+import sys
+import glob
+from typing import List, Dict, FrozenSet, Iterator, Iterable, Mapping, TextIO
+from dataclasses import dataclass, replace
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Other parts of the code
 import Types
 import Data
+import match_cache as mc
+import json_backend as jb
+import data_registry as dr
+
+
+@dataclass(frozen=True)
+class MatchFileResult:
+    """Data class to store result of initializing one file in bulk mode (or one match of the stream)
+    - either match data or an error."""
+    file_name: str
+    match_data: Data.Match   # None if the file could not be initialized
+    error: Exception   # None if the file was initialized successfully
+
+    @staticmethod
+    def create(file_name: str, match_data: Data.Match = None, error: Exception = None):
+        """
+        Creates immutable instance of MatchFileResult.
+        :param file_name: Name of the json file.
+        :param match_data: Match initialized from the file.
+        :param error: Exception raised while initializing the file.
+        :return: MatchFileResult
+        """
+        return MatchFileResult(file_name=file_name, match_data=match_data, error=error)
+
+
+@dataclass(frozen=True)
+class MatchUpdate:
+    """Data class to store result of the live update of the match - new state of the match and ids of the incidents
+    that were added, corrected or removed by the update."""
+    match_data: Data.Match
+    changed_ids: FrozenSet[int]
+
+    @staticmethod
+    def create(match_data: Data.Match, changed_ids: FrozenSet[int]):
+        """
+        Creates immutable instance of MatchUpdate.
+        :param match_data: Updated match.
+        :param changed_ids: Ids of the added, corrected and removed incidents.
+        :return: MatchUpdate
+        """
+        return MatchUpdate(match_data=match_data, changed_ids=changed_ids)
 
 
 class DataInitializer:
     """Class handling conversion from JSON to Data.Match class."""
+    # countries, players and teams are shared across every initialized match (weak references only)
+    registry: dr.DataRegistry = dr.DataRegistry()
+
     @staticmethod
-    def init_match_data(json_file_str: str) -> Data.Match:
+    def get_match_files(match_files: str) -> List[str]:
+        """
+        Returns sorted list of json files given directory or glob pattern.
+        :param match_files: directory with json files or glob pattern (e.g. ../MatchData/*.json)
+        :return: List[str]
+        """
+        if os.path.isdir(match_files):
+            match_files = os.path.join(match_files, '*.json')
+        return sorted(f for f in glob.glob(match_files) if os.path.isfile(f))
+
+    @staticmethod
+    def init_matches_data(match_files: str, workers: int = None,
+                          cache: mc.MatchCache = None) -> Iterator[MatchFileResult]:
+        """
+        Transforms every json file from directory (or glob pattern) into Data.Match in parallel processes.
+        Results are yielded as they complete, file that can not be initialized does not stop the others.
+        :param match_files: directory with json files or glob pattern
+        :param workers: number of worker processes (default is number of processors)
+        :param cache: cache of already initialized matches (None means no caching)
+        :return: Iterator[MatchFileResult]
+        """
+        file_names = DataInitializer.get_match_files(match_files)
+        if not file_names:
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(DataInitializer.init_match_data, f, cache): f for f in file_names}
+            for future in as_completed(futures):
+                file_name = futures[future]
+                try:
+                    yield MatchFileResult.create(file_name=file_name, match_data=future.result())
+                except Exception as e:   # every error is reported per file, bad file must not abort the run
+                    yield MatchFileResult.create(file_name=file_name, error=e)
+
+    @staticmethod
+    def init_match_data(json_file_str: str, cache: mc.MatchCache = None, lazy_lineups: bool = False) -> Data.Match:
         """
         Transforms json file with non-linguistic data into inner data entities form.
         :param json_file_str: json file name
+        :param cache: cache of already initialized matches - used when the content of the file is unchanged
+        (None means no caching)
+        :param lazy_lineups: whether players of the lineups are created only when they are needed (Data.LazyLineup),
+        cached match contains every player anyway
+        :return: Data.Match
+        """
+        # file is memory-mapped and decoded straight from bytes (no text stream)
+        with jb.JsonBackend.map_file(json_file_str) as content:
+            key: str = None
+            if cache is not None:
+                key = mc.MatchCache.get_key(content)
+                match_data: Data.Match = cache.get(key)
+                if match_data is not None:
+                    return match_data
+
+            try:
+                json_match_data: dict = jb.JsonBackend.loads(content)
+            except json.decoder.JSONDecodeError:
+                raise FileFormatEx
+            except ValueError:
+                raise FileFormatEx
+
+        match_data: Data.Match = DataInitializer.init_match_data_from_dict(json_match_data, lazy_lineups=lazy_lineups)
+        if cache is not None:
+            cache.put(key, match_data)
+        return match_data
+
+    @staticmethod
+    def init_matches_data_stream(json_lines_file_str: str, lazy_lineups: bool = False) -> Iterator[MatchFileResult]:
+        """
+        Transforms JSON Lines file (one match per line) into inner data entities form match by match.
+        Only one line (one match) is held in memory at a time, line that can not be initialized does not stop
+        the others (its result holds the error).
+        :param json_lines_file_str: JSON Lines file name ('-' stands for standard input)
+        :param lazy_lineups: whether players of the lineups are created only when they are needed (Data.LazyLineup)
+        :return: Iterator[MatchFileResult]
+        """
+        if json_lines_file_str == '-':
+            yield from DataInitializer.__init_matches_data_from_lines(sys.stdin, file_name=json_lines_file_str,
+                                                                      lazy_lineups=lazy_lineups)
+        else:
+            with open(json_lines_file_str, encoding='utf-8-sig') as json_lines_file:
+                yield from DataInitializer.__init_matches_data_from_lines(json_lines_file,
+                                                                          file_name=json_lines_file_str,
+                                                                          lazy_lineups=lazy_lineups)
+
+    @staticmethod
+    def __init_matches_data_from_lines(lines: Iterable[str], file_name: str,
+                                       lazy_lineups: bool) -> Iterator[MatchFileResult]:
+        """
+        Transforms lines with json data of one match each into Data.Match.
+        :param lines: text stream (or any iterable of lines)
+        :param file_name: Name of the stream (reported with the errors).
+        :param lazy_lineups: whether players of the lineups are created only when they are needed
+        :return: Iterator[MatchFileResult]
+        """
+        for line_number, line in enumerate(lines, start=1):
+            if line.strip() == '':   # empty lines (e.g. at the end of the file) are skipped
+                continue
+
+            try:
+                json_match_data: dict = jb.JsonBackend.loads(line)
+                match_data: Data.Match = DataInitializer.init_match_data_from_dict(json_match_data,
+                                                                                   lazy_lineups=lazy_lineups)
+            except (json.decoder.JSONDecodeError, FileFormatEx):
+                error = FileFormatEx(f"ERROR: Format of the line {line_number} or its content is not valid.")
+                yield MatchFileResult.create(file_name=file_name, error=error)
+                continue
+            yield MatchFileResult.create(file_name=file_name, match_data=match_data)
+
+    @staticmethod
+    def init_matches_data_array(json_file_str: str, lazy_lineups: bool = False) -> Iterator[MatchFileResult]:
+        """
+        Transforms json file with one (possibly huge) top-level array of matches into inner data entities form
+        match by match. The file is read incrementally, only the currently parsed match is held in memory.
+        Match that can not be initialized does not stop the others (its result holds the error), broken array
+        itself (e.g. not closed) raises FileFormatEx.
+        :param json_file_str: json file name ('-' stands for standard input)
+        :param lazy_lineups: whether players of the lineups are created only when they are needed (Data.LazyLineup)
+        :return: Iterator[MatchFileResult]
+        """
+        if json_file_str == '-':
+            yield from DataInitializer.__init_matches_data_from_array(sys.stdin, file_name=json_file_str,
+                                                                      lazy_lineups=lazy_lineups)
+        else:
+            with open(json_file_str, encoding='utf-8-sig') as json_file:
+                yield from DataInitializer.__init_matches_data_from_array(json_file, file_name=json_file_str,
+                                                                          lazy_lineups=lazy_lineups)
+
+    @staticmethod
+    def __init_matches_data_from_array(text_stream: TextIO, file_name: str,
+                                       lazy_lineups: bool) -> Iterator[MatchFileResult]:
+        """
+        Transforms text stream with top-level json array of matches into Data.Match.
+        :param text_stream: text stream
+        :param file_name: Name of the stream (reported with the errors).
+        :param lazy_lineups: whether players of the lineups are created only when they are needed
+        :return: Iterator[MatchFileResult]
+        """
+        for match_number, item in enumerate(DataInitializer.__iter_json_array_items(text_stream), start=1):
+            try:
+                json_match_data: dict = jb.JsonBackend.loads(item)
+                match_data: Data.Match = DataInitializer.init_match_data_from_dict(json_match_data,
+                                                                                   lazy_lineups=lazy_lineups)
+            except (json.decoder.JSONDecodeError, FileFormatEx):
+                error = FileFormatEx(f"ERROR: Format of the match {match_number} or its content is not valid.")
+                yield MatchFileResult.create(file_name=file_name, error=error)
+                continue
+            yield MatchFileResult.create(file_name=file_name, match_data=match_data)
+
+    @staticmethod
+    def __iter_json_array_items(text_stream: TextIO, chunk_size: int = 1 << 16) -> Iterator[str]:
+        """
+        Walks top-level json array and returns json text of every item of the array (item has to be an object).
+        Stream is read by chunks, only the current item is kept in memory (item spanning many chunks
+        is joined only once, when its end is found).
+        :param text_stream: text stream
+        :param chunk_size: number of characters read at once
+        :return: Iterator[str]
+        """
+        structure_chars = re.compile(r'["{}\[\]]')   # characters changing depth outside of string
+        string_chars = re.compile(r'["\\]')          # characters ending string (or escaping inside of string)
+
+        buffer = text_stream.read(chunk_size)
+        pos = 0
+        array_started = False
+        expected = '['   # characters allowed after whitespaces: '[' at the start, then '{]' or ',]' after an item
+        while True:
+            # skipping whitespaces between the items
+            while pos == len(buffer) or buffer[pos] in ' \t\r\n':
+                if pos == len(buffer):
+                    buffer, pos = text_stream.read(chunk_size), 0
+                    if buffer == '':
+                        raise FileFormatEx("ERROR: Format of the file is not valid - array of matches is not closed.")
+                else:
+                    pos += 1
+
+            char = buffer[pos]
+            if not array_started:
+                if char != '[':
+                    raise FileFormatEx("ERROR: Format of the file is not valid - array of matches expected.")
+                array_started = True
+                expected = '{]'
+                pos += 1
+                continue
+
+            if char == ']' and expected != '{':   # trailing comma is not valid json
+                return
+            if char == ',' and expected == ',]':
+                expected = '{'
+                pos += 1
+                continue
+            if char != '{':
+                raise FileFormatEx("ERROR: Format of the file is not valid - match has to be an object.")
+            if expected == ',]':
+                raise FileFormatEx("ERROR: Format of the file is not valid - matches have to be separated by comma.")
+
+            # finding the end of the item - counting depth of nested objects/arrays and skipping strings
+            parts: List[str] = []   # previous chunks of the item (joined once at the end of the item)
+            start = pos
+            depth = 0
+            in_string = False
+            while True:
+                found = (string_chars if in_string else structure_chars).search(buffer, pos)
+                if found is None:
+                    # item continues in the next chunk (escaped character may be split as well)
+                    parts.append(buffer[start:])
+                    chunk = text_stream.read(chunk_size)
+                    if chunk == '':
+                        raise FileFormatEx("ERROR: Format of the file is not valid - unexpected end of the file.")
+                    pos = max(pos - len(buffer), 0)
+                    buffer, start = chunk, 0
+                    continue
+
+                char = found.group()
+                pos = found.end()
+                if in_string:
+                    if char == '\\':
+                        pos += 1   # skipping escaped character
+                    else:
+                        in_string = False
+                elif char == '"':
+                    in_string = True
+                elif char == '{' or char == '[':
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        break
+
+            parts.append(buffer[start:pos])
+            yield ''.join(parts)
+            expected = ',]'
+
+    @staticmethod
+    def init_match_data_from_dict(json_match_data: dict, lazy_lineups: bool = False) -> Data.Match:
+        """
+        Transforms already loaded json data with non-linguistic data into inner data entities form.
+        :param json_match_data: json file with data as Python's dictionary
+        :param lazy_lineups: whether players of the lineups are created only when they are needed (Data.LazyLineup),
+        records of the players are still checked here
         :return: Data.Match
         """
         try:
             initializer = DataInitializer()
 
-            with open(json_file_str, encoding='utf-8') as json_file:
-                json_match_data: dict = json.load(json_file)
-
-            teams: (Data.Team, Data.Team) = initializer.__init_teams(json_match_data=json_match_data)
+            teams: (Data.Team, Data.Team) = initializer.__init_teams(json_match_data=json_match_data,
+                                                                     lazy_lineups=lazy_lineups)
             venue: Data.Venue = initializer.__init_venue(json_match_data=json_match_data)
             score: Data.Score = initializer.__init_score(json_match_data=json_match_data)
             incidents: List[Data.Incident] = initializer.__init_incidents(json_match_data=json_match_data,
                                                                           team_home=teams[0], team_away=teams[1])
-            json_file.close()
-            return Data.Match(team_home=teams[0], team_away=teams[1], venue=venue, score=score, incidents=incidents)
-        except KeyError:
+            return Data.Match.create(team_home=teams[0], team_away=teams[1], venue=venue, score=score,
+                                     incidents=incidents, time_start=json_match_data.get('time_start'))
+        except (KeyError, IndexError):
             raise FileFormatEx
-        except json.decoder.JSONDecodeError:
+        except ValueError:
+            raise FileFormatEx
+
+    @staticmethod
+    def update_match_data(match_data: Data.Match, json_incidents: List[dict], json_score: dict = None) -> Data.Match:
+        """
+        Applies batch of new or corrected incidents (e.g. from live feed) to already initialized match,
+        same as update_match_data_delta.
+        :param match_data: Data.Match to update.
+        :param json_incidents: new or corrected incidents in the same format as incidents in json file
+        :param json_score: score in the same format as score in json file (score is not changed if None)
+        :return: Data.Match
+        """
+        return DataInitializer.update_match_data_delta(match_data, json_incidents, json_score).match_data
+
+    @staticmethod
+    def update_match_data_delta(match_data: Data.Match, json_incidents: List[dict],
+                                json_score: dict = None) -> MatchUpdate:
+        """
+        Applies batch of new or corrected incidents (e.g. from live feed) to already initialized match.
+        Teams, venue and unchanged incidents are reused, changed incidents are found by the index of the match
+        (Match.incidents_by_id) and inserted into already sorted incidents (no sorting of all incidents).
+        Incident with the same id as an existing one replaces it, incident corrected to type which is not
+        represented (e.g. Goal Disallowed) is removed.
+        Corrected incident has to come with its child incidents (same as in json file). Child incident whose parent
+        is not in the batch (e.g. assistance sent after the goal) updates the already existing parent incident.
+        :param match_data: Data.Match to update.
+        :param json_incidents: new or corrected incidents in the same format as incidents in json file
+        :param json_score: score in the same format as score in json file (score is not changed if None)
+        :return: MatchUpdate - updated match with ids of the changed incidents (e.g. for LiveDocumentPlanner)
+        """
+        try:
+            child_incidents: Dict[int, List[dict]] = \
+                DataInitializer.__init_child_incidents_index({'incidents': json_incidents})
+            batch_ids = {int(i['id']) for i in json_incidents}
+            existing: Mapping[int, Data.Incident] = match_data.incidents_by_id
+
+            # initializing changed incidents by their id (None stands for removed incident)
+            changed: Dict[int, Data.Incident] = {}
+            for i in json_incidents:
+                if i['parentId'] is None:
+                    changed[int(i['id'])] = DataInitializer.__init_incident(
+                        i=i, children=child_incidents.get(int(i['id']), []),
+                        team_home=match_data.team_home, team_away=match_data.team_away)
+                elif int(i['parentId']) not in batch_ids:
+                    parent_id = int(i['parentId'])
+                    parent: Data.Incident = changed[parent_id] if parent_id in changed else existing.get(parent_id)
+                    if parent is None:
+                        raise FileFormatEx("ERROR: Parent of the incident does not exist.")
+                    changed[parent_id] = DataInitializer.__update_incident(incident=parent, child=i)
+
+            # sorted insert of changed incidents, every other incident stays on its place
+            incidents: List[Data.Incident] = list(match_data.incidents)
+            incidents_by_id: Dict[int, Data.Incident] = dict(existing)   # index is updated by the changes only
+            for (id_, incident) in changed.items():
+                old: Data.Incident = existing.get(id_)
+                if incident is not None:
+                    incidents_by_id[id_] = incident
+                else:
+                    incidents_by_id.pop(id_, None)
+                if old is not None:
+                    index = bisect.bisect_left(incidents, old)   # first incident with the same time
+                    while incidents[index] is not old:
+                        index += 1
+                    if incident is not None and incident.time == old.time:
+                        incidents[index] = incident
+                        continue
+                    del incidents[index]
+                if incident is not None:
+                    bisect.insort_right(incidents, incident)
+
+            score: Data.Score = match_data.score if json_score is None \
+                else DataInitializer.__init_score(json_match_data={'score': json_score})
+            updated: Data.Match = Data.Match.create(team_home=match_data.team_home, team_away=match_data.team_away,
+                                                    score=score, venue=match_data.venue, incidents=incidents,
+                                                    incidents_by_id=incidents_by_id, time_start=match_data.time_start)
+            return MatchUpdate.create(match_data=updated, changed_ids=frozenset(changed))
+        except KeyError:
             raise FileFormatEx
         except ValueError:
             raise FileFormatEx
 
     @staticmethod
-    def __init_teams(json_match_data: dict) -> (Data.Team, Data.Team):
+    def __update_incident(incident: Data.Incident, child: dict) -> Data.Incident:
+        """
+        Updates already initialized incident by its child incident.
+        :param incident: Parent incident.
+        :param child: child incident from json file as Python's dictionary
+        :return: Data.Incident
+        """
+
+        inc_str_type: str = child['type']['name']
+        if inc_str_type == "Assistance" and type(incident) is Data.Incident.Goal:
+            assistance = incident.team.get_player(int(child['participant']['id']))
+            return replace(incident, assistance=assistance, goal_type=Types.Goal.ASSISTANCE)
+        elif (inc_str_type == "Penalty scored" or inc_str_type == "Penalty missed") \
+                and type(incident) is Data.Incident.Penalty:
+            return replace(incident, scored=inc_str_type == "Penalty scored")
+        elif inc_str_type == "Substitution - In" and type(incident) is Data.Incident.Substitution:
+            participant_in = incident.team.get_player(int(child['participant']['id']))
+            return replace(incident, participant_in=participant_in)
+        elif inc_str_type == "Red Card" and type(incident) is Data.Incident.Card:   # second yellow card
+            return replace(incident, card_type=Types.Card.RED_AUTO)
+        else:
+            return incident
+
+    @staticmethod
+    def __init_teams(json_match_data: dict, lazy_lineups: bool = False) -> (Data.Team, Data.Team):
         """
         Initializes tuple of Teams - home team [0] and away team [1].
         :param json_match_data: json file with data as Python's dictionary
+        :param lazy_lineups: whether players of the lineups are created only when they are needed
         :return: (Data.Team, Data.Team)
         """
 
-        return (DataInitializer.__init_team(json_match_data=json_match_data, team_type=Types.Team.HOME),
-                DataInitializer.__init_team(json_match_data=json_match_data, team_type=Types.Team.AWAY))
+        return (DataInitializer.__init_team(json_match_data=json_match_data, team_type=Types.Team.HOME,
+                                            lazy_lineups=lazy_lineups),
+                DataInitializer.__init_team(json_match_data=json_match_data, team_type=Types.Team.AWAY,
+                                            lazy_lineups=lazy_lineups))
 
     @staticmethod
-    def __init_team(json_match_data: dict, team_type: Types.Team) -> Data.Team:
+    def __init_team(json_match_data: dict, team_type: Types.Team, lazy_lineups: bool = False) -> Data.Team:
         """
         Initializes Team.
         :param json_match_data: json file with data as Python's dictionary
         :param team_type: says if the team to initialize is home or away
+        :param lazy_lineups: whether players of the lineups are created only when they are needed
         :return: Data.Team
         """
 
         id_ = int(json_match_data['participants'][str(team_type.value)]['id'])
         name = json_match_data['participants'][str(team_type.value)]['name']
         country: Data.Country = DataInitializer.__init_country(json_match_data, team_type)
+        records: List[dict] = json_match_data['lineup'][str(team_type.value)]
+
+        if lazy_lineups:
+            # players are created on the first lookup, team with its own records is not shared with other matches
+            # records are checked now (without creating players), so that invalid file is rejected here
+            # and not in the middle of the article
+            for p in records:
+                DataInitializer.__check_player_record(p)
+            lineup = Data.LazyLineup(records=records, create_player=DataInitializer.__init_player,
+                                     get_id=lambda p: int(p['participant']['id']),
+                                     get_number=lambda p: int(p['number']))
+            return Data.Team.create(id_=id_, name=name, country=country, type_=team_type, lineup=lineup)
 
         # initializing every player of the team lineup
-        lineup: List[Data.Player] = []
-        for p in json_match_data['lineup'][str(team_type.value)]:
-            # extracting every attribute of player
-            p_full_name = p['participant']['fullName']
-            p_id = int(p['participant']['id'])
-            p_country_id = int(p['participant']['countries'][0]['id'])
-            p_country_name = p['participant']['countries'][0]['name']
-            p_country: Data.Country = Data.Country.create(id_=p_country_id, name_=p_country_name)
-            p_lineup_position_id = int(p['lineupPositionId'])
-            p_number = int(p['number'])
-
-            lineup.append(Data.Player.create(id_=p_id, full_name=p_full_name, country=p_country,
-                                             lineup_position_id=p_lineup_position_id, number=p_number))
-
-        return Data.Team.create(id_=id_, name=name, country=country, type_=team_type, lineup=lineup)
+        lineup: List[Data.Player] = [DataInitializer.__init_player(p) for p in records]
+
+        return DataInitializer.registry.get_team(id_=id_, name=name, country=country, type_=team_type, lineup=lineup)
+
+    @staticmethod
+    def __check_player_record(p: dict):
+        """
+        Checks every attribute of the record of the lineup needed by __init_player without creating Player
+        (raises KeyError, IndexError or ValueError if the record is invalid).
+        :param p: record of the lineup from json file as Python's dictionary
+        """
+        int(p['participant']['id'])
+        int(p['number'])
+        int(p['lineupPositionId'])
+        int(p['participant']['countries'][0]['id'])
+        if not isinstance(p['participant']['fullName'], str) \
+                or not isinstance(p['participant']['countries'][0]['name'], str):
+            raise ValueError("Name of the player and of his country has to be a string.")
+
+    @staticmethod
+    def __init_player(p: dict) -> Data.Player:
+        """
+        Initializes Player from the record of the lineup.
+        :param p: record of the lineup from json file as Python's dictionary
+        :return: Data.Player
+        """
+
+        # extracting every attribute of player
+        p_full_name = p['participant']['fullName']
+        p_id = int(p['participant']['id'])
+        p_country_id = int(p['participant']['countries'][0]['id'])
+        p_country_name = p['participant']['countries'][0]['name']
+        p_country: Data.Country = DataInitializer.registry.get_country(id_=p_country_id, name_=p_country_name)
+        p_lineup_position_id = int(p['lineupPositionId'])
+        p_number = int(p['number'])
+
+        return DataInitializer.registry.get_player(id_=p_id, full_name=p_full_name, country=p_country,
+                                                   lineup_position_id=p_lineup_position_id, number=p_number)
 
     @staticmethod
     def __init_country(json_match_data: dict, team_type: Types.Team) -> Data.Country:
@@ -90,7 +514,7 @@ class DataInitializer:
         """
         country_id = int(json_match_data['participants'][str(team_type.value)]['country_id'])
         country_name = json_match_data['participants'][str(team_type.value)]['country_name']
-        return Data.Country.create(id_=country_id, name_=country_name)
+        return DataInitializer.registry.get_country(id_=country_id, name_=country_name)
 
     @staticmethod
     def __init_score(json_match_data: dict) -> Data.Score:
@@ -120,6 +544,22 @@ class DataInitializer:
 
         return Data.Venue.create(name=name, town=town, capacity=capacity, attendance=attendance)
 
+    @staticmethod
+    def __init_child_incidents_index(json_match_data: dict) -> Dict[int, List[dict]]:
+        """
+        Initializes index of child incidents - maps id of the parent incident to its child incidents.
+        Order of the child incidents is the same as in the json file.
+        :param json_match_data: json file with data as Python's dictionary
+        :return: Dict[int, List[dict]]
+        """
+
+        child_incidents: Dict[int, List[dict]] = {}
+        for i in json_match_data['incidents']:
+            if i['parentId'] is not None:
+                child_incidents.setdefault(int(i['parentId']), []).append(i)
+
+        return child_incidents
+
     @staticmethod
     def __init_incidents(json_match_data: dict, team_home: Data.Team, team_away: Data.Team) -> List[Data.Incident]:
         """
@@ -130,29 +570,50 @@ class DataInitializer:
         :return: List[Data.Incident]
         """
 
-        def __get_aux_incident(id_: int) -> (bool, int):   # tuple to make similar structure like Out parameter in C#
+        # indexing child incidents by their parent id in one pass (instead of searching all incidents every time)
+        child_incidents: Dict[int, List[dict]] = DataInitializer.__init_child_incidents_index(json_match_data)
+
+        # initializing list of Incident
+        incidents: List[Data.Incident] = []
+        for i in json_match_data['incidents']:
+            incident: Data.Incident = DataInitializer.__init_incident(i=i, children=child_incidents.get(int(i['id']), []),
+                                                                      team_home=team_home, team_away=team_away)
+            if incident is not None:
+                incidents.append(incident)
+
+        incidents.sort()
+        return incidents
+
+    @staticmethod
+    def __init_incident(i: dict, children: List[dict], team_home: Data.Team, team_away: Data.Team) -> Data.Incident:
+        """
+        Initializes one incident.
+        :param i: incident from json file as Python's dictionary
+        :param children: child incidents of the incident (e.g. assistance of the goal) in the order of json file
+        :param team_home: Team which played home.
+        :param team_away: Team which played away
+        :return: Data.Incident or None if the incident is represented by its parent (or is not needed at all)
+        """
+
+        def __get_aux_incident() -> (bool, dict):   # tuple to make similar structure like Out parameter in C#
             """
-            Searches for parent incidents.
-            :param id_: Id of the current incident
-            :return: tuple of bool and int - Bool indicates if parent incident exists, number is the id of the parent.
+            Searches for child incident of the current incident (in already indexed child incidents).
+            :return: tuple of bool and dict - Bool indicates if child incident exists, dict is the child incident.
             """
 
-            for j in json_match_data['incidents']:
-                if id_ == j['parentId']:
-                    return True, j
+            if children:
+                return True, children[0]
             return False, None   # int is set to None, because the value is never needed
 
         def __get_participant_from_id(team_: Data.Team, id_: int) -> Data.Player:
             """
-            Returns Player from Team's lineup according his id.
+            Returns Player from Team's lineup according his id (using Team's index of players).
             :param team_: Team where the player should be.
             :param id_: Id of the player to be found.
             :return: Data.Player
             """
 
-            for player in team_.lineup:
-                if player.id == id_:   # else branch not required since json file is well-build
-                    return player
+            return team_.get_player(id_)   # None only for non-players (e.g. coach), json file is well-build
 
         def __get_current_score() -> Data.Score:
             """
@@ -166,97 +627,95 @@ class DataInitializer:
             else:
                 return Data.Score.create(0, 0)
 
-        # initializing list of Incident
-        incidents: List[Data.Incident] = []
-        for i in json_match_data['incidents']:
-            # initializing every attribute of an Incident
-
-            # time
-            time: Data.Time = Data.Time.create(time_base=int(i['time']),
-                                               time_added=int(i['addedTime']) if i['addedTime'] is not None else 0)
-
-            # team
-            team: Data.Team = None
-            if i['eventParticipant']['participant']:
-                team = team_home if int(i['eventParticipant']['participant'][0]['id']) == team_home.id else team_away
-
-            inc_str_type: str = i['type']['name']
-
-            # participant
-            participant: Data = None
-            if i['participant']['id'] is not None:
-                participant: Data.Player = __get_participant_from_id(team_=team, id_=int(i['participant']['id']))
-                if inc_str_type == 'Own Goal':   # if the incident is own goal, teams are switched
-                    team: Data.Team = team_away if team == team_home else team_home   # performing switch
-                if inc_str_type == 'Yellow Card' or inc_str_type == 'Red Card':
-                    if participant is None:   # card for coach
-                        participant = Data.Player.create(id_=int(i['participant']['id']),
-                                                         full_name=i['participant']['fullName'],
-                                                         country=None, number=None, lineup_position_id=None)
-
-            # initializing the whole Incident according to inc_string_type
-            if inc_str_type == "Goal":
-                aux_incident = __get_aux_incident(int(i['id']))
-
-                if aux_incident[0]:   # goal with assistance
-                    assistance = __get_participant_from_id(team_=team, id_=int(aux_incident[1]['participant']['id']))
-                    incidents.append(Data.Incident.Goal.create(participant=participant, team=team, time=time,
-                                                               current_score=__get_current_score(),
-                                                               assistance=assistance,
-                                                               goal_type=Types.Goal.ASSISTANCE))
-                else:   # solo play goal
-                    incidents.append(Data.Incident.Goal.create(participant=participant, team=team, time=time,
-                                                               current_score=__get_current_score(),
-                                                               assistance=None,
-                                                               goal_type=Types.Goal.SOLO_PLAY))
-            elif inc_str_type == "Own Goal":
-                incidents.append(Data.Incident.Goal.create(participant=participant, team=team, time=time,
-                                                           current_score=__get_current_score(),
-                                                           assistance=None,
-                                                           goal_type=Types.Goal.OWN_GOAL))
-            elif inc_str_type == "Penalty Kick":
-                # scored penalty is represented by parent Incident
-                aux_incident = __get_aux_incident(int(i['id']))
-                scored = True if aux_incident[0] and aux_incident[1]['type']['name'] == "Penalty scored" else False
-
-                incidents.append(Data.Incident.Penalty.create(participant=participant, team=team, time=time,
-                                                              current_score=__get_current_score(), scored=scored))
-            elif inc_str_type == "Substitution - Out":
-                aux_incident = __get_aux_incident(int(i['id']))
+        # initializing every attribute of an Incident
+
+        # time
+        time: Data.Time = Data.Time.create(time_base=int(i['time']),
+                                           time_added=int(i['addedTime']) if i['addedTime'] is not None else 0)
+
+        # team
+        team: Data.Team = None
+        if i['eventParticipant']['participant']:
+            team = team_home if int(i['eventParticipant']['participant'][0]['id']) == team_home.id else team_away
+
+        inc_str_type: str = i['type']['name']
+
+        # participant
+        participant: Data = None
+        if i['participant']['id'] is not None:
+            participant: Data.Player = __get_participant_from_id(team_=team, id_=int(i['participant']['id']))
+            if inc_str_type == 'Own Goal':   # if the incident is own goal, teams are switched
+                team: Data.Team = team_away if team == team_home else team_home   # performing switch
+            if inc_str_type == 'Yellow Card' or inc_str_type == 'Red Card':
+                if participant is None:   # card for coach
+                    participant = DataInitializer.registry.get_player(id_=int(i['participant']['id']),
+                                                                      full_name=i['participant']['fullName'],
+                                                                      country=None, number=None,
+                                                                      lineup_position_id=None)
+
+        # initializing the whole Incident according to inc_string_type
+        if inc_str_type == "Goal":
+            aux_incident = __get_aux_incident()
+
+            if aux_incident[0]:   # goal with assistance
+                assistance = __get_participant_from_id(team_=team, id_=int(aux_incident[1]['participant']['id']))
+                return Data.Incident.Goal.create(id_=int(i['id']), participant=participant, team=team, time=time,
+                                                 current_score=__get_current_score(),
+                                                 assistance=assistance,
+                                                 goal_type=Types.Goal.ASSISTANCE)
+            else:   # solo play goal
+                return Data.Incident.Goal.create(id_=int(i['id']), participant=participant, team=team, time=time,
+                                                 current_score=__get_current_score(),
+                                                 assistance=None,
+                                                 goal_type=Types.Goal.SOLO_PLAY)
+        elif inc_str_type == "Own Goal":
+            return Data.Incident.Goal.create(id_=int(i['id']), participant=participant, team=team, time=time,
+                                             current_score=__get_current_score(),
+                                             assistance=None,
+                                             goal_type=Types.Goal.OWN_GOAL)
+        elif inc_str_type == "Penalty Kick":
+            # scored penalty is represented by parent Incident
+            aux_incident = __get_aux_incident()
+            scored = True if aux_incident[0] and aux_incident[1]['type']['name'] == "Penalty scored" else False
+
+            return Data.Incident.Penalty.create(id_=int(i['id']), participant=participant, team=team, time=time,
+                                                current_score=__get_current_score(), scored=scored)
+        elif inc_str_type == "Substitution - Out":
+            aux_incident = __get_aux_incident()
+            participant_in = None   # in live feed player subbed in may come later (see update_match_data)
+            if aux_incident[0]:
                 participant_in_id = aux_incident[1]['participant']['id']
                 participant_in = __get_participant_from_id(team_=team, id_=participant_in_id)
 
-                incidents.append(Data.Incident.Substitution.create(participant=participant, team=team, time=time,
-                                                                   participant_in=participant_in))
-            elif inc_str_type == "Yellow Card":
-                aux_incident = __get_aux_incident(int(i['id']))
-                if aux_incident[1]:
-                    incidents.append(Data.Incident.Card.create(participant=participant, team=team, time=time,
-                                                               card_type=Types.Card.RED_AUTO))
-                else:
-                    incidents.append(Data.Incident.Card.create(participant=participant, team=team, time=time,
-                                                               card_type=Types.Card.YELLOW))
-
-            elif inc_str_type == "Red Card":
-                if i['parentId'] is None:
-                    incidents.append(Data.Incident.Card.create(participant=participant, team=team, time=time,
-                                                               card_type=Types.Card.RED_INSTANT))
-
-            elif inc_str_type == "Substitution - In" \
-                    or inc_str_type == "Assistance" \
-                    or inc_str_type == "Penalty scored" \
-                    or inc_str_type == "Penalty missed" \
-                    or inc_str_type == "Extended time second half"\
-                    or inc_str_type == "Extended time first half"\
-                    or inc_str_type == "Action not on pitch"\
-                    or inc_str_type == "Goal Disallowed":
-                pass
-
+            return Data.Incident.Substitution.create(id_=int(i['id']), participant=participant, team=team, time=time,
+                                                     participant_in=participant_in)
+        elif inc_str_type == "Yellow Card":
+            aux_incident = __get_aux_incident()
+            if aux_incident[1]:
+                return Data.Incident.Card.create(id_=int(i['id']), participant=participant, team=team, time=time,
+                                                 card_type=Types.Card.RED_AUTO)
             else:
-                raise ValueError("Unknown incident occurred")
-
-        incidents.sort()
-        return incidents
+                return Data.Incident.Card.create(id_=int(i['id']), participant=participant, team=team, time=time,
+                                                 card_type=Types.Card.YELLOW)
+
+        elif inc_str_type == "Red Card":
+            if i['parentId'] is None:
+                return Data.Incident.Card.create(id_=int(i['id']), participant=participant, team=team, time=time,
+                                                 card_type=Types.Card.RED_INSTANT)
+            return None   # red card after second yellow card is represented by the yellow card
+
+        elif inc_str_type == "Substitution - In" \
+                or inc_str_type == "Assistance" \
+                or inc_str_type == "Penalty scored" \
+                or inc_str_type == "Penalty missed" \
+                or inc_str_type == "Extended time second half"\
+                or inc_str_type == "Extended time first half"\
+                or inc_str_type == "Action not on pitch"\
+                or inc_str_type == "Goal Disallowed":
+            return None
+
+        else:
+            raise ValueError("Unknown incident occurred")
 
 
 class FileFormatEx(Exception):
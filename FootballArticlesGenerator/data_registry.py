@@ -0,0 +1,72 @@
+"""Registry interning immutable data entities (Country, Player, Team) shared across matches."""
+
+# Python's libraries
+import weakref
+from typing import List
+
+# Other parts of the code
+import Types
+import Data
+
+
+class DataRegistry:
+    """Class to intern data entities - identical entities (same values of every attribute) are represented
+    by one shared object, e.g. every player from Czech Republic refers to the same Country.
+    Registry keeps only weak references, so entities no longer used by any match are released.
+    """
+    __countries: weakref.WeakValueDictionary
+    __players: weakref.WeakValueDictionary
+    __teams: weakref.WeakValueDictionary
+
+    def __init__(self):
+        self.__countries = weakref.WeakValueDictionary()
+        self.__players = weakref.WeakValueDictionary()
+        self.__teams = weakref.WeakValueDictionary()
+
+    def get_country(self, id_: int, name_: str) -> Data.Country:
+        """
+        Returns shared instance of Country (creates it when it does not exist yet).
+        Parameters are the same as in Data.Country.create.
+        :return: Data.Country
+        """
+        key = (id_, name_)
+        country: Data.Country = self.__countries.get(key)
+        if country is None:
+            country = Data.Country.create(id_=id_, name_=name_)
+            self.__countries[key] = country
+        return country
+
+    def get_player(self, id_: int, full_name: str, country: Data.Country, lineup_position_id: int,
+                   number: int) -> Data.Player:
+        """
+        Returns shared instance of Player (creates it when it does not exist yet).
+        Parameters are the same as in Data.Player.create.
+        :return: Data.Player
+        """
+        key = (id_, full_name, country, lineup_position_id, number)
+        player: Data.Player = self.__players.get(key)
+        if player is None:
+            player = Data.Player.create(id_=id_, full_name=full_name, country=country,
+                                        lineup_position_id=lineup_position_id, number=number)
+            self.__players[key] = player
+        return player
+
+    def get_team(self, id_: int, name: str, country: Data.Country, type_: Types.Team,
+                 lineup: List[Data.Player]) -> Data.Team:
+        """
+        Returns shared instance of Team (creates it when it does not exist yet).
+        Team is shared only when the whole lineup is the same (players are compared by identity,
+        since they are interned as well).
+        Parameters are the same as in Data.Team.create.
+        :return: Data.Team
+        """
+        key = (id_, name, country, type_, tuple(id(p) for p in lineup))
+        team: Data.Team = self.__teams.get(key)
+        if team is None:
+            team = Data.Team.create(id_=id_, name=name, country=country, type_=type_, lineup=lineup)
+            self.__teams[key] = team
+        return team
+
+    def get_size(self) -> (int, int, int):
+        """Returns number of currently interned countries, players and teams."""
+        return len(self.__countries), len(self.__players), len(self.__teams)
@@ -1,13 +1,15 @@
 """Creating document structure from Match information."""
 
 # Python's libraries
-from typing import List
+import heapq
+from typing import Dict, List, Set
 from dataclasses import dataclass
 
 # Other parts of the code
 import Types
 import Data
 import data_initializer as di
+import season_statistics as ss
 
 """Using dataclass(frozen=True) to guarantee immutability.
 Each data class has create static method (usually needs specific set of attributes), 
@@ -15,6 +17,7 @@ which returns immutable instance (to prevent data from changing during the runni
 """
 
 
+@Data.add_slots
 @dataclass(frozen=True)
 class MessageParent:
     """Parent class to represent message."""
@@ -29,6 +32,7 @@ class MessageParent:
 
 class Message:
     """Class to store every message type."""
+    @Data.add_slots
     @dataclass(frozen=True)
     class Result(MessageParent):
         """Class to represent result message."""
@@ -51,6 +55,7 @@ class Message:
             return f"-> Type: {self.type.name}, team_home: {self.team_home.name}, team_away: {self.team_away}" \
                 f", score: {self.score}"
 
+    @Data.add_slots
     @dataclass(frozen=True)
     class Card(MessageParent):
         """Class to represent card message."""
@@ -76,6 +81,7 @@ class Message:
             return f"-> Type: {self.type.name}, time: {self.time}, " \
                 f"participant: {self.participant.full_name}, team: {self.team.name}, card_type: {self.card_type.name}"
 
+    @Data.add_slots
     @dataclass(frozen=True)
     class Goal(MessageParent):
         """Class to represent goal message."""
@@ -85,10 +91,11 @@ class Message:
         team: Data.Team
         time: Data.Time
         goal_type: Types.Goal
+        score_event: Data.ScoreEvent   # goal in the score timeline of the match (None if unknown)
 
         @staticmethod
         def create(participant: Data.Player, team: Data.Team, time: Data.Time, current_score: Data.Score,
-                   assistance: Data.Player, goal_type: Types.Goal):
+                   assistance: Data.Player, goal_type: Types.Goal, score_event: Data.ScoreEvent = None):
             """
             Creates immutable instance of message - Goal.
             :param participant: Player who scored the goal.
@@ -97,16 +104,19 @@ class Message:
             :param current_score: Score after the goal.
             :param assistance: Player who made the assist to the goal.
             :param goal_type: Type of the goal.
+            :param score_event: Goal in the score timeline (what the goal did with the score).
             :return: Message.Goal
             """
             return Message.Goal(type=Types.Message.GOAL, participant=participant, assistance=assistance,
-                                current_score=current_score, team=team, time=time, goal_type=goal_type)
+                                current_score=current_score, team=team, time=time, goal_type=goal_type,
+                                score_event=score_event)
 
         def __str__(self):
             return f"-> Type: {self.type.name}, time: {self.time}, participant: {self.participant.full_name}" \
                 f", team: {self.team.name}, score: {self.current_score.goals_home}-{self.current_score.goals_away}" \
                 f", goal_type: {self.goal_type}"
 
+    @Data.add_slots
     @dataclass(frozen=True)
     class Substitution(MessageParent):
         """Class to represent substitution message."""
@@ -132,6 +142,7 @@ class Message:
             return f"-> Type: {self.type.name}, time: {self.time}, participant_out: {self.participant_out.full_name}" \
                 f", participant_in: {self.participant_in.full_name}, team: {self.team.name}"
 
+    @Data.add_slots
     @dataclass(frozen=True)
     class MissedPenalty(MessageParent):
         """Class to represent missed penalty message."""
@@ -155,42 +166,301 @@ class Message:
             return f"-> Type: {self.type.name}, time: {self.time}, participant: " \
                 f"{self.participant.full_name}, team: {self.team.name}"
 
+    @Data.add_slots
+    @dataclass(frozen=True)
+    class SeasonGoal(MessageParent):
+        """Class to represent message about number of goals of the player in the season."""
+        participant: Data.Player
+        team: Data.Team
+        time: Data.Time
+        goal_count: int
+
+        @staticmethod
+        def create(participant: Data.Player, team: Data.Team, time: Data.Time, goal_count: int):
+            """
+            Creates immutable instance of message - SeasonGoal.
+            :param participant: Player who scored the goal.
+            :param team: Team the participant plays for.
+            :param time: Time when the goal was scored.
+            :param goal_count: Number of goals of the participant in the season (this goal included).
+            :return: Message.SeasonGoal
+            """
+            return Message.SeasonGoal(type=Types.Message.SEASON_GOAL, participant=participant, team=team, time=time,
+                                      goal_count=goal_count)
+
+        def __str__(self):
+            return f"-> Type: {self.type.name}, time: {self.time}, participant: " \
+                f"{self.participant.full_name}, team: {self.team.name}, goal_count: {self.goal_count}"
+
+    @Data.add_slots
+    @dataclass(frozen=True)
+    class Suspension(MessageParent):
+        """Class to represent message about suspension of the player after too many yellow cards in the season."""
+        participant: Data.Player
+        team: Data.Team
+        time: Data.Time
+        yellow_card_count: int
+
+        @staticmethod
+        def create(participant: Data.Player, team: Data.Team, time: Data.Time, yellow_card_count: int):
+            """
+            Creates immutable instance of message - Suspension.
+            :param participant: Player who got the yellow card.
+            :param team: Team the participant plays for.
+            :param time: Time when the yellow card was received.
+            :param yellow_card_count: Number of yellow cards of the participant in the season (this card included).
+            :return: Message.Suspension
+            """
+            return Message.Suspension(type=Types.Message.SUSPENSION, participant=participant, team=team, time=time,
+                                      yellow_card_count=yellow_card_count)
+
+        def __str__(self):
+            return f"-> Type: {self.type.name}, time: {self.time}, participant: " \
+                f"{self.participant.full_name}, team: {self.team.name}, yellow_card_count: {self.yellow_card_count}"
+
+    @Data.add_slots
+    @dataclass(frozen=True)
+    class MultipleSubstitution(MessageParent):
+        """Class to represent compound message of simultaneous substitutions of one team."""
+        team: Data.Team
+        time: Data.Time
+        substitutions: List['Message.Substitution']
+        substitution_count: int
+
+        @staticmethod
+        def create(substitutions: List['Message.Substitution']):
+            """
+            Creates immutable instance of compound message - MultipleSubstitution.
+            :param substitutions: Substitutions of the same team in the same time (at least two).
+            :return: Message.MultipleSubstitution
+            """
+            return Message.MultipleSubstitution(type=Types.Message.MULTIPLE_SUBSTITUTION, team=substitutions[0].team,
+                                                time=substitutions[0].time, substitutions=substitutions,
+                                                substitution_count=len(substitutions))
+
+        def __str__(self):
+            return f"-> Type: {self.type.name}, time: {self.time}, team: {self.team.name}, substitutions: " + \
+                ", ".join(f"{s.participant_out.full_name} <-> {s.participant_in.full_name}"
+                          for s in self.substitutions)
+
+    @Data.add_slots
+    @dataclass(frozen=True)
+    class MultipleGoal(MessageParent):
+        """Class to represent compound message of more goals of the same player (e.g. brace)."""
+        participant: Data.Player
+        team: Data.Team
+        time: Data.Time                 # time of the last goal
+        times: List[Data.Time]
+        current_score: Data.Score       # score after the last goal
+        score_event: Data.ScoreEvent    # score event of the last goal
+        goals: List['Message.Goal']
+        goal_count: int
+
+        @staticmethod
+        def create(goals: List['Message.Goal']):
+            """
+            Creates immutable instance of compound message - MultipleGoal.
+            :param goals: Goals of the same player (at least two) in chronological order.
+            :return: Message.MultipleGoal
+            """
+            last: Message.Goal = goals[-1]
+            return Message.MultipleGoal(type=Types.Message.MULTIPLE_GOAL, participant=last.participant, team=last.team,
+                                        time=last.time, times=[g.time for g in goals],
+                                        current_score=last.current_score, score_event=last.score_event, goals=goals,
+                                        goal_count=len(goals))
+
+        def __str__(self):
+            return f"-> Type: {self.type.name}, times: {', '.join(map(str, self.times))}, participant: " \
+                f"{self.participant.full_name}, team: {self.team.name}, " \
+                f"score: {self.current_score.goals_home}-{self.current_score.goals_away}"
+
 
 @dataclass(frozen=True)
 class DocumentPlan:
     """Class to represent article as a list of messages and title - creating core structure of the article."""
     title: Message
     body: List[Message]
+    timeline: Data.ScoreTimeline = None   # score timeline of the planned match
 
     @staticmethod
-    def create(title: Message, body: List[Message]):
+    def create(title: Message, body: List[Message], timeline: Data.ScoreTimeline = None):
         """
         Creates document plan from messages.
         :param title: Message.Result what to say in the title.
         :param body: List of Message that should be in the document plan.
+        :param timeline: Score timeline of the match.
         :return: DocumentPlan
         """
-        return DocumentPlan(title=title, body=body)
+        return DocumentPlan(title=title, body=body, timeline=timeline)
 
     def __str__(self):
         return f"TITLE MESSAGE: \n\t{self.title}\nMESSAGES\n\t" + "\n\t".join(map(str, self.body))
 
 
+@Data.add_slots
+@dataclass(frozen=True)
+class PlanBudget:
+    """Class to represent limits of the length of the body of the document plan (e.g. for push notifications).
+    Messages with the highest importance are kept, None means no limit."""
+    max_messages: int     # number of messages (every message is one sentence of the article)
+    max_characters: int   # estimated number of characters of the body of the article
+
+    @staticmethod
+    def create(max_messages: int = None, max_characters: int = None):
+        """
+        Creates immutable instance of PlanBudget.
+        :param max_messages: Maximal number of messages in the body.
+        :param max_characters: Maximal estimated number of characters of the body.
+        :return: PlanBudget
+        """
+        return PlanBudget(max_messages=max_messages, max_characters=max_characters)
+
+
+@dataclass(frozen=True)
+class DocumentPlanDelta:
+    """Class to represent changes of the document plan after the update of the live match."""
+    title: Message                # updated Message.Result (score may have changed)
+    added: List[Message]          # messages of new incidents in order of the body
+    changed: List[Message]        # new messages of corrected incidents in order of the body
+    removed: List[Message]        # messages no longer in the body
+
+    @staticmethod
+    def create(title: Message, added: List[Message], changed: List[Message], removed: List[Message]):
+        """
+        Creates delta of the document plan.
+        :param title: Updated title message.
+        :param added: Messages added to the body.
+        :param changed: Messages replacing the older messages of the same incidents.
+        :param removed: Messages removed from the body.
+        :return: DocumentPlanDelta
+        """
+        return DocumentPlanDelta(title=title, added=added, changed=changed, removed=removed)
+
+    def is_empty(self) -> bool:
+        """Returns whether the body of the document plan stayed the same."""
+        return len(self.added) == 0 and len(self.changed) == 0 and len(self.removed) == 0
+
+    def __str__(self):
+        return f"TITLE MESSAGE: \n\t{self.title}\nADDED\n\t" + "\n\t".join(map(str, self.added)) + \
+            "\nCHANGED\n\t" + "\n\t".join(map(str, self.changed)) + \
+            "\nREMOVED\n\t" + "\n\t".join(map(str, self.removed))
+
+
 class DocumentPlanner:
     """Creating document structure from Match information."""
+
+    # importance of the message types, the most important messages are kept when the body does not fit the budget
+    IMPORTANCE: Dict[Types.Message, int] = {
+        Types.Message.GOAL: 100,
+        Types.Message.PENALTY_KICK_MISSED: 60,
+        Types.Message.CARD: 30,                  # red cards get IMPORTANCE_RED_CARD more
+        Types.Message.SUBSTITUTION: 10,
+        Types.Message.SEASON_GOAL: 20,           # season messages are added to the importance of their incident
+        Types.Message.SUSPENSION: 20
+    }                                            # compound messages have importance of all their messages
+    IMPORTANCE_RED_CARD = 50
+    IMPORTANCE_SCORE_CHANGE: Dict[Types.ScoreChange, int] = {
+        Types.ScoreChange.GO_AHEAD: 20,
+        Types.ScoreChange.EQUALIZER: 20,
+        Types.ScoreChange.EXTEND_LEAD: 0,
+        Types.ScoreChange.REDUCE_DEFICIT: 10
+    }
+    # average number of characters of the sentence of the message (measured on lexicalized articles)
+    ESTIMATED_CHARACTERS: Dict[Types.Message, int] = {
+        Types.Message.GOAL: 70,
+        Types.Message.PENALTY_KICK_MISSED: 50,
+        Types.Message.CARD: 55,
+        Types.Message.SUBSTITUTION: 55,
+        Types.Message.SEASON_GOAL: 45,
+        Types.Message.SUSPENSION: 70,
+        Types.Message.MULTIPLE_SUBSTITUTION: 110,
+        Types.Message.MULTIPLE_GOAL: 65
+    }
+
     @staticmethod
-    def plan_document(match_data: Data.Match) -> DocumentPlan:
+    def plan_document(match_data: Data.Match, match_statistics: ss.MatchStatistics = None,
+                      budget: PlanBudget = None, aggregate: bool = False) -> DocumentPlan:
         """
         Plans the document plan from non-linguistic data (represented as Data.Match).
         :param match_data: Data.Match
+        :param match_statistics: Season statistics of the match (SeasonStatistics.add_match), None means that
+        no season messages are planned.
+        :param budget: Limits of the body, only the most important messages are planned (None means every message).
+        :param aggregate: Whether related messages are merged into compound messages (MessageAggregator),
+        before the budget is applied.
         :return: DocumentPlan
         """
 
         doc_planner = DocumentPlanner()
         title: Message = doc_planner.__plan_title(match_data)   # title has its own specific message
-        body: List[Message] = doc_planner.__plan_body(match_data)
+        body: List[Message] = doc_planner.__plan_body(match_data, match_statistics)
+        if aggregate:
+            body = MessageAggregator.aggregate(body)
+        if budget is not None:
+            body = DocumentPlanner.select_messages(body, budget)
+
+        return DocumentPlan.create(title, body, match_data.score_timeline)
+
+    @staticmethod
+    def get_importance(msg: Message) -> int:
+        """
+        Scores importance of the message.
+        :param msg: Message
+        :return: Importance (higher is more important).
+        """
 
-        return DocumentPlan.create(title, body)
+        if type(msg) is Message.MultipleSubstitution:
+            return sum(DocumentPlanner.get_importance(s) for s in msg.substitutions)
+        elif type(msg) is Message.MultipleGoal:
+            return sum(DocumentPlanner.get_importance(g) for g in msg.goals)
+
+        importance = DocumentPlanner.IMPORTANCE.get(msg.type, 0)
+        if type(msg) is Message.Card and msg.card_type != Types.Card.YELLOW:
+            importance += DocumentPlanner.IMPORTANCE_RED_CARD
+        elif type(msg) is Message.Goal and msg.score_event is not None:
+            importance += DocumentPlanner.IMPORTANCE_SCORE_CHANGE[msg.score_event.change]
+            if msg.score_event.lead_change:
+                importance += DocumentPlanner.IMPORTANCE_SCORE_CHANGE[Types.ScoreChange.GO_AHEAD]
+        return importance
+
+    @staticmethod
+    def select_messages(body: List[Message], budget: PlanBudget) -> List[Message]:
+        """
+        Selects the most important messages fitting the budget (greedily, using heap), chronological order is kept.
+        Season message is selected (and counted) together with the message of its incident.
+        :param body: Planned messages in chronological order.
+        :param budget: PlanBudget
+        :return: Selected messages in chronological order.
+        """
+
+        # grouping season messages with the message of their incident
+        groups: List[List[Message]] = []
+        for msg in body:
+            if (type(msg) is Message.SeasonGoal or type(msg) is Message.Suspension) and len(groups) != 0:
+                groups[-1].append(msg)
+            else:
+                groups.append([msg])
+
+        # the most important group first, earlier group first for the same importance
+        heap = [(-sum(DocumentPlanner.get_importance(msg) for msg in group), index)
+                for (index, group) in enumerate(groups)]
+        heapq.heapify(heap)
+
+        selected: List[int] = []
+        (messages, characters) = (0, 0)
+        while len(heap) != 0 and messages != budget.max_messages:
+            index = heapq.heappop(heap)[1]
+            group_characters = sum(DocumentPlanner.ESTIMATED_CHARACTERS.get(msg.type, 0) for msg in groups[index])
+            if budget.max_messages is not None and messages + len(groups[index]) > budget.max_messages:
+                continue   # smaller less important group may still fit
+            if budget.max_characters is not None and characters + group_characters > budget.max_characters:
+                continue
+            selected.append(index)
+            messages += len(groups[index])
+            characters += group_characters
+
+        selected.sort()   # back to chronological order
+        return [msg for index in selected for msg in groups[index]]
 
     @staticmethod
     def __plan_title(match_data: Data.Match) -> Message:
@@ -203,22 +473,23 @@ class DocumentPlanner:
         return Message.Result.create(match_data.team_home, match_data.team_away, match_data.score)
 
     @staticmethod
-    def __plan_incident_msg(inc: Data.Incident) -> Message:
+    def plan_incident_msg(inc: Data.Incident, score_event: Data.ScoreEvent) -> Message:
         """
-        Transforms incident into a message.
+        Transforms incident into a message (also used by LiveDocumentPlanner).
         :param inc: Data.Incident
+        :param score_event: ScoreEvent of the incident from the score timeline (None if it is not a goal).
         :return: Message
         """
 
         if type(inc) is Data.Incident.Goal:
             return Message.Goal.create(participant=inc.participant, team=inc.team, time=inc.time,
-                                       current_score=inc.current_score, assistance=inc.assistance,
-                                       goal_type=inc.goal_type)
+                                       current_score=score_event.score, assistance=inc.assistance,
+                                       goal_type=inc.goal_type, score_event=score_event)
         elif inc.type == Types.Incident.PENALTY_KICK:
-            if inc.scored is True:
+            if inc.scored is True:   # score of the penalty is taken from the timeline (source data has none)
                 return Message.Goal.create(participant=inc.participant, team=inc.team, time=inc.time,
-                                           current_score=inc.current_score, assistance=None,
-                                           goal_type=Types.Goal.PENALTY)
+                                           current_score=score_event.score, assistance=None,
+                                           goal_type=Types.Goal.PENALTY, score_event=score_event)
             else:
                 return Message.MissedPenalty.create(inc.participant, inc.team, inc.time)
         elif inc.type == Types.Incident.CARD:
@@ -231,10 +502,257 @@ class DocumentPlanner:
             print("failed")
 
     @staticmethod
-    def __plan_body(match_data: Data.Match) -> List[Message]:
+    def __plan_season_msg(inc: Data.Incident, inc_statistics: ss.IncidentStatistics) -> Message:
+        """
+        Transforms season statistics of the incident into a message.
+        :param inc: Data.Incident
+        :param inc_statistics: Season statistics of the participant right after the incident.
+        :return: Message or None if there is nothing to say about the season
+        """
+
+        if (type(inc) is Data.Incident.Goal and inc.goal_type != Types.Goal.OWN_GOAL) \
+                or (type(inc) is Data.Incident.Penalty and inc.scored):
+            return Message.SeasonGoal.create(participant=inc.participant, team=inc.team, time=inc.time,
+                                             goal_count=inc_statistics.player_goals)
+        elif type(inc) is Data.Incident.Card and inc.card_type == Types.Card.YELLOW \
+                and ss.SeasonStatistics.is_suspension(inc_statistics.player_yellow_cards):
+            return Message.Suspension.create(participant=inc.participant, team=inc.team, time=inc.time,
+                                             yellow_card_count=inc_statistics.player_yellow_cards)
+        else:
+            return None
+
+    @staticmethod
+    def __plan_body(match_data: Data.Match, match_statistics: ss.MatchStatistics) -> List[Message]:
         """
         Plans body of the article (as list of messages) from match data.
+        Season message (if any) follows the message of its incident.
         :param match_data: Data.Match
+        :param match_statistics: Season statistics of the match or None.
+        :return: List[Message]
+        """
+        timeline: Data.ScoreTimeline = match_data.score_timeline
+        if match_statistics is None:
+            return [DocumentPlanner.plan_incident_msg(inc, timeline.get_event(index))
+                    for (index, inc) in enumerate(match_data.incidents)]
+
+        body: List[Message] = []
+        for (index, (inc, inc_statistics)) in enumerate(zip(match_data.incidents, match_statistics.incidents)):
+            body.append(DocumentPlanner.plan_incident_msg(inc, timeline.get_event(index)))
+            season_msg: Message = DocumentPlanner.__plan_season_msg(inc, inc_statistics)
+            if season_msg is not None:
+                body.append(season_msg)
+        return body
+
+
+class MessageAggregator:
+    """Stage between planning and lexicalization merging related messages into compound messages,
+    so that busy matches are described by fewer (and less repetitive) sentences:
+    1) substitutions of one team in the same time -> Message.MultipleSubstitution
+    2) goals of the same player without any other goal between them -> Message.MultipleGoal
+    """
+
+    @staticmethod
+    def aggregate(body: List[Message]) -> List[Message]:
+        """
+        Merges related messages of the body.
+        :param body: Planned messages in chronological order.
+        :return: Messages in chronological order with compound messages.
+        """
+        return MessageAggregator.__aggregate_substitutions(MessageAggregator.__aggregate_goals(body))
+
+    @staticmethod
+    def __aggregate_substitutions(body: List[Message]) -> List[Message]:
+        """
+        Merges substitutions of the same team in the same time, compound message takes place of the first one.
+        :param body: List[Message]
         :return: List[Message]
         """
-        return [DocumentPlanner.__plan_incident_msg(inc) for inc in match_data.incidents]
+        groups: Dict[tuple, List[int]] = {}   # (team, time) -> indices of the substitutions
+        for (index, msg) in enumerate(body):
+            if type(msg) is Message.Substitution and msg.participant_in is not None:
+                groups.setdefault((msg.team.type, msg.time.base, msg.time.added), []).append(index)
+
+        compound: Dict[int, Message] = {}    # index of the first substitution -> compound message
+        merged = set()                       # indices of the other substitutions
+        for indices in groups.values():
+            if len(indices) > 1:
+                compound[indices[0]] = Message.MultipleSubstitution.create([body[i] for i in indices])
+                merged.update(indices[1:])
+
+        return [compound.get(index, msg) for (index, msg) in enumerate(body) if index not in merged]
+
+    @staticmethod
+    def __aggregate_goals(body: List[Message]) -> List[Message]:
+        """
+        Merges goals of the same player scored one after another (other messages may be between them),
+        compound message takes place of the last goal (score is correct there), season messages of the merged
+        goals are removed (season message of the last goal has the current number of goals).
+        :param body: List[Message]
+        :return: List[Message]
+        """
+
+        def __get_scorer(msg: Message) -> int:
+            if msg.goal_type == Types.Goal.OWN_GOAL or msg.participant is None:
+                return None
+            return msg.participant.id
+
+        # runs of indices of goals of the same player
+        runs: List[List[int]] = []
+        for (index, msg) in enumerate(body):
+            if type(msg) is not Message.Goal:
+                continue
+            scorer = __get_scorer(msg)
+            if scorer is not None and len(runs) != 0 and __get_scorer(body[runs[-1][-1]]) == scorer:
+                runs[-1].append(index)
+            else:
+                runs.append([index])
+
+        compound: Dict[int, Message] = {}    # index of the last goal -> compound message
+        merged = set()                       # indices of the other goals and their season messages
+        for run in runs:
+            if len(run) > 1:
+                compound[run[-1]] = Message.MultipleGoal.create([body[i] for i in run])
+                for index in run[:-1]:
+                    merged.add(index)
+                    if index + 1 < len(body) and type(body[index + 1]) is Message.SeasonGoal:
+                        merged.add(index + 1)
+
+        return [compound.get(index, msg) for (index, msg) in enumerate(body) if index not in merged]
+
+
+class LiveDocumentPlanner:
+    """Planner keeping the document plan of the live match.
+    After every update of the match only new and corrected incidents are planned (and goals whose place
+    in the score timeline changed), messages of every other incident are reused. Update with known ids of the changed
+    incidents (update_from_json) checks only those incidents and the goals, other incidents are not compared.
+    Messages are not aggregated (every incident keeps its own message, so that deltas stay per incident).
+    Season statistics are not planned - they belong to the finished matches.
+    """
+
+    match_data: Data.Match
+    plan: DocumentPlan
+    __incidents: Dict[object, Data.Incident]   # key of the incident -> planned incident
+    __messages: Dict[object, Message]          # key of the incident -> its message
+
+    def __init__(self, match_data: Data.Match):
+        """
+        Plans the whole document plan of the match (as DocumentPlanner.plan_document does).
+        :param match_data: Data.Match at the beginning of the live feed.
+        """
+        self.match_data = match_data
+        self.plan = None
+        self.__incidents = {}
+        self.__messages = {}
+        self.update(match_data)
+
+    def update_from_json(self, json_incidents: List[dict], json_score: dict = None) -> DocumentPlanDelta:
+        """
+        Applies appended or corrected incidents from the live feed (DataInitializer.update_match_data)
+        and updates the document plan.
+        :param json_incidents: new or corrected incidents in the same format as incidents in json file
+        :param json_score: score in the same format as score in json file (score is not changed if None)
+        :return: DocumentPlanDelta
+        """
+        update: di.MatchUpdate = di.DataInitializer.update_match_data_delta(self.match_data, json_incidents, json_score)
+        return self.update(update.match_data, update.changed_ids)
+
+    def update(self, match_data: Data.Match, changed_ids: Set[int] = None) -> DocumentPlanDelta:
+        """
+        Updates the document plan to the new state of the match.
+        :param match_data: Data.Match - new state of the same match.
+        :param changed_ids: Ids of the incidents added, corrected or removed since the last update
+        (e.g. MatchUpdate.changed_ids), None means that every incident is compared with the planned one.
+        :return: DocumentPlanDelta (with every message as added after the first planning)
+        """
+        if changed_ids is not None and self.plan is not None:
+            return self.__update_changed(match_data, changed_ids)
+
+        timeline: Data.ScoreTimeline = match_data.score_timeline
+        incidents: Dict[object, Data.Incident] = {}
+        messages: Dict[object, Message] = {}
+        body: List[Message] = []
+        added: List[Message] = []
+        changed: List[Message] = []
+
+        for (index, inc) in enumerate(match_data.incidents):
+            key = LiveDocumentPlanner.__get_key(inc)
+            score_event: Data.ScoreEvent = timeline.get_event(index)
+            old_msg: Message = self.__messages.get(key)
+
+            if old_msg is not None and LiveDocumentPlanner.__is_unchanged(self.__incidents[key], old_msg, inc,
+                                                                          score_event):
+                msg = old_msg
+            else:
+                msg = DocumentPlanner.plan_incident_msg(inc, score_event)
+                (changed if old_msg is not None else added).append(msg)
+
+            incidents[key] = inc
+            messages[key] = msg
+            body.append(msg)
+
+        removed: List[Message] = [msg for (key, msg) in self.__messages.items() if key not in messages]
+
+        title: Message = Message.Result.create(match_data.team_home, match_data.team_away, match_data.score)
+        self.match_data = match_data
+        self.plan = DocumentPlan.create(title, body, timeline)
+        self.__incidents = incidents
+        self.__messages = messages
+        return DocumentPlanDelta.create(title=title, added=added, changed=changed, removed=removed)
+
+    def __update_changed(self, match_data: Data.Match, changed_ids: Set[int]) -> DocumentPlanDelta:
+        """
+        Updates the document plan by the changed incidents only - changed incidents and goals whose score event
+        moved are checked (and planned again), messages of every other incident are reused without comparing.
+        :param match_data: Data.Match - new state of the same match.
+        :param changed_ids: Ids of the incidents added, corrected or removed since the last update.
+        :return: DocumentPlanDelta
+        """
+        timeline: Data.ScoreTimeline = match_data.score_timeline
+
+        # incidents to check - changed incidents and goals whose score event is not the planned one
+        checked = set(id_ for id_ in changed_ids if id_ in match_data.incidents_by_id)
+        for event in timeline.events:
+            key = LiveDocumentPlanner.__get_key(match_data.incidents[event.incident_index])
+            old_msg: Message = self.__messages.get(key)
+            if key not in checked and (type(old_msg) is not Message.Goal or old_msg.score_event != event):
+                checked.add(key)
+
+        removed: List[Message] = []
+        for id_ in changed_ids:
+            if id_ not in match_data.incidents_by_id and id_ in self.__messages:
+                removed.append(self.__messages.pop(id_))
+                del self.__incidents[id_]
+
+        body: List[Message] = []
+        added: List[Message] = []
+        changed: List[Message] = []
+        for (index, inc) in enumerate(match_data.incidents):   # only lookups, unchecked incidents are not compared
+            key = LiveDocumentPlanner.__get_key(inc)
+            if key in checked:
+                score_event: Data.ScoreEvent = timeline.get_event(index)
+                old_msg: Message = self.__messages.get(key)
+                if old_msg is None or not LiveDocumentPlanner.__is_unchanged(self.__incidents[key], old_msg, inc,
+                                                                             score_event):
+                    msg = DocumentPlanner.plan_incident_msg(inc, score_event)
+                    (changed if old_msg is not None else added).append(msg)
+                    self.__messages[key] = msg
+                self.__incidents[key] = inc
+            body.append(self.__messages[key])
+
+        title: Message = Message.Result.create(match_data.team_home, match_data.team_away, match_data.score)
+        self.match_data = match_data
+        self.plan = DocumentPlan.create(title, body, timeline)
+        return DocumentPlanDelta.create(title=title, added=added, changed=changed, removed=removed)
+
+    @staticmethod
+    def __get_key(inc: Data.Incident) -> object:
+        """Returns key of the incident - its id from the source data or the object itself if it has no id."""
+        return inc.id if inc.id is not None else (None, id(inc))   # planner keeps the incident alive
+
+    @staticmethod
+    def __is_unchanged(old_inc: Data.Incident, old_msg: Message, inc: Data.Incident,
+                       score_event: Data.ScoreEvent) -> bool:
+        """Checks whether the already planned message still describes the incident."""
+        if old_inc is not inc and old_inc != inc:
+            return False
+        return type(old_msg) is not Message.Goal or old_msg.score_event == score_event
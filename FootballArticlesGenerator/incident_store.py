@@ -0,0 +1,211 @@
+"""Columnar store of incidents of many matches (e.g. the whole season) for fast season-wide statistics.
+Every attribute of the incidents is stored as one typed array (column), so that queries are vectorized
+instead of walking through lists of Data.Incident objects.
+"""
+
+# Python's libraries
+import os
+from typing import Dict, Iterable, List
+
+try:
+    import numpy as np
+except ImportError:   # optional dependency - IncidentStore can not be used without it
+    np = None
+
+# Other parts of the code
+import Types
+import Data
+
+
+class IncidentStore:
+    """Class storing incidents of many matches as columns (numpy arrays), one row per incident.
+    Missing values (e.g. assistance of the solo play goal) are stored as -1.
+    Columns are persisted as .npy files, which can be memory-mapped when loaded.
+    """
+
+    # name of the column -> type of its values
+    COLUMNS: Dict[str, str] = {
+        'match': 'int32',          # index of the match in order of the creation
+        'type': 'int8',            # Types.Incident
+        'subtype': 'int8',         # Types.Goal for goals, Types.Card for cards, 1/0 whether penalty was scored
+        'minute': 'int16',         # Time.base + Time.added
+        'team': 'int64',           # id of the team
+        'participant': 'int64',    # id of the player
+        'assistance': 'int64',     # id of the player who assisted to the goal
+        'score_home': 'int16',     # goals of home team after the incident
+        'score_away': 'int16'      # goals of away team after the incident
+    }
+    FILE_SUFFIX = '.npy'
+
+    columns: Dict[str, 'np.ndarray']
+    match_count: int
+
+    def __init__(self, columns: Dict[str, 'np.ndarray'], match_count: int):
+        self.columns = columns
+        self.match_count = match_count
+
+    @staticmethod
+    def create(matches: Iterable[Data.Match]) -> 'IncidentStore':
+        """
+        Creates store from the matches (matches are consumed one at a time).
+        :param matches: Iterable of Data.Match
+        :return: IncidentStore
+        """
+        IncidentStore.__check_numpy()
+
+        rows: Dict[str, List[int]] = {name: [] for name in IncidentStore.COLUMNS}
+        match_count = 0
+        for match_data in matches:
+            IncidentStore.__append_match(rows, match_count, match_data)
+            match_count += 1
+
+        columns = {name: np.array(values, dtype=IncidentStore.COLUMNS[name]) for (name, values) in rows.items()}
+        return IncidentStore(columns=columns, match_count=match_count)
+
+    @staticmethod
+    def __append_match(rows: Dict[str, List[int]], match_index: int, match_data: Data.Match):
+        """
+        Appends every incident of the match as new rows.
+        :param rows: Columns as lists of values.
+        :param match_index: Index of the match.
+        :param match_data: Data.Match
+        """
+
+        def __get_id(entity) -> int:
+            return entity.id if entity is not None else -1
+
+        # incidents are sorted, score is carried from the last goal of the score timeline
+        # (score of the incident itself is not used - scored penalty has no score in the source data)
+        timeline: Data.ScoreTimeline = match_data.score_timeline
+        score = Data.Score.create(0, 0)
+        for (index, incident) in enumerate(match_data.incidents):
+            score_event: Data.ScoreEvent = timeline.get_event(index)
+            if score_event is not None:
+                score = score_event.score
+
+            subtype = -1
+            assistance = None
+            if type(incident) is Data.Incident.Goal:
+                subtype = incident.goal_type.value
+                assistance = incident.assistance
+            elif type(incident) is Data.Incident.Penalty:
+                subtype = int(incident.scored)
+            elif type(incident) is Data.Incident.Card:
+                subtype = incident.card_type.value
+
+            rows['match'].append(match_index)
+            rows['type'].append(incident.type.value)
+            rows['subtype'].append(subtype)
+            rows['minute'].append(incident.time.base + incident.time.added)
+            rows['team'].append(__get_id(incident.team))
+            rows['participant'].append(__get_id(incident.participant))
+            rows['assistance'].append(__get_id(assistance))
+            rows['score_home'].append(score.goals_home)
+            rows['score_away'].append(score.goals_away)
+
+    def save(self, directory: str):
+        """
+        Saves every column into its own .npy file (directory is created when needed).
+        :param directory: Directory of the store.
+        """
+        os.makedirs(directory, exist_ok=True)
+        for (name, column) in self.columns.items():
+            np.save(os.path.join(directory, name + IncidentStore.FILE_SUFFIX), column)
+        np.save(os.path.join(directory, 'match_count' + IncidentStore.FILE_SUFFIX), np.array(self.match_count))
+
+    @staticmethod
+    def load(directory: str, mmap: bool = True) -> 'IncidentStore':
+        """
+        Loads store saved by IncidentStore.save.
+        :param directory: Directory of the store.
+        :param mmap: Whether the columns are memory-mapped (read-only, read from the disk only when needed).
+        :return: IncidentStore
+        """
+        IncidentStore.__check_numpy()
+
+        mmap_mode = 'r' if mmap else None
+        columns = {name: np.load(os.path.join(directory, name + IncidentStore.FILE_SUFFIX), mmap_mode=mmap_mode)
+                   for name in IncidentStore.COLUMNS}
+        match_count = int(np.load(os.path.join(directory, 'match_count' + IncidentStore.FILE_SUFFIX)))
+        return IncidentStore(columns=columns, match_count=match_count)
+
+    def get_size(self) -> int:
+        """Returns number of stored incidents."""
+        return len(self.columns['type'])
+
+    def get_goals_mask(self) -> 'np.ndarray':
+        """Returns boolean mask of goals scored by the participant (scored penalties included, own goals excluded)."""
+        type_ = self.columns['type']
+        subtype = self.columns['subtype']
+        return ((type_ == Types.Incident.GOAL.value) & (subtype != Types.Goal.OWN_GOAL.value)) \
+            | ((type_ == Types.Incident.PENALTY_KICK.value) & (subtype == 1))
+
+    def get_goals_per_player(self) -> Dict[int, int]:
+        """
+        Counts goals of every player (scored penalties included, own goals excluded).
+        :return: Dictionary (id of the player -> number of goals)
+        """
+        return IncidentStore.__count_values(self.columns['participant'][self.get_goals_mask()])
+
+    def get_assists_per_player(self) -> Dict[int, int]:
+        """
+        Counts assists of every player.
+        :return: Dictionary (id of the player -> number of assists)
+        """
+        assistance = self.columns['assistance']
+        return IncidentStore.__count_values(assistance[assistance != -1])
+
+    def get_cards_per_team(self, card_type: Types.Card = None) -> Dict[int, int]:
+        """
+        Counts cards of every team.
+        :param card_type: Type of the counted cards (None means every card).
+        :return: Dictionary (id of the team -> number of cards)
+        """
+        mask = self.columns['type'] == Types.Incident.CARD.value
+        if card_type is not None:
+            mask &= self.columns['subtype'] == card_type.value
+        return IncidentStore.__count_values(self.columns['team'][mask])
+
+    def get_cards_per_player(self, card_type: Types.Card = None) -> Dict[int, int]:
+        """
+        Counts cards of every player (coaches included).
+        :param card_type: Type of the counted cards (None means every card).
+        :return: Dictionary (id of the player -> number of cards)
+        """
+        mask = self.columns['type'] == Types.Incident.CARD.value
+        if card_type is not None:
+            mask &= self.columns['subtype'] == card_type.value
+        return IncidentStore.__count_values(self.columns['participant'][mask])
+
+    def get_goals_per_minute_bucket(self, bucket_size: int = 15) -> 'np.ndarray':
+        """
+        Counts goals (own goals included) scored in every bucket of minutes, e.g. 0-14, 15-29, ...
+        Goals in added time belong to the bucket of their minute (e.g. 90 + 3 is the 93rd minute).
+        :param bucket_size: Number of minutes in one bucket.
+        :return: Array of counts, index is the number of the bucket.
+        """
+        type_ = self.columns['type']
+        mask = (type_ == Types.Incident.GOAL.value) \
+            | ((type_ == Types.Incident.PENALTY_KICK.value) & (self.columns['subtype'] == 1))
+        return np.bincount(self.columns['minute'][mask] // bucket_size)
+
+    def get_player_goal_matches(self, player_id: int) -> 'np.ndarray':
+        """
+        Returns indexes of matches (in order of the creation) where the player scored, one index per goal.
+        :param player_id: Id of the player.
+        :return: Sorted array of indexes of the matches.
+        """
+        mask = self.get_goals_mask() & (self.columns['participant'] == player_id)
+        return self.columns['match'][mask]
+
+    @staticmethod
+    def __count_values(values: 'np.ndarray') -> Dict[int, int]:
+        """Counts occurrences of every value (missing values -1 are skipped)."""
+        (unique, counts) = np.unique(values[values != -1], return_counts=True)
+        return dict(zip(unique.tolist(), counts.tolist()))
+
+    @staticmethod
+    def __check_numpy():
+        """Raises ImportError when numpy is not installed."""
+        if np is None:
+            raise ImportError("IncidentStore requires numpy module (python -m pip install numpy).")
@@ -0,0 +1,87 @@
+"""Abstraction over JSON decoders used when reading match data.
+The fastest installed decoder is used (orjson), Python's json module otherwise.
+"""
+
+# Python's libraries
+import json
+import mmap
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Union
+
+try:
+    import orjson
+except ImportError:   # optional dependency - decoding falls back to Python's json
+    orjson = None
+
+
+def _loads_json(data: Union[str, bytes, memoryview]):
+    """Decodes data with Python's json module (memoryview is decoded into text directly, without copying
+    into bytes first - json files are always UTF-8, byte order mark is skipped as by json.loads of bytes)."""
+    return json.loads(str(data, 'utf-8-sig') if isinstance(data, memoryview) else data)
+
+
+def _init_decoders() -> Dict[str, Callable]:
+    """
+    Initializes every installed decoder, ordered from the fastest.
+    :return: Dictionary of decoders (name -> loads function).
+    """
+    decoders: Dict[str, Callable] = {}
+    if orjson is not None:
+        decoders['orjson'] = orjson.loads   # accepts str, bytes and memoryview, errors are json.JSONDecodeError
+    decoders['json'] = _loads_json
+    return decoders
+
+
+class JsonBackend:
+    """Class handling the choice of JSON decoder and reading of the json files.
+    Every decoder raises json.decoder.JSONDecodeError (subclass of ValueError) on invalid input.
+    """
+    DECODERS: Dict[str, Callable] = _init_decoders()
+    current: str = next(iter(DECODERS))
+
+    @staticmethod
+    def get_available() -> List[str]:
+        """Returns names of installed decoders, ordered from the fastest."""
+        return list(JsonBackend.DECODERS)
+
+    @staticmethod
+    def use(name: str):
+        """
+        Sets decoder used for every following decoding.
+        :param name: Name of the decoder (one of JsonBackend.get_available()).
+        """
+        if name not in JsonBackend.DECODERS:
+            raise ValueError(f"JSON decoder '{name}' is not installed, available: {JsonBackend.get_available()}")
+        JsonBackend.current = name
+
+    @staticmethod
+    def loads(data: Union[str, bytes, memoryview]):
+        """
+        Decodes json document with the current decoder.
+        :param data: json document as string or bytes (buffer).
+        :return: decoded Python's object
+        """
+        return JsonBackend.DECODERS[JsonBackend.current](data)
+
+    @staticmethod
+    @contextmanager
+    def map_file(file_name: str) -> Iterator[Union[bytes, memoryview]]:
+        """
+        Maps file into memory and returns its content as read-only buffer (no decoding into text stream).
+        The buffer is valid only inside of the with statement.
+        :param file_name: Name of the file.
+        :return: buffer with the content of the file
+        """
+        with open(file_name, 'rb') as file:
+            try:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:   # empty file can not be mapped
+                yield b''
+                return
+
+            with mapped:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    view.release()
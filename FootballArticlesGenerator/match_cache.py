@@ -0,0 +1,158 @@
+"""Persistent cache of already initialized matches (Data.Match) stored on disk.
+Matches are keyed by hash of the content of the json file, so the cached match is used only when the file is unchanged.
+"""
+
+# Python's libraries
+import os
+import pickle
+import hashlib
+import tempfile
+import zlib
+from typing import Union
+
+# Other parts of the code
+import Data
+
+
+class MatchCache:
+    """Class handling on-disk cache of Data.Match objects.
+    Every match is stored in its own file as compressed pickle, named by the hash of the json content.
+    When the size of the cache exceeds max_size, least recently used matches are evicted (down to EVICTION_RATIO
+    of max_size). Size of the cache is estimated from the stored entries, the directory is scanned only when
+    the estimate exceeds max_size (and once at the first put), not on every put.
+    """
+
+    # version of the cache format - change it whenever Data classes change, old entries are then ignored
+    VERSION = 7
+    FILE_SUFFIX = '.match'
+    DEFAULT_DIRECTORY = os.path.join(os.path.expanduser('~'), '.cache', 'FootballArticlesGenerator', 'matches')
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024   # in bytes
+    EVICTION_RATIO = 0.75   # part of max_size kept by the eviction, so that full cache is not scanned on every put
+
+    directory: str
+    max_size: int
+    __size: int   # estimated size of the cache in bytes (upper bound), None until the directory is scanned
+
+    def __init__(self, directory: str = DEFAULT_DIRECTORY, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initializes cache in the given directory (directory is created when needed).
+        :param directory: Directory where cached matches are stored.
+        :param max_size: Maximal size of the cache in bytes.
+        """
+        self.directory = directory
+        self.max_size = max_size
+        self.__size = None
+
+    @staticmethod
+    def get_key(content: Union[bytes, memoryview]) -> str:
+        """
+        Creates key of the match from the content of the json file.
+        :param content: Content of the json file (bytes or any buffer).
+        :return: Key as hexadecimal string.
+        """
+        return hashlib.sha256(content).hexdigest() + '-' + str(MatchCache.VERSION)
+
+    def get(self, key: str) -> Data.Match:
+        """
+        Returns cached match for the given key.
+        :param key: Key of the match (MatchCache.get_key).
+        :return: Data.Match or None if the match is not cached.
+        """
+        path = self.__get_path(key)
+        try:
+            with open(path, 'rb') as cache_file:
+                match_data: Data.Match = pickle.loads(zlib.decompress(cache_file.read()))
+            os.utime(path)   # marking as recently used for the eviction
+            return match_data
+        except FileNotFoundError:
+            return None
+        except Exception:   # corrupted entry (or entry created by incompatible code) is discarded
+            self.__remove(path)
+            return None
+
+    def put(self, key: str, match_data: Data.Match):
+        """
+        Stores match in the cache and evicts least recently used matches if the cache is too big.
+        :param key: Key of the match (MatchCache.get_key).
+        :param match_data: Data.Match
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        content = zlib.compress(pickle.dumps(match_data, protocol=pickle.HIGHEST_PROTOCOL))
+
+        # writing into temporary file first, so that other processes never read half-written entry
+        (fd, tmp_path) = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                tmp_file.write(content)
+            os.replace(tmp_path, self.__get_path(key))
+        except OSError:
+            self.__remove(tmp_path)
+            return
+
+        # replaced or removed entries are not subtracted, the estimate is corrected by the scan in __evict
+        if self.__size is not None:
+            self.__size += len(content)
+        if self.__size is None or self.__size > self.max_size:
+            self.__evict()
+
+    def remove(self, key: str):
+        """
+        Removes cached match with the given key (if it is cached).
+        :param key: Key of the match (MatchCache.get_key).
+        """
+        self.__remove(self.__get_path(key))
+
+    def clear(self):
+        """Removes every cached match."""
+        for (path, _, _) in self.__get_entries():
+            self.__remove(path)
+        self.__size = 0
+
+    def __evict(self):
+        """Removes least recently used matches (if the cache is bigger than max_size) until the size of the cache
+        is at most EVICTION_RATIO of max_size."""
+        entries = self.__get_entries()
+        size = sum(e[2] for e in entries)
+        self.__size = size
+        if size <= self.max_size:
+            return
+
+        target_size = self.max_size * self.EVICTION_RATIO
+        entries.sort(key=lambda e: e[1])   # least recently used first
+        for (path, _, entry_size) in entries:
+            if size <= target_size:
+                break
+            self.__remove(path)
+            size -= entry_size
+        self.__size = size
+
+    def __get_entries(self) -> list:
+        """
+        Returns every entry of the cache.
+        :return: List of tuples (path, time of the last use, size in bytes).
+        """
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(self.FILE_SUFFIX):
+                        try:
+                            stat = entry.stat()
+                            entries.append((entry.path, stat.st_mtime, stat.st_size))
+                        except FileNotFoundError:   # removed by other process meanwhile
+                            pass
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def __get_path(self, key: str) -> str:
+        """Returns path of the file storing match with the given key."""
+        return os.path.join(self.directory, key + self.FILE_SUFFIX)
+
+    @staticmethod
+    def __remove(path: str):
+        """Removes file, file removed meanwhile (e.g. by other process) is not an error."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
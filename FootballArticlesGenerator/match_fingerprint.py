@@ -0,0 +1,153 @@
+"""Fingerprints of matches to recognize matches that did not change since their articles were generated
+(e.g. live feed sends the whole match again on every poll).
+Fingerprint covers only semantically relevant data (participants, score, lineups and incidents),
+volatile fields of the json file (e.g. url) are not part of Data.Match at all.
+"""
+
+# Python's libraries
+import os
+import json
+import hashlib
+import tempfile
+from typing import Dict, List
+
+# Other parts of the code
+import Data
+
+
+class MatchFingerprint:
+    """Class creating stable fingerprint of the match (same match data give the same fingerprint in every run)."""
+
+    @staticmethod
+    def get_key(match_data: Data.Match) -> str:
+        """
+        Returns key identifying the match (not its state), used to remember the last fingerprint of the match.
+        Start of the match is part of the key, so that repeated match of the same teams (e.g. rematch in the next
+        season) has its own fingerprint.
+        :param match_data: Data.Match
+        :return: Key as string.
+        """
+        return f'{match_data.team_home.id}-{match_data.team_away.id}-{match_data.time_start}'
+
+    @staticmethod
+    def get_fingerprint(match_data: Data.Match) -> str:
+        """
+        Creates fingerprint of the match from teams, lineups, score and incidents.
+        :param match_data: Data.Match
+        :return: Fingerprint as hexadecimal string.
+        """
+        parts: List[tuple] = [MatchFingerprint.__get_team_part(match_data.team_home),
+                              MatchFingerprint.__get_team_part(match_data.team_away),
+                              (match_data.score.goals_home, match_data.score.goals_away)]
+        parts += [MatchFingerprint.__get_incident_part(inc) for inc in match_data.incidents]
+
+        content = json.dumps(parts, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def __get_team_part(team: Data.Team) -> tuple:
+        """Returns relevant data of the team (with its lineup) as tuple of plain values."""
+        lineup = [(p.id, p.full_name, p.lineup_position_id, p.number) for p in team.lineup]
+        return team.id, team.name, lineup
+
+    @staticmethod
+    def __get_incident_part(inc: Data.Incident) -> tuple:
+        """Returns relevant data of the incident as tuple of plain values."""
+
+        def __get_id(entity) -> int:
+            return entity.id if entity is not None else None
+
+        common = (inc.type.value, inc.time.base, inc.time.added, __get_id(inc.team), __get_id(inc.participant))
+        if type(inc) is Data.Incident.Goal:
+            return common + (inc.goal_type.value, __get_id(inc.assistance),
+                             inc.current_score.goals_home, inc.current_score.goals_away)
+        elif type(inc) is Data.Incident.Penalty:
+            return common + (inc.scored, inc.current_score.goals_home, inc.current_score.goals_away)
+        elif type(inc) is Data.Incident.Card:
+            return common + (inc.card_type.value,)
+        elif type(inc) is Data.Incident.Substitution:
+            return common + (__get_id(inc.participant_in),)
+        else:
+            return common
+
+
+class FingerprintStore:
+    """Class remembering the last fingerprint of every match, persisted on disk (json file),
+    so that unchanged matches are recognized even after the restart of the program.
+    Stored fingerprints are saved into the file every FLUSH_INTERVAL matches and by flush (at the end of the run),
+    not after every match.
+    """
+
+    DEFAULT_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'FootballArticlesGenerator', 'fingerprints.json')
+    FLUSH_INTERVAL = 100   # number of stored fingerprints after which the file is saved
+
+    file_name: str
+    __fingerprints: Dict[str, str]
+    __unsaved: int   # number of fingerprints stored since the last save
+
+    def __init__(self, file_name: str = DEFAULT_FILE):
+        """
+        Loads fingerprints from the file (missing or corrupted file means no fingerprints).
+        :param file_name: Name of the json file with fingerprints.
+        """
+        self.file_name = file_name
+        self.__unsaved = 0
+        try:
+            with open(file_name, encoding='utf-8') as file:
+                self.__fingerprints = json.load(file)
+        except (OSError, ValueError):
+            self.__fingerprints = {}
+
+    def is_unchanged(self, match_data: Data.Match, fingerprint: str = None) -> bool:
+        """
+        Checks whether the match is the same as when it was stored last time.
+        :param match_data: Data.Match
+        :param fingerprint: Already computed fingerprint of the match (computed if None).
+        :return: bool
+        """
+        if fingerprint is None:
+            fingerprint = MatchFingerprint.get_fingerprint(match_data)
+        return self.__fingerprints.get(MatchFingerprint.get_key(match_data)) == fingerprint
+
+    def put(self, match_data: Data.Match, fingerprint: str = None):
+        """
+        Stores fingerprint of the match (replaces the previous one), the file is saved every FLUSH_INTERVAL matches.
+        :param match_data: Data.Match
+        :param fingerprint: Already computed fingerprint of the match (computed if None).
+        """
+        if fingerprint is None:
+            fingerprint = MatchFingerprint.get_fingerprint(match_data)
+        self.__fingerprints[MatchFingerprint.get_key(match_data)] = fingerprint
+        self.__unsaved += 1
+        if self.__unsaved >= FingerprintStore.FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """Saves every fingerprint into the file (if any fingerprint was stored since the last save)."""
+        if self.__unsaved > 0:
+            self.__save()
+            self.__unsaved = 0
+
+    def clear(self):
+        """Removes every fingerprint (the file is removed as well)."""
+        self.__fingerprints = {}
+        self.__unsaved = 0
+        try:
+            os.remove(self.file_name)
+        except FileNotFoundError:
+            pass
+
+    def __save(self):
+        """Saves fingerprints into temporary file first, so that the file is never half-written."""
+        directory = os.path.dirname(self.file_name) or '.'
+        os.makedirs(directory, exist_ok=True)
+        (fd, tmp_path) = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as tmp_file:
+                json.dump(self.__fingerprints, tmp_file)
+            os.replace(tmp_path, self.file_name)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
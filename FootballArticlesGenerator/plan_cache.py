@@ -0,0 +1,164 @@
+"""Cache of already created document plans (DocumentPlan) keyed by fingerprint of the match.
+Plans are kept in memory (least recently used are evicted) and optionally on disk as well,
+so that the match resent unchanged (e.g. by live feed in service mode) is not planned again.
+"""
+
+# Python's libraries
+import os
+import json
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Set, Tuple
+
+# Other parts of the code
+import Data
+import match_cache as mc
+import match_fingerprint as mf
+import season_statistics as ss
+import document_planner as dp
+
+
+class PlanDiskCache(mc.MatchCache):
+    """Class handling on-disk tier of the PlanCache, plans are stored the same way as matches in MatchCache."""
+
+    FILE_SUFFIX = '.plan'
+    DEFAULT_DIRECTORY = os.path.join(os.path.expanduser('~'), '.cache', 'FootballArticlesGenerator', 'plans')
+
+    def __init__(self, directory: str = DEFAULT_DIRECTORY, max_size: int = mc.MatchCache.DEFAULT_MAX_SIZE):
+        """
+        Initializes cache in the given directory (directory is created when needed).
+        :param directory: Directory where cached plans are stored.
+        :param max_size: Maximal size of the cache in bytes.
+        """
+        super().__init__(directory=directory, max_size=max_size)
+
+
+class PlanCache:
+    """Class handling in-process LRU cache of DocumentPlan objects with optional on-disk tier.
+    Key of the plan is created from the fingerprint of the match and from every other input of the planning,
+    plans of the match are invalidated when the match changes (or explicitly by invalidate).
+    """
+
+    # version of the plan format - change it whenever the document planner changes, old entries are then ignored
+    VERSION = 1
+    DEFAULT_MAX_ENTRIES = 128
+
+    max_entries: int
+    disk: PlanDiskCache
+    hits: int
+    disk_hits: int
+    misses: int
+    __plans: 'OrderedDict[str, Tuple[str, dp.DocumentPlan]]'   # key -> (match key, plan)
+    __fingerprints: Dict[str, str]     # match key -> fingerprint of the last planned state of the match
+    __match_plans: Dict[str, Set[str]]   # match key -> keys of the plans of the match kept in memory
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, disk: PlanDiskCache = None):
+        """
+        Initializes empty cache.
+        :param max_entries: Maximal number of plans kept in memory (matches without any plan in memory are forgotten).
+        :param disk: On-disk tier of the cache (None means plans are kept only in memory).
+        """
+        self.max_entries = max_entries
+        self.disk = disk
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.__plans = OrderedDict()
+        self.__fingerprints = {}
+        self.__match_plans = {}
+
+    @staticmethod
+    def get_key(fingerprint: str, match_statistics: ss.MatchStatistics = None, budget: dp.PlanBudget = None,
+                aggregate: bool = False) -> str:
+        """
+        Creates key of the plan from the fingerprint of the match and the other inputs of the planning.
+        :param fingerprint: Fingerprint of the match (MatchFingerprint.get_fingerprint).
+        :param match_statistics: Season statistics of the match (None means no season statistics).
+        :param budget: Limits of the length of the article (None means no limits).
+        :param aggregate: Bool value whether the messages are aggregated.
+        :return: Key as hexadecimal string.
+        """
+        statistics = [(s.player_goals, s.player_yellow_cards) for s in match_statistics.incidents] \
+            if match_statistics is not None else None
+        limits = (budget.max_messages, budget.max_characters) if budget is not None else None
+
+        content = json.dumps([fingerprint, statistics, limits, aggregate], separators=(',', ':'))
+        return hashlib.sha256(content.encode('utf-8')).hexdigest() + '-' + str(PlanCache.VERSION)
+
+    def get_plan(self, match_data: Data.Match, match_statistics: ss.MatchStatistics = None,
+                 budget: dp.PlanBudget = None, aggregate: bool = False, fingerprint: str = None) -> dp.DocumentPlan:
+        """
+        Returns cached plan of the match, plan is created by DocumentPlanner (and cached) if it is not cached yet.
+        :param match_data: Data.Match
+        :param match_statistics: Season statistics of the match (None means no season statistics).
+        :param budget: Limits of the length of the article (None means every incident is mentioned).
+        :param aggregate: Bool value whether the messages are aggregated.
+        :param fingerprint: Already computed fingerprint of the match (computed if None).
+        :return: DocumentPlan
+        """
+        match_key = mf.MatchFingerprint.get_key(match_data)
+        if fingerprint is None:
+            fingerprint = mf.MatchFingerprint.get_fingerprint(match_data)
+        if self.__fingerprints.get(match_key, fingerprint) != fingerprint:
+            self.invalidate(match_data)   # the match has changed, its old plans are never used again
+        self.__fingerprints[match_key] = fingerprint
+
+        key = PlanCache.get_key(fingerprint, match_statistics, budget, aggregate)
+        if key in self.__plans:
+            self.__plans.move_to_end(key)
+            self.hits += 1
+            return self.__plans[key][1]
+
+        doc_plan: dp.DocumentPlan = self.disk.get(key) if self.disk is not None else None
+        if doc_plan is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            doc_plan = dp.DocumentPlanner.plan_document(match_data, match_statistics, budget, aggregate)
+            if self.disk is not None:
+                self.disk.put(key, doc_plan)
+
+        self.__put(match_key, key, doc_plan)
+        return doc_plan
+
+    def invalidate(self, match_data: Data.Match):
+        """
+        Removes every cached plan of the match kept in memory (from memory and disk), e.g. when the match has changed.
+        Plans already evicted from memory stay on disk until the disk cache evicts them, they are keyed by
+        the fingerprint, so they are never used for the changed match.
+        :param match_data: Data.Match
+        """
+        match_key = mf.MatchFingerprint.get_key(match_data)
+        for key in self.__match_plans.pop(match_key, set()):
+            self.__plans.pop(key, None)
+            if self.disk is not None:
+                self.disk.remove(key)
+        self.__fingerprints.pop(match_key, None)
+
+    def clear(self):
+        """Removes every cached plan (from memory and disk) and resets the counters."""
+        self.__plans.clear()
+        self.__fingerprints.clear()
+        self.__match_plans.clear()
+        if self.disk is not None:
+            self.disk.clear()
+        self.hits = self.disk_hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__plans)
+
+    def __str__(self) -> str:
+        return f'Plan cache: {self.hits} hits, {self.disk_hits} disk hits, {self.misses} misses'
+
+    def __put(self, match_key: str, key: str, doc_plan: dp.DocumentPlan):
+        """Stores the plan in memory, least recently used plan is evicted when the cache is full.
+        Match whose last plan is evicted is forgotten as well, so that the cache stays bounded in service mode."""
+        self.__plans[key] = (match_key, doc_plan)
+        self.__match_plans.setdefault(match_key, set()).add(key)
+        while len(self.__plans) > self.max_entries:
+            (evicted_key, (evicted_match_key, _)) = self.__plans.popitem(last=False)
+            match_plans: Set[str] = self.__match_plans[evicted_match_key]
+            match_plans.discard(evicted_key)
+            if len(match_plans) == 0:
+                del self.__match_plans[evicted_match_key]
+                self.__fingerprints.pop(evicted_match_key, None)
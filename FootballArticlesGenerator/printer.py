@@ -35,12 +35,13 @@ class Printer:
         print(' OVERVIEW:')
         Printer.__print_top_border()
         Printer.__print_header(doc_plan.title)
-        Printer.__print_half_time_header(1)
+        timeline: Data.ScoreTimeline = doc_plan.timeline
+        Printer.__print_half_time_header(1, timeline.half_time_score if timeline is not None else None)
 
         half_time_printed = False
-        for msg in doc_plan.body:
-            if msg.time.base > 45 and not half_time_printed:
-                Printer.__print_half_time_header(2)
+        for msg in Printer.__get_incident_messages(doc_plan.body):
+            if not half_time_printed and not msg.time.is_first_half():
+                Printer.__print_half_time_header(2, timeline.second_half_score if timeline is not None else None)
                 half_time_printed = True
             Printer.__print_message(msg)
             Printer.__print_empty_line()
@@ -49,17 +50,36 @@ class Printer:
         print()
 
     @staticmethod
-    def __print_half_time_header(ht: int):
+    def __get_incident_messages(body: List[dp.Message]) -> List[dp.Message]:
+        """
+        Auxiliary function for overview print - splits compound messages, so that every incident has its own line.
+        :param body: Body of the document plan.
+        :return: List of messages in order of the incidents.
+        """
+        messages: List[dp.Message] = []
+        for msg in body:
+            if type(msg) == dp.Message.MultipleSubstitution:
+                messages += msg.substitutions
+            elif type(msg) == dp.Message.MultipleGoal:
+                messages += msg.goals
+            else:
+                messages.append(msg)
+        return sorted(messages, key=lambda m: m.time)   # goals of compound message may be after other messages
+
+    @staticmethod
+    def __print_half_time_header(ht: int, score: Data.Score):
         """
         Auxiliary function for overview print - prints half time header.
         :param ht: Number of half
+        :param score: Goals scored in the half (None if unknown).
         """
         print(Printer.BORDER_SIDE + (Printer.LINE_WIDTH - 2) * Printer.HEADER_TOP + Printer.BORDER_SIDE)
         text = '2nd HALF'
         if ht == 1:
             text = '1st HALF'
-        space_count = Printer.LINE_WIDTH - 2 - 2 - len(text)
-        print(Printer.BORDER_SIDE + '  ' + text + space_count * ' ' + Printer.BORDER_SIDE)
+        score_text = f'{score.goals_home} - {score.goals_away}  ' if score is not None else ''
+        space_count = Printer.LINE_WIDTH - 2 - 2 - len(text) - len(score_text)
+        print(Printer.BORDER_SIDE + '  ' + text + space_count * ' ' + score_text + Printer.BORDER_SIDE)
         print(Printer.BORDER_SIDE + (Printer.LINE_WIDTH - 2) * Printer.HEADER_TOP + Printer.BORDER_SIDE)
 
     @staticmethod
@@ -165,6 +185,10 @@ class Printer:
             return 'SUBSTITUTION'
         elif type(msg) == dp.Message.MissedPenalty:
             return 'MISSED PENALTY'
+        elif type(msg) == dp.Message.SeasonGoal:
+            return f'{msg.goal_count}. GOAL OF THE SEASON'
+        elif type(msg) == dp.Message.Suspension:
+            return f'{msg.yellow_card_count}. YELLOW CARD OF THE SEASON - SUSPENSION'
         else:
             pass
 
@@ -175,15 +199,16 @@ class Printer:
         :param msg: Message
         :return: Name of the player
         """
-        if type(msg) == dp.Message.Card or type(msg) == dp.Message.MissedPenalty:
-            return msg.participant.get_short_name()
+        if type(msg) == dp.Message.Card or type(msg) == dp.Message.MissedPenalty \
+                or type(msg) == dp.Message.SeasonGoal or type(msg) == dp.Message.Suspension:
+            return msg.participant.short_name
         elif type(msg) == dp.Message.Goal:
             if msg.goal_type == Types.Goal.ASSISTANCE:
-                return msg.participant.get_short_name() + ' (' + msg.assistance.get_short_name() + ')'
+                return msg.participant.short_name + ' (' + msg.assistance.short_name + ')'
             else:
-                return msg.participant.get_short_name()
+                return msg.participant.short_name
         elif type(msg) == dp.Message.Substitution:
-            return '(out) ' + msg.participant_out.get_short_name() + ' <-> (in) ' + msg.participant_in.get_short_name()
+            return '(out) ' + msg.participant_out.short_name + ' <-> (in) ' + msg.participant_in.short_name
         else:
             pass
 
@@ -6,23 +6,116 @@ import os
 from os.path import exists
 # Other parts of the code
 import articles_generator as ag
+import data_initializer as di
+import match_cache as mc
+import season_store as ss
+import season_statistics as st
+import match_fingerprint as mf
+import document_planner as dp
+import plan_cache as pc
 
 
 def run(args):
     """Main function to run the whole article generator with correct arguments."""
-    ag.generate_articles(file_name=args.match_data, short_output=args.short_output, text_count=args.text_count, key=args.key)
+    cache: mc.MatchCache = mc.MatchCache()
+    fingerprints: mf.FingerprintStore = mf.FingerprintStore()
+    plan_disk_cache: pc.PlanDiskCache = pc.PlanDiskCache()
+    plan_cache: pc.PlanCache = pc.PlanCache(disk=plan_disk_cache if args.plan_cache else None)
+    if args.clear_cache:
+        cache.clear()
+        fingerprints.clear()
+        plan_cache.clear()
+        if plan_cache.disk is None:   # plans stored on disk by the earlier runs with -p
+            plan_disk_cache.clear()
+    if args.no_cache:
+        cache = None
+    if not args.skip_unchanged:
+        fingerprints = None
+    statistics: st.SeasonStatistics = st.SeasonStatistics() if args.season_statistics else None
+    budget: dp.PlanBudget = None
+    if args.max_messages is not None or args.max_characters is not None:
+        budget = dp.PlanBudget.create(max_messages=args.max_messages, max_characters=args.max_characters)
 
-
-def positive_integer(n):
-    """Controls the requirement for positive integer."""
     try:
-        number = int(n)
-        if number <= 0:
-            raise argparse.ArgumentTypeError("Number of texts to generate must be a positive integer.")
-        return number
+        if args.season_store is not None:
+            with ss.SeasonStore(args.season_store) as store:
+                if args.import_matches is not None:
+                    for result in store.import_files(args.import_matches):
+                        if result.error is not None:
+                            message = result.error.message if isinstance(result.error, di.FileFormatEx) \
+                                else repr(result.error)
+                            print(f'{result.file_name}: {message}')
+                    return
+
+                matches = store.find_matches(team=id_or_name(args.team), player=id_or_name(args.player),
+                                             tournament_name=args.tournament, time_from=args.since, time_to=args.until,
+                                             lazy_lineups=args.lazy_lineups)
+                ag.generate_articles(file_name=matches, short_output=args.short_output, text_count=args.text_count,
+                                     key=args.key, statistics=statistics, fingerprints=fingerprints, budget=budget,
+                                     plan_cache=plan_cache)
+        elif args.match_array is not None:
+            matches = di.DataInitializer.init_matches_data_array(args.match_array, lazy_lineups=args.lazy_lineups)
+            ag.generate_articles(file_name=matches, short_output=args.short_output, text_count=args.text_count,
+                                 key=args.key, statistics=statistics, fingerprints=fingerprints, budget=budget,
+                                 plan_cache=plan_cache)
+        elif args.match_stream is not None:
+            matches = di.DataInitializer.init_matches_data_stream(args.match_stream, lazy_lineups=args.lazy_lineups)
+            ag.generate_articles(file_name=matches, short_output=args.short_output, text_count=args.text_count,
+                                 key=args.key, statistics=statistics, fingerprints=fingerprints, budget=budget,
+                                 plan_cache=plan_cache)
+        elif args.match_dir is not None:
+            ag.generate_articles_bulk(match_files=args.match_dir, short_output=args.short_output,
+                                      text_count=args.text_count, key=args.key, workers=args.workers, cache=cache,
+                                      statistics=statistics, fingerprints=fingerprints, budget=budget,
+                                      plan_cache=plan_cache)
+        else:
+            ag.generate_articles(file_name=args.match_data, short_output=args.short_output, text_count=args.text_count, key=args.key, cache=cache, statistics=statistics, budget=budget, plan_cache=plan_cache, lazy_lineups=args.lazy_lineups)
+    finally:   # fingerprints are saved once at the end of the run (even when the run is interrupted)
+        if fingerprints is not None:
+            fingerprints.flush()
+
+    if not args.short_output and plan_cache.hits + plan_cache.disk_hits + plan_cache.misses > 0:
+        print(plan_cache)
+
+
+def id_or_name(value):
+    """Converts id given as command line argument to integer, name stays string."""
+    return int(value) if value is not None and value.isdigit() else value
+
+
+def positive_integer(message: str):
+    """
+    Creates control of the requirement for positive integer.
+    :param message: Error message when the argument is not a positive integer.
+    :return: function converting the argument to positive integer
+    """
+    def __positive_integer(n):
+        try:
+            number = int(n)
+            if number <= 0:
+                raise argparse.ArgumentTypeError(message)
+            return number
+
+        except ValueError:
+            raise argparse.ArgumentTypeError(message)
 
-    except ValueError:
-        raise argparse.ArgumentTypeError("Number of texts to generate must be a positive integer.")
+    return __positive_integer
+
+
+def existing_files(files):
+    """Controls the requirement for directory or glob pattern matching at least one JSON file."""
+    if di.DataInitializer.get_match_files(files):
+        return files
+    else:
+        raise argparse.ArgumentTypeError("No JSON file found. Please select directory or pattern with JSON files.")
+
+
+def existing_stream(file):
+    """Controls the requirement for existing JSON Lines file or standard input."""
+    if file == '-' or exists(file):
+        return file
+    else:
+        raise argparse.ArgumentTypeError("File does not exist. Please select existing file or '-' for standard input.")
 
 
 def existing_file(file):
@@ -36,9 +129,30 @@ def existing_file(file):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("-m", "--match_data", default="..\MatchData\example_match.json", type=existing_file, help="Defines JSON file with match data (default=example_match).")
-    parser.add_argument("-c", "--text_count", default=3, type=positive_integer, help="Changes number of generated texts (default=3).")
+    parser.add_argument("-d", "--match_dir", default=None, type=existing_files, help="Defines directory (or glob pattern) with JSON files - generates articles for every match (overrides -m).")
+    parser.add_argument("-s", "--match_stream", default=None, type=existing_stream, help="Defines JSON Lines file (one match per line, '-' for standard input) - generates articles for every match (overrides -m and -d).")
+    parser.add_argument("-a", "--match_array", default=None, type=existing_stream, help="Defines JSON file with one array of matches ('-' for standard input) - file is read incrementally and articles are generated for every match (overrides -m, -d and -s).")
+    parser.add_argument("-b", "--season_store", default=None, type=str, help="Defines SQLite file of season store - generates articles for every stored match selected by --team, --player, --tournament, --since and --until (overrides -m, -d, -s and -a).")
+    parser.add_argument("-i", "--import_matches", default=None, type=existing_files, help="Imports directory (or glob pattern) with JSON files into season store given by -b (no articles are generated).")
+    parser.add_argument("--team", default=None, type=str, help="Selects matches of the team (id or name) from season store.")
+    parser.add_argument("--player", default=None, type=str, help="Selects matches of the player (id or full name) from season store.")
+    parser.add_argument("--tournament", default=None, type=str, help="Selects matches of the tournament (e.g. \"1. Liga 2018/2019\") from season store.")
+    parser.add_argument("--since", default=None, type=str, help="Selects matches starting at the given time or later (e.g. 2018-11-01) from season store.")
+    parser.add_argument("--until", default=None, type=str, help="Selects matches starting at the given day or earlier (e.g. 2018-11-30) from season store.")
+    parser.add_argument("-t", "--season_statistics", action='store_true', help="Keeps season statistics of players over the generated matches (in order of their start with -b) and mentions them in the articles (e.g. first goal of the season).")
+    parser.add_argument("-l", "--lazy_lineups", action='store_true', help="Creates players of the lineups only when they are needed (e.g. by incidents), saves time and memory with many matches (-s, -a and -b).")
+    parser.add_argument("-w", "--workers", default=None, type=positive_integer("Number of worker processes must be a positive integer."), help="Changes number of processes parsing JSON files with -d (default=number of processors).")
+    parser.add_argument("-n", "--no_cache", action='store_true', help="Bypasses cache of already parsed match files (-m and -d) - every file is parsed again.")
+    parser.add_argument("-f", "--skip_unchanged", action='store_true', help="Skips matches unchanged since their articles were generated last time (used with -d, -s, -a and -b).")
+    parser.add_argument("-p", "--plan_cache", action='store_true', help="Keeps document plans of the matches on disk as well, so that unchanged matches are not planned again even after restart (plans are always cached in memory).")
+    parser.add_argument("--clear_cache", action='store_true', help="Clears cache of already parsed match files, cache of document plans and fingerprints of already generated matches before running.")
+    parser.add_argument("--max_messages", default=None, type=positive_integer("Budget of the article must be a positive integer."), help="Mentions only the most important incidents, at most the given number of sentences in the article body (e.g. for push notifications).")
+    parser.add_argument("--max_characters", default=None, type=positive_integer("Budget of the article must be a positive integer."), help="Mentions only the most important incidents fitting the given estimated number of characters of the article body.")
+    parser.add_argument("-c", "--text_count", default=3, type=positive_integer("Number of texts to generate must be a positive integer."), help="Changes number of generated texts (default=3).")
     parser.add_argument("-o", "--short_output", action='store_true', help="Prints detailed output. If missing, prints only result articles.")
     parser.add_argument("-k", "--key", default=os.getenv('GENJA_API_KEY'), type=str, help="Sets authorization key for Genja API.")
 
     args_ = parser.parse_args([] if "__file__" not in globals() else None)
+    if args_.import_matches is not None and args_.season_store is None:
+        parser.error("argument -i/--import_matches: requires season store given by -b.")
     run(args_)
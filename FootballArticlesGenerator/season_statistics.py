@@ -0,0 +1,160 @@
+"""Index of season statistics (running tallies of players and teams) built incrementally from the matches
+of the season.
+Statistics let the document planner mention facts across matches, e.g. first goal of the season of the player.
+"""
+
+# Python's libraries
+from typing import Dict, List, Tuple
+from dataclasses import dataclass
+
+# Other parts of the code
+import Types
+import Data
+import match_fingerprint as mf
+
+
+@Data.add_slots
+@dataclass(frozen=True)
+class IncidentStatistics:
+    """Data class to store season statistics of the participant and its team right after the incident."""
+    player_goals: int          # goals of the participant in the season (this goal included)
+    player_yellow_cards: int   # yellow cards of the participant in the season (this card included)
+    team_goals: int            # goals of the team in the season (own goals of the opponents included)
+    team_cards: int            # cards of the team in the season (every type of card)
+
+    @staticmethod
+    def create(player_goals: int, player_yellow_cards: int, team_goals: int, team_cards: int):
+        """
+        Creates immutable instance of IncidentStatistics.
+        :param player_goals: Number of goals of the participant in the season.
+        :param player_yellow_cards: Number of yellow cards of the participant in the season.
+        :param team_goals: Number of goals of the team in the season.
+        :param team_cards: Number of cards of the team in the season.
+        :return: IncidentStatistics
+        """
+        return IncidentStatistics(player_goals=player_goals, player_yellow_cards=player_yellow_cards,
+                                  team_goals=team_goals, team_cards=team_cards)
+
+
+@Data.add_slots
+@dataclass(frozen=True)
+class MatchStatistics:
+    """Data class to store season statistics for every incident of one match."""
+    incidents: List[IncidentStatistics]   # statistics on the same index as the incident in Data.Match.incidents
+
+    @staticmethod
+    def create(incidents: List[IncidentStatistics]):
+        """
+        Creates immutable instance of MatchStatistics.
+        :param incidents: Statistics of every incident of the match.
+        :return: MatchStatistics
+        """
+        return MatchStatistics(incidents=incidents)
+
+
+class SeasonStatistics:
+    """Class storing running tallies of every player and every team in the season.
+    Matches have to be added in the order they were played (e.g. SeasonStore.find_matches).
+    Every match is counted only once (identified by MatchFingerprint.get_key) - unchanged match added again
+    (e.g. resent by live feed) returns its stored statistics, changed match replaces its earlier contribution.
+    """
+
+    YELLOW_CARDS_SUSPENSION = 5   # every fifth yellow card in the season means suspension for the next match
+
+    __player_goals: Dict[int, int]
+    __player_yellow_cards: Dict[int, int]
+    __team_goals: Dict[int, int]
+    __team_cards: Dict[int, int]
+    # match key -> (fingerprint, statistics of the match, increments of the tallies made by the match)
+    __matches: Dict[str, Tuple[str, MatchStatistics, List[Tuple[Dict[int, int], int]]]]
+    match_count: int
+
+    def __init__(self):
+        self.__player_goals = {}
+        self.__player_yellow_cards = {}
+        self.__team_goals = {}
+        self.__team_cards = {}
+        self.__matches = {}
+        self.match_count = 0
+
+    def add_match(self, match_data: Data.Match, fingerprint: str = None) -> MatchStatistics:
+        """
+        Adds every incident of the match into the tallies. Match already added is not counted again - its stored
+        statistics are returned if it is unchanged, its earlier contribution is replaced otherwise.
+        :param match_data: Data.Match (played after every already added match)
+        :param fingerprint: Already computed fingerprint of the match (computed if None).
+        :return: MatchStatistics - season statistics right after every incident of the match
+        """
+        if fingerprint is None:
+            fingerprint = mf.MatchFingerprint.get_fingerprint(match_data)
+        key = mf.MatchFingerprint.get_key(match_data)
+
+        if key in self.__matches:
+            (old_fingerprint, old_statistics, old_increments) = self.__matches[key]
+            if old_fingerprint == fingerprint:
+                return old_statistics
+            for (tally, id_) in old_increments:   # removing earlier contribution of the changed match
+                tally[id_] -= 1
+                if tally[id_] == 0:
+                    del tally[id_]
+        else:
+            self.match_count += 1
+
+        increments: List[Tuple[Dict[int, int], int]] = []
+        match_statistics = MatchStatistics.create([self.__add_incident(inc, increments)
+                                                   for inc in match_data.incidents])
+        self.__matches[key] = (fingerprint, match_statistics, increments)
+        return match_statistics
+
+    def __add_incident(self, inc: Data.Incident, increments: List[Tuple[Dict[int, int], int]]) -> IncidentStatistics:
+        """
+        Adds incident into the tallies of its participant and its team (incident without participant or team
+        is not counted for them).
+        :param inc: Data.Incident
+        :param increments: Increments of the tallies made by the match (every increment is appended).
+        :return: IncidentStatistics of the participant and its team after the incident
+        """
+
+        def increment(tally: Dict[int, int], id_: int):
+            tally[id_] = tally.get(id_, 0) + 1
+            increments.append((tally, id_))
+
+        player_id = inc.participant.id if inc.participant is not None else None
+        team_id = inc.team.id if inc.team is not None else None   # team of the own goal is the scoring team
+
+        if type(inc) is Data.Incident.Goal or (type(inc) is Data.Incident.Penalty and inc.scored):
+            if team_id is not None:
+                increment(self.__team_goals, team_id)
+            if player_id is not None and (type(inc) is Data.Incident.Penalty or inc.goal_type != Types.Goal.OWN_GOAL):
+                increment(self.__player_goals, player_id)
+        elif type(inc) is Data.Incident.Card:
+            if team_id is not None:
+                increment(self.__team_cards, team_id)
+            if player_id is not None and inc.card_type == Types.Card.YELLOW:
+                increment(self.__player_yellow_cards, player_id)
+
+        return IncidentStatistics.create(player_goals=self.__player_goals.get(player_id, 0),
+                                         player_yellow_cards=self.__player_yellow_cards.get(player_id, 0),
+                                         team_goals=self.__team_goals.get(team_id, 0),
+                                         team_cards=self.__team_cards.get(team_id, 0))
+
+    def get_player_goals(self, player_id: int) -> int:
+        """Returns number of goals of the player in the season (own goals excluded)."""
+        return self.__player_goals.get(player_id, 0)
+
+    def get_player_yellow_cards(self, player_id: int) -> int:
+        """Returns number of yellow cards of the player in the season (second yellow cards excluded)."""
+        return self.__player_yellow_cards.get(player_id, 0)
+
+    def get_team_goals(self, team_id: int) -> int:
+        """Returns number of goals of the team in the season (own goals of the opponents included)."""
+        return self.__team_goals.get(team_id, 0)
+
+    def get_team_cards(self, team_id: int) -> int:
+        """Returns number of cards of the team in the season (every type of card)."""
+        return self.__team_cards.get(team_id, 0)
+
+    @staticmethod
+    def is_suspension(yellow_cards: int) -> bool:
+        """Returns whether the player with the given number of yellow cards is suspended for the next match."""
+        return yellow_cards > 0 and yellow_cards % SeasonStatistics.YELLOW_CARDS_SUSPENSION == 0
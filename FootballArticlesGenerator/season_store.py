@@ -0,0 +1,190 @@
+"""Local store of the whole season (or more seasons) of matches backed by SQLite database.
+Matches are stored as the original json data together with indexed columns (teams, players, time_start,
+tournament_name), so that matches can be selected by query without opening every json file.
+"""
+
+# Python's libraries
+import sqlite3
+from typing import Iterator, List, Union
+
+# Other parts of the code
+import Data
+import data_initializer as di
+import json_backend as jb
+
+
+class SeasonStore:
+    """Class handling SQLite database of matches.
+    Matches are imported from json files (same format as for DataInitializer) in batched transactions
+    and selected back as Data.Match by query.
+    """
+
+    DEFAULT_BATCH_SIZE = 500   # number of matches imported in one transaction
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS matches (
+            id INTEGER PRIMARY KEY,
+            url TEXT UNIQUE,
+            time_start TEXT,
+            tournament_name TEXT,
+            data BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS matches_time_start ON matches (time_start);
+        CREATE INDEX IF NOT EXISTS matches_tournament_name ON matches (tournament_name);
+
+        CREATE TABLE IF NOT EXISTS match_teams (
+            match_id INTEGER NOT NULL REFERENCES matches (id) ON DELETE CASCADE,
+            team_id INTEGER NOT NULL,
+            team_name TEXT NOT NULL,
+            PRIMARY KEY (match_id, team_id)
+        );
+        CREATE INDEX IF NOT EXISTS match_teams_team_id ON match_teams (team_id);
+        CREATE INDEX IF NOT EXISTS match_teams_team_name ON match_teams (team_name);
+
+        CREATE TABLE IF NOT EXISTS match_players (
+            match_id INTEGER NOT NULL REFERENCES matches (id) ON DELETE CASCADE,
+            player_id INTEGER NOT NULL,
+            player_name TEXT,
+            PRIMARY KEY (match_id, player_id)
+        );
+        CREATE INDEX IF NOT EXISTS match_players_player_id ON match_players (player_id);
+        CREATE INDEX IF NOT EXISTS match_players_player_name ON match_players (player_name);
+    """
+
+    file_name: str
+    __connection: sqlite3.Connection
+
+    def __init__(self, file_name: str):
+        """
+        Opens the database (database with every table and index is created when needed).
+        :param file_name: Name of the SQLite database file.
+        """
+        self.file_name = file_name
+        self.__connection = sqlite3.connect(file_name)
+        self.__connection.execute('PRAGMA foreign_keys = ON')
+        self.__connection.executescript(SeasonStore.SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Closes the database."""
+        self.__connection.close()
+
+    def import_files(self, match_files: str, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[di.MatchFileResult]:
+        """
+        Imports every json file from directory (or glob pattern) into the store.
+        Files are imported in transactions of batch_size matches, match with the same url as already stored match
+        replaces it. File that can not be parsed is reported and skipped.
+        :param match_files: Directory with json files or glob pattern.
+        :param batch_size: Number of matches imported in one transaction.
+        :return: Iterator of results (match_data is imported Data.Match or error that occurred) in order of files.
+        """
+        cursor = self.__connection.cursor()
+        count = 0
+        try:
+            for file_name in di.DataInitializer.get_match_files(match_files):
+                try:
+                    with open(file_name, 'rb') as file:
+                        content = file.read()
+                    json_match_data: dict = jb.JsonBackend.loads(content)
+                    match_data: Data.Match = di.DataInitializer.init_match_data_from_dict(json_match_data)
+                    SeasonStore.__insert_match(cursor, json_match_data, match_data, content)
+                except (di.FileFormatEx, OSError) as e:
+                    yield di.MatchFileResult.create(file_name=file_name, match_data=None, error=e)
+                    continue
+                except ValueError:   # invalid json
+                    yield di.MatchFileResult.create(file_name=file_name, match_data=None, error=di.FileFormatEx())
+                    continue
+
+                count += 1
+                if count % batch_size == 0:
+                    self.__connection.commit()
+                yield di.MatchFileResult.create(file_name=file_name, match_data=match_data, error=None)
+        finally:
+            self.__connection.commit()
+
+    @staticmethod
+    def __insert_match(cursor: sqlite3.Cursor, json_match_data: dict, match_data: Data.Match, content: bytes):
+        """
+        Inserts one match (with its teams and players) - match with the same url is replaced.
+        :param cursor: Cursor of the current transaction.
+        :param json_match_data: json file with data as Python's dictionary
+        :param match_data: Data.Match initialized from json_match_data
+        :param content: Original content of the json file.
+        """
+        url = json_match_data.get('url')
+        if url is not None:
+            cursor.execute('DELETE FROM matches WHERE url = ?', (url,))   # teams and players are deleted as well
+
+        cursor.execute('INSERT INTO matches (url, time_start, tournament_name, data) VALUES (?, ?, ?, ?)',
+                       (url, json_match_data.get('time_start'), json_match_data.get('tournament_name'), content))
+        match_id = cursor.lastrowid
+
+        teams: List[Data.Team] = [match_data.team_home, match_data.team_away]
+        cursor.executemany('INSERT OR IGNORE INTO match_teams (match_id, team_id, team_name) VALUES (?, ?, ?)',
+                           [(match_id, t.id, t.name) for t in teams])
+        cursor.executemany('INSERT OR IGNORE INTO match_players (match_id, player_id, player_name) VALUES (?, ?, ?)',
+                           [(match_id, p.id, p.full_name) for t in teams for p in t.lineup])
+
+    def find_matches(self, team: Union[int, str] = None, player: Union[int, str] = None, tournament_name: str = None,
+                     time_from: str = None, time_to: str = None, lazy_lineups: bool = False) -> Iterator[Data.Match]:
+        """
+        Selects matches satisfying every given condition (None means no condition), ordered by time_start.
+        Matches are initialized lazily - one match at a time.
+        :param team: Id (int) or name (str) of the team which played the match.
+        :param player: Id (int) or full name (str) of the player in the lineup of the match.
+        :param tournament_name: Name of the tournament (e.g. 1. Liga 2018/2019).
+        :param time_from: Minimal time_start of the match (ISO format, e.g. 2018-11-01).
+        :param time_to: Maximal time_start of the match (ISO format, e.g. 2018-11-30), whole day is included.
+        :param lazy_lineups: Whether players of the lineups are created only when they are needed (Data.LazyLineup).
+        :return: Iterator of Data.Match
+        """
+        (query, parameters) = SeasonStore.__create_query(team=team, player=player, tournament_name=tournament_name,
+                                                         time_from=time_from, time_to=time_to)
+        for (data,) in self.__connection.execute(query, parameters):
+            yield di.DataInitializer.init_match_data_from_dict(jb.JsonBackend.loads(data), lazy_lineups=lazy_lineups)
+
+    def count_matches(self, team: Union[int, str] = None, player: Union[int, str] = None,
+                      tournament_name: str = None, time_from: str = None, time_to: str = None) -> int:
+        """
+        Returns number of matches satisfying every given condition. Parameters are the same as in find_matches.
+        :return: number of matches
+        """
+        (query, parameters) = SeasonStore.__create_query(team=team, player=player, tournament_name=tournament_name,
+                                                         time_from=time_from, time_to=time_to)
+        return self.__connection.execute(f'SELECT COUNT(*) FROM ({query})', parameters).fetchone()[0]
+
+    @staticmethod
+    def __create_query(team: Union[int, str], player: Union[int, str], tournament_name: str,
+                       time_from: str, time_to: str) -> (str, list):
+        """
+        Creates SQL query selecting json data of the matches. Parameters are the same as in find_matches.
+        :return: tuple of query and its parameters
+        """
+        conditions: List[str] = []
+        parameters: list = []
+
+        if team is not None:
+            column = 'team_id' if isinstance(team, int) else 'team_name'
+            conditions.append(f'id IN (SELECT match_id FROM match_teams WHERE {column} = ?)')
+            parameters.append(team)
+        if player is not None:
+            column = 'player_id' if isinstance(player, int) else 'player_name'
+            conditions.append(f'id IN (SELECT match_id FROM match_players WHERE {column} = ?)')
+            parameters.append(player)
+        if tournament_name is not None:
+            conditions.append('tournament_name = ?')
+            parameters.append(tournament_name)
+        if time_from is not None:
+            conditions.append('time_start >= ?')
+            parameters.append(time_from)
+        if time_to is not None:
+            conditions.append('time_start <= ?')
+            parameters.append(time_to + '\uffff')   # time_to without time of the day includes the whole day
+
+        where = ' WHERE ' + ' AND '.join(conditions) if conditions else ''
+        return f'SELECT data FROM matches{where} ORDER BY time_start, id', parameters
@@ -5,9 +5,9 @@ Input is document plan and match data, output is string that can be an input of
 
 # Python's libraries
 import random
-from typing import List, Tuple, Union
+from typing import List, Tuple, Union, Dict, Mapping, Callable, Optional, ClassVar
 from dataclasses import dataclass
-import copy
+from types import MappingProxyType
 # Other parts of the code
 import Types
 import document_planner as dp
@@ -16,18 +16,33 @@ import Data
 
 @dataclass(frozen=True)
 class MorphParams:
-    """Class to transform linguistic requirements into Geneea well-build input. """
+    """Class to transform linguistic requirements into Geneea well-build input.
+    Instances are interned per morph string and the Geneea markup is rendered only once, when they are created.
+    """
     case: Types.Morph.Case
     tense: Types.Morph.Tense
     gender: Types.Morph.Gender
     ref: None
     agr: None
+    suffix: Optional[str]   # rendered markup following the constituent (None means the constituent stays plain)
+
+    __interned: ClassVar[Dict[str, 'MorphParams']] = {}   # morph string -> MorphParams
 
     @staticmethod
     def create(string_id: str):
-        params: (Types.Morph.Case, Types.Morph.Tense, Types.Morph.Gender, str, str) \
-            = MorphParams.__get_morph_params(string_id)
-        return MorphParams(case=params[0], tense=params[1], gender=params[2], ref=params[3], agr=params[4])
+        """
+        Returns MorphParams of the string id, instance is created only for the first occurrence of the string.
+        :param string_id: Id string (e.g. '1-.-0-.-.').
+        :return: MorphParams
+        """
+        morph_params = MorphParams.__interned.get(string_id)
+        if morph_params is None:
+            params: (Types.Morph.Case, Types.Morph.Tense, Types.Morph.Gender, str, str) \
+                = MorphParams.__get_morph_params(string_id)
+            morph_params = MorphParams(case=params[0], tense=params[1], gender=params[2], ref=params[3],
+                                       agr=params[4], suffix=MorphParams.__render_suffix(*params))
+            MorphParams.__interned[string_id] = morph_params
+        return morph_params
 
     @staticmethod
     def __get_morph_params(string_id: str) -> (Types.Morph.Case, Types.Morph.Tense, Types.Morph.Gender, str, str):
@@ -51,35 +66,34 @@ class MorphParams:
 
             return case, tense, gender, ref, agr
 
-    def apply_to_string(self, constituent: str) -> str:
+    @staticmethod
+    def __render_suffix(case: Types.Morph.Case, tense: Types.Morph.Tense, gender: Types.Morph.Gender,
+                        ref: str, agr: str) -> Optional[str]:
         """
-        Applies morphological attributes and create simple string into well-build string for Geneea API interface.
-        :param constituent: String
-        :return: Geneea string
+        Renders morphological attributes into Geneea markup following the constituent.
+        :return: Markup string or None if every attribute is None.
         """
 
-        header = '{{' + f'\'{constituent}\'|morph('
-
         mp: List[str] = []  # morphological parameters
         all_none = True
 
-        if self.case is not None:
-            mp.append(f'Case={self.case.name.lower().capitalize()}')
+        if case is not None:
+            mp.append(f'Case={case.name.lower().capitalize()}')
             all_none = False
 
-        if self.tense is not None:
-            mp.append(f'Tense={self.tense.name.lower().capitalize()}')
+        if tense is not None:
+            mp.append(f'Tense={tense.name.lower().capitalize()}')
             all_none = False
 
-        if self.gender is not None:
-            if self.gender == Types.Morph.Gender.MascA:
+        if gender is not None:
+            if gender == Types.Morph.Gender.MascA:
                 mp.append("Gender=Masc")
                 mp.append("Animacy=Anim")
-            elif self.gender == Types.Morph.Gender.MascI:
+            elif gender == Types.Morph.Gender.MascI:
                 mp.append("Gender=Masc")
                 mp.append("Animacy=Inan")
             else:   # fem/neut
-                mp.append(f'Gender={self.gender.name.lower().capitalize()}')
+                mp.append(f'Gender={gender.name.lower().capitalize()}')
 
             all_none = False
 
@@ -87,17 +101,25 @@ class MorphParams:
         mp.clear()
         mp.append(morph_params)
 
-        if self.ref is not None:
-            mp.append(f'ref={self.ref}')
+        if ref is not None:
+            mp.append(f'ref={ref}')
             all_none = False
 
-        if self.agr is not None:
-            mp.append(f'agr={self.agr}')
+        if agr is not None:
+            mp.append(f'agr={agr}')
             all_none = False
 
         body = ", ".join(mp)
 
-        return constituent if all_none else header + body + ')}}'
+        return None if all_none else '\'|morph(' + body + ')}}'
+
+    def apply_to_string(self, constituent: str) -> str:
+        """
+        Applies morphological attributes and create simple string into well-build string for Geneea API interface.
+        :param constituent: String
+        :return: Geneea string
+        """
+        return constituent if self.suffix is None else '{{\'' + constituent + self.suffix
 
 
 @dataclass
@@ -105,7 +127,7 @@ class TemplateFrequency:
     """Class to store frequency of every template according to it's string id."""
     id: str
     count: int
-    unused_indices: List[int]   # indices of templates that haven't been used yet
+    unused_indices: List[int]   # indices of templates that haven't been used yet (in no particular order)
     last_used: int
 
     @staticmethod
@@ -119,19 +141,29 @@ class TemplateFrequency:
         unused_indices = [i for i in range(count)]
         return TemplateFrequency(id=id_, count=count, unused_indices=unused_indices, last_used=-1)
 
-    def remove_from_unused_indices(self, chosen_index: int):
+    def choose_unused_index(self) -> int:
         """
-        Removes index from unused indices after using this particular template.
-        :param chosen_index: index, that has just been used.
+        Chooses randomly index of the template that hasn't been used yet and removes it from unused indices
+        in constant time (the last unused index is moved to its position).
+        :return: chosen index
         """
+        position = random.randrange(len(self.unused_indices))
+        chosen_index = self.unused_indices[position]
+        self.unused_indices[position] = self.unused_indices[-1]
+        self.unused_indices.pop()
+        return chosen_index
 
-        if self.unused_indices != 0:
-            index = 0
-            while index < len(self.unused_indices):
-                if self.unused_indices[index] == chosen_index:
-                    self.unused_indices.remove(chosen_index)
-                    return   # break the while cycle, if chosen_index found
-                index += 1
+    def choose_index_except_last_used(self, template_count: int) -> int:
+        """
+        Chooses randomly index of any template except the last used, without listing the possible indices
+        (indices after the last used are shifted by one).
+        :param template_count: number of possible templates (at least 2)
+        :return: chosen index
+        """
+        if 0 <= self.last_used < template_count:
+            chosen_index = random.randrange(template_count - 1)
+            return chosen_index + 1 if chosen_index >= self.last_used else chosen_index
+        return random.randrange(template_count)
 
 
 @dataclass(frozen=True)
@@ -172,528 +204,302 @@ class Template:
         return '[id: ' + self.id + ' | string: ' + self.string + "]"
 
 
-class TemplateHandler:
-    """Class for handling template choices systematically.
-    Stores information about used templates in frequency table,
-    which is a list of the auxiliary TemplateFrequency class.
+class TemplateCatalog:
+    """Class storing immutable catalog of every template indexed by template id.
+    Catalog is static (same for every article), so it is built only once per process (TEMPLATE_CATALOG).
+    Words and verbs are stored as complete templates, entities only as shapes - functions creating strings
+    of the templates from the data of the message (e.g. Data.Player).
     """
-    frequency_table: List[TemplateFrequency]
-    previous_msg_time: Data.Time
-
-    def __init__(self):
-        """Initializing frequency table attribute."""
-        # creating every template possible
-        all_templates = TemplateHandler.__init_all_templates()
-        # initializing frequency table from all possible templates
-        self.frequency_table = TemplateHandler.__init_frequency_table(all_templates)
-        self.previous_msg_time = None
-
-    def get_previous_msg_time(self):
-        return self.previous_msg_time
-
-    @staticmethod
-    def __init_all_templates() -> List[Template]:
-        """Initializes every template that could be used."""
-        templates_entities = TemplateHandler.__get_templates_entity(first_init=True, subtype='', data=None)
-        templates_words = TemplateHandler.__get_templates_word(first_init=True, subtype='')
-        templates_verbs = TemplateHandler.__get_templates_verb(first_init=True, subtype='')
-        return templates_entities + templates_verbs + templates_words
+    # strings of word templates according to their subtype
+    WORDS = {
+        'goal': ('gól', 'branka'),
+        'assistance': ('asistence', 'nahrávka', 'přihrávka', 'pas'),
+        'penalty': ('penalta', 'pokutový kop', 'jedenáctka'),
+        'own_goal': ('vlastňák', 'vlastní gól', 'vlastenec'),
+        'yellow_card': ('žlutý', 'žlutá karta'),
+        'red_card': ('červený', 'červená karta'),
+        'draw': ('remíza', 'plichta', 'nerozhodný výsledek'),
+        'lose': ('porážka', 'prohra', 'debakl', 'ostuda'),
+        'win': ('vítězství', 'výhra', 'zdar'),
+        'nice': ('krásný', 'pohledný', 'nádherný', 'pěkný'),
+        'action': ('akce', 'kombinace', 'souhra'),
+    }
+
+    # strings of verb templates according to their subtype
+    VERBS = {
+        'win': ('porazit', 'rozdrtit', 'deklasovat'),
+        'draw': ('remizovat',),
+        'lose': ('prohrát',),
+        'goal': ('vstřelit', 'vsítit', 'dát'),
+        'score_change': ('změnit', 'upravit', 'zvýšit'),
+        'go_ahead': ('změnit', 'upravit'),   # the team takes the lead
+        'equalizer': ('vyrovnat', 'srovnat'),   # the team equalizes
+        'extend_lead': ('zvýšit', 'navýšit'),   # the leading team scores
+        'reduce_deficit': ('snížit', 'korigovat'),   # the losing team scores
+        'penalty': ('proměnit', 'dát'),
+        'failed_penalty': ('zpackat', 'neproměnit', 'nedat'),
+        'substitution': ('střídat', 'vystřídat'),
+        'card': ('dostat', 'obdržet', 'vyfasovat'),
+    }
+
+    # words for small numbers of minutes (1-9) - third case and fourth case
+    SMALL_NUMBERS = {1: ("první minutě", "jednu minutu"), 2: ("druhé minutě", "dvě minuty"),
+                     3: ("třetí minutě", "tři minuty"), 4: ("čtvrté minutě", "čtyři minuty"),
+                     5: ("paté minutě", "pět minut"), 6: ("šesté minutě", "šest minut"),
+                     7: ("sedmé minutě", "sedm minut"), 8: ("osmé minutě", "osm minut"),
+                     9: ("deváté minutě", "devět minut")}
+
+    # words for round numbers of minutes (10-90) - third case and fourth case
+    ROUND_NUMBERS = {10: ("desáté minutě", "deset minut"), 20: ("dvacáté minutě", "dvacet minut"),
+                     30: ("třicáté minutě", "třicet minut"), 40: ("čtyřicáté minutě", "čtyřicet minut"),
+                     50: ("padesáté minutě", "padesát minut"), 60: ("šedesáté minutě", "šedesát minut"),
+                     70: ("sedmdesáté minutě", "sedmdesát minut"), 80: ("osmdesáté minutě", "osmdesát minut"),
+                     90: ("devadesáté minutě", "devadesát minut")}
+
+    templates: Mapping[str, Tuple[Template, ...]]   # templates of words and verbs
+    entity_shapes: Mapping[str, Callable[[object], List[str]]]   # shapes of entity templates
+    counts: Mapping[str, int]   # number of templates of every id (used by frequency table)
+
+    def __init__(self, templates: Dict[str, Tuple[Template, ...]],
+                 entity_shapes: Dict[str, Callable[[object], List[str]]], counts: Dict[str, int]):
+        """
+        Initializes catalog, every mapping is read-only.
+        :param templates: Templates of words and verbs according to their id.
+        :param entity_shapes: Shapes of entity templates according to their id.
+        :param counts: Number of templates of every id.
+        """
+        self.templates = MappingProxyType(templates)
+        self.entity_shapes = MappingProxyType(entity_shapes)
+        self.counts = MappingProxyType(counts)
 
     @staticmethod
-    def __init_frequency_table(all_templates: List[Template]) -> List[TemplateFrequency]:
+    def create():
         """
-        Initializes frequency table using all templates possible.
-        :param all_templates: List of all possible templates.
-        :return: initialized frequency table in form of List[TemplateFrequency]
+        Creates catalog of every template that could be used.
+        :return: TemplateCatalog
         """
+        entity_shapes: Dict[str, Callable[[object], List[str]]] = {}
+        templates: Dict[str, Tuple[Template, ...]] = {}
+        counts: Dict[str, int] = {}
 
-        index = 0
-        ft: List[TemplateFrequency] = []
+        for (subtype, count, shape) in TemplateCatalog.__get_entity_shapes():
+            id_ = Template.create('e', subtype, '').id
+            entity_shapes[id_] = shape
+            counts[id_] = count
 
-        # no sorting is needed since Template initializing is systematical
-        while index + 1 < len(all_templates):
-            (end_index, count) = TemplateHandler.__skip_to_next_template_type(all_templates, index)
-            ft.append(TemplateFrequency.create(all_templates[index].id, count))
-            index += 1
+        for (type_, words) in (('v', TemplateCatalog.VERBS), ('w', TemplateCatalog.WORDS)):
+            for (subtype, strings) in words.items():
+                subtype_templates = tuple(Template.create(type_, subtype, s) for s in strings)
+                templates[subtype_templates[0].id] = subtype_templates
+                counts[subtype_templates[0].id] = len(subtype_templates)
 
-        return ft
+        return TemplateCatalog(templates, entity_shapes, counts)
+
+    def get_templates(self, id_: str, data) -> Tuple[Template, ...]:
+        """
+        Returns every template with the given id.
+        :param id_: String id of the templates.
+        :param data: Data of the entity (e.g. Data.Player), irrelevant for words and verbs.
+        :return: Tuple of templates (empty if there is no template with the id).
+        """
+        shape = self.entity_shapes.get(id_)
+        if shape is not None:
+            return tuple(Template(id_, string) for string in shape(data))
+        elif id_.startswith('e-'):
+            print("Type Unknown")
+        return self.templates.get(id_, ())
 
     @staticmethod
-    def __skip_to_next_template_type(all_templates: List[Template], start_index: int) -> (int, int):
+    def __get_entity_shapes() -> List[Tuple[str, int, Callable[[object], List[str]]]]:
         """
-        Looping through templates of the same id.
-        Takes list of all templates and starting index of the template to count frequency for.
-        :param all_templates: List of all templates.
-        :param start_index:  Start index of the list of all_templates.
-        :return: tuple of ints - index where the same id template ends, count of the template.
+        Returns shapes of entity templates with number of their templates in frequency table.
+        :return: List of tuples - subtype, count, shape.
         """
-        index = start_index
-        count = 1
-        while index + 1 < len(all_templates) and all_templates[index].id == all_templates[index+1].id:
-            index += 1
-            count += 1
+        return [('time', 2, TemplateCatalog.__get_time_strings),   # one more template after 45. minute
+                ('player', 4, TemplateCatalog.__get_player_strings),
+                ('team', 1, lambda team: [team.name]),
+                ('score', 1, lambda score: [f"{score.goals_home}:{score.goals_away}"]),
+                ('count', 1, lambda count: [f"{count}."]),
+                ('times', 1, TemplateCatalog.__get_times_strings),
+                ('goals', 1, TemplateCatalog.__get_goals_strings),
+                ('substitution_count', 1, TemplateCatalog.__get_substitution_count_strings),
+                ('substitutions', 2, TemplateCatalog.__get_substitutions_strings)]
 
-        return index, count
+    @staticmethod
+    def __get_time_strings(time: Data.Time) -> List[str]:
+        """Auxiliary function to create strings of time templates."""
+        get_words = TemplateCatalog.__get_words_for_minutes
+        if time.added != 0:
+            if time.base == 45:  # first half
+                return [f"v {get_words(time.added, True)} nastavení prvního poločasu",
+                        f"{get_words(time.added, False)} po začátku nastaveného času prvního poločasu"]
+            else:  # second half
+                return [f"v {get_words(time.added, True)} nastavení druhého poločasu",
+                        f"{get_words(time.added, False)} po začátku nastaveného času druhého poločasu"]
+
+        strings = [f"v {get_words(time.base, True)}",
+                   f"{get_words(time.base, False)} po začátku"]
+        if time.base > 45:
+            strings.append(f"{get_words(time.base - 45, False)} po začátku druhého poločasu")
+        return strings
 
     @staticmethod
-    def __get_templates_entity(first_init: bool, subtype: str, data) -> List[Template]:
-        """
-        Creates templates that can lexicalize entities.
-        :param first_init: bool value if it is first initialization - if True, initialize every single entity template.
-        (and also the rest of the arguments are then irrelevant)
-        :param subtype: subtype (e.g. 'goal').
-        :param data: correct data entity (e.g. for initializing it is Data.Player, for time Data.Time, etc.).
-        :return: List of entity templates.
-        """
-
-        def __init_time_templates():
-            """Auxiliary function to create time templates."""
-            def get_words_for_minutes(minute: int, dativ: bool) -> str:
-                """
-                Function transforms number of minutes suitably into a well-built expression.
-                :param minute: number of minute that need to be expressed
-                :param dativ: if the expression needs fourth(False) or third(True) case
-                :return: string expression that describes number of minutes
-                """
-                if minute >= 10 and minute % 10 != 0:
-                    return get_numerals_as_text(minute, dativ)
-                elif minute < 10:
-                    return transform_small_numbers(minute, dativ)
-                elif minute % 10 == 0:
-                    return transform_round_numbers(minute, dativ)
-                else:  # should not occur
-                    pass
-
-            def get_numerals_as_text(minute: int, dativ: bool) -> str:
-                """
-                Function connects the word minute with the number in a correct form.
-                :param minute: number of minute that need to be expressed
-                :param dativ: if the expression needs fourth(False) or third(True) case
-                :return: string expression that describes number of minutes
-                """
-                if dativ:
-                    return str(minute) + ". " + "minutě"
-                else:
-                    return str(minute) + " " + "minut"
-
-            def transform_small_numbers(minute: int, dativ: bool) -> str:
-                """
-                Transforms samll numbers (1-9) to an expression consisting only words (no numbers).
-                :param minute: number of minute that need to be expressed
-                :param dativ: if the expression needs fourth(False) or third(True) case
-                :return: string expression that describes number of minutes
-                """
-                ret_val = ""
-                if minute == 1:
-                    ret_val = "první minutě" if dativ else "jednu minutu"
-                elif minute == 2:
-                    ret_val = "druhé minutě" if dativ else "dvě minuty"
-                elif minute == 3:
-                    ret_val = "třetí minutě" if dativ else "tři minuty"
-                elif minute == 4:
-                    ret_val = "čtvrté minutě" if dativ else "čtyři minuty"
-                elif minute == 5:
-                    ret_val = "paté minutě" if dativ else "pět minut"
-                elif minute == 6:
-                    ret_val = "šesté minutě" if dativ else "šest minut"
-                elif minute == 7:
-                    ret_val = "sedmé minutě" if dativ else "sedm minut"
-                elif minute == 8:
-                    ret_val = "osmé minutě" if dativ else "osm minut"
-                elif minute == 9:
-                    ret_val = "deváté minutě" if dativ else "devět minut"
-                else:   # should not occur
-                    pass
-
-                return ret_val
-
-            def transform_round_numbers(minute: int, dativ: bool) -> str:
-                """
-                Transforms round number with a chance of 50% to an expression consisting only words (no numbers).
-                :param minute: number of minute that need to be expressed
-                :param dativ: if the expression needs fourth(False) or third(True) case
-                :return: string expression that describes number of minutes
-                """
-
-                ret_val = ""
-                if minute == 10:
-                    ret_val = "desáté minutě" if dativ else "deset minut"
-                elif minute == 20:
-                    ret_val = "dvacáté minutě" if dativ else "dvacet minut"
-                elif minute == 30:
-                    ret_val = "třicáté minutě" if dativ else "třicet minut"
-                elif minute == 40:
-                    ret_val = "čtyřicáté minutě" if dativ else "čtyřicet minut"
-                elif minute == 50:
-                    ret_val = "padesáté minutě" if dativ else "padesát minut"
-                elif minute == 60:
-                    ret_val = "šedesáté minutě" if dativ else "šedesát minut"
-                elif minute == 70:
-                    ret_val = "sedmdesáté minutě" if dativ else "sedmdesát minut"
-                elif minute == 80:
-                    ret_val = "osmdesáté minutě" if dativ else "osmdesát minut"
-                elif minute == 90:
-                    ret_val = "devadesáté minutě" if dativ else "devadesát minut"
-                else:   # should not occur
-                    pass
-
-                if random.randint(0, 1) == 1:
-                    return ret_val
-                else:
-                    return get_numerals_as_text(minute, dativ)
-
-            entity_type = 'time'
-            time: Data.Time = data
-
-            if first_init:
-                time = Data.Time.create(0, 0)    # creating random time for first_init
-
-            if time.added != 0:  #
-                if time.base == 45:  # first half
-                    templates.append(Template.create(type_, entity_type,
-                                                     f"v {get_words_for_minutes(time.added, True) if data is not None else ''} "
-                                                     f"nastavení prvního poločasu"))
-                    templates.append(Template.create(type_, entity_type,
-                                                     f"{get_words_for_minutes(time.added, False) if data is not None else ''} "
-                                                     f"po začátku nastaveného času prvního poločasu"))
-                else:  # second half
-                    templates.append(Template.create(type_, entity_type,
-                                                     f"v {get_words_for_minutes(time.added, True) if data is not None else ''} "
-                                                     f"nastavení druhého poločasu"))
-                    templates.append(Template.create(type_, entity_type,
-                                                     f"{get_words_for_minutes(time.added, False) if data is not None else ''} "
-                                                     f"po začátku nastaveného času druhého poločasu"))
-            else:
-                templates.append(Template.create(type_, entity_type,
-                                                 f"v {get_words_for_minutes(time.base, True) if data is not None else ''}"))
-
-                templates.append(Template.create(type_, entity_type,
-                                                 f"{get_words_for_minutes(time.base, False) if data is not None else ''} po začátku"))
-
-                if time.base > 45:
-                    templates.append(Template.create(type_, entity_type,
-                                                 f"{get_words_for_minutes(time.base-45, False) if data is not None else ''} "
-                                                 f"po začátku druhého poločasu"))
-
-        def __init_player_templates():
-            """Auxiliary function to create player templates."""
-            entity_type = 'player'
-            player: Data.Player = data
-
-            templates.append(Template.create(type_, entity_type,
-                                             player.full_name if data is not None else ''))
-            templates.append(Template.create(type_, entity_type,
-                                             player.get_full_name_reversed() if data is not None else ''))
-            templates.append(Template.create(type_, entity_type,
-                                             player.get_last_name() if data is not None else ''))
-            templates.append(Template.create(type_, entity_type,
-                                             f"hráč s číslem {player.number if data is not None else ''}"))
-
-        def __init_team_templates():
-            """Auxiliary function to create team templates."""
-            entity_type = 'team'
-            team: Data.Team = data
-
-            templates.append(Template.create(type_, entity_type,
-                                             team.name if data is not None else ''))
-
-        def __init_score_templates():
-            """Auxiliary function to create score templates."""
-            entity_type = 'score'
-            score: Data.Score = data
-
-            templates.append(Template.create(type_, entity_type,
-                                             f"{score.goals_home if data is not None else ''}:"
-                                             f"{score.goals_away if data is not None else ''}"))
-
-        type_ = 'e'
-        templates: List[Template] = []
-
-        if first_init:   # initializing every template when first init
-            __init_time_templates()
-            __init_player_templates()
-            __init_team_templates()
-            __init_score_templates()
-            return templates
-
-        # initializing only templates needed for given subtype
-        if subtype == 'time':
-            __init_time_templates()
-        elif subtype == 'player':
-            __init_player_templates()
-        elif subtype == 'team':
-            __init_team_templates()
-        elif subtype == 'score':
-            __init_score_templates()
+    def __get_words_for_minutes(minute: int, dativ: bool) -> str:
+        """
+        Function transforms number of minutes suitably into a well-built expression.
+        :param minute: number of minute that need to be expressed
+        :param dativ: if the expression needs fourth(False) or third(True) case
+        :return: string expression that describes number of minutes
+        """
+        if minute >= 10 and minute % 10 != 0:
+            return TemplateCatalog.__get_numerals_as_text(minute, dativ)
+        elif minute < 10:
+            return TemplateCatalog.__transform_small_numbers(minute, dativ)
+        elif minute % 10 == 0:
+            return TemplateCatalog.__transform_round_numbers(minute, dativ)
+        else:  # should not occur
+            pass
+
+    @staticmethod
+    def __get_numerals_as_text(minute: int, dativ: bool) -> str:
+        """
+        Function connects the word minute with the number in a correct form.
+        :param minute: number of minute that need to be expressed
+        :param dativ: if the expression needs fourth(False) or third(True) case
+        :return: string expression that describes number of minutes
+        """
+        if dativ:
+            return str(minute) + ". " + "minutě"
         else:
-            print("Type Unknown")
+            return str(minute) + " " + "minut"
 
-        return templates
+    @staticmethod
+    def __transform_small_numbers(minute: int, dativ: bool) -> str:
+        """
+        Transforms small numbers (1-9) to an expression consisting only words (no numbers).
+        :param minute: number of minute that need to be expressed
+        :param dativ: if the expression needs fourth(False) or third(True) case
+        :return: string expression that describes number of minutes
+        """
+        words = TemplateCatalog.SMALL_NUMBERS.get(minute)
+        return (words[0] if dativ else words[1]) if words is not None else ""
 
     @staticmethod
-    def __get_templates_word(first_init: bool, subtype: str) -> List[Template]:
-        """
-        Creates templates that can lexicalize certain words.
-        :param first_init: bool value if it is first initialization - if True, initialize every single entity template.
-        (and also the rest of the arguments are then irrelevant)
-        :param subtype: subtype of the word as string.
-        :return: List of word templates.
-        """
-
-        def __init_goal_templates():
-            """Auxiliary function to create goal templates."""
-            word_type = 'goal'
-            templates.append(Template.create(type_, word_type, 'gól'))
-            templates.append(Template.create(type_, word_type, 'branka'))
-
-        def __init_assistance_templates():
-            """Auxiliary function to create assistance templates."""
-            word_type = 'assistance'
-            templates.append(Template.create(type_, word_type, 'asistence'))
-            templates.append(Template.create(type_, word_type, 'nahrávka'))
-            templates.append(Template.create(type_, word_type, 'přihrávka'))
-            templates.append(Template.create(type_, word_type, 'pas'))
-
-        def __init_penalty_templates():
-            """Auxiliary function to create penalty templates."""
-            word_type = 'penalty'
-            templates.append(Template.create(type_, word_type, 'penalta'))
-            templates.append(Template.create(type_, word_type, 'pokutový kop'))
-            templates.append(Template.create(type_, word_type, 'jedenáctka'))
-
-        def __init_own_goal_templates():
-            """Auxiliary function to create own goal templates."""
-            word_type = 'own_goal'
-            templates.append(Template.create(type_, word_type, 'vlastňák'))
-            templates.append(Template.create(type_, word_type, 'vlastní gól'))
-            templates.append(Template.create(type_, word_type, 'vlastenec'))
-
-        def __init_yellow_card_templates():
-            """Auxiliary function to create yellow card templates."""
-            word_type = 'yellow_card'
-            templates.append(Template.create(type_, word_type, 'žlutý'))
-            templates.append(Template.create(type_, word_type, 'žlutá karta'))
-
-        def __init_red_card_templates():
-            """Auxiliary function to create red card templates."""
-            word_type = 'red_card'
-            templates.append(Template.create(type_, word_type, 'červený'))
-            templates.append(Template.create(type_, word_type, 'červená karta'))
-
-        def __init_result_draw_templates():
-            """Auxiliary function to create result(draw) templates."""
-            word_type = 'draw'
-            templates.append(Template.create(type_, word_type, 'remíza'))
-            templates.append(Template.create(type_, word_type, 'plichta'))
-            templates.append(Template.create(type_, word_type, 'nerozhodný výsledek'))
-
-        def __init_result_lose_templates():
-            """Auxiliary function to create result(lose) templates."""
-            word_type = 'lose'
-            templates.append(Template.create(type_, word_type, 'porážka'))
-            templates.append(Template.create(type_, word_type, 'prohra'))
-            templates.append(Template.create(type_, word_type, 'debakl'))
-            templates.append(Template.create(type_, word_type, 'ostuda'))
-
-        def __init_result_win_templates():
-            """Auxiliary function to create result(win) templates."""
-            word_type = 'win'
-            templates.append(Template.create(type_, word_type, 'vítězství'))
-            templates.append(Template.create(type_, word_type, 'výhra'))
-            templates.append(Template.create(type_, word_type, 'zdar'))
-
-        def __init_nice_templates():
-            """Auxiliary function to create nice (adjective) templates."""
-            word_type = 'nice'
-            templates.append(Template.create(type_, word_type, 'krásný'))
-            templates.append(Template.create(type_, word_type, 'pohledný'))
-            templates.append(Template.create(type_, word_type, 'nádherný'))
-            templates.append(Template.create(type_, word_type, 'pěkný'))
-
-        def __init_action_templates():
-            """Auxiliary function to create action templates."""
-            word_type = 'action'
-            templates.append(Template.create(type_, word_type, 'akce'))
-            templates.append(Template.create(type_, word_type, 'kombinace'))
-            templates.append(Template.create(type_, word_type, 'souhra'))
-
-        type_ = 'w'
-        templates: List[Template] = []
-
-        if first_init:   # initializing every template when first init
-            __init_goal_templates()
-            __init_assistance_templates()
-            __init_penalty_templates()
-            __init_own_goal_templates()
-            __init_yellow_card_templates()
-            __init_red_card_templates()
-            __init_result_draw_templates()
-            __init_result_lose_templates()
-            __init_result_win_templates()
-            __init_nice_templates()
-            __init_action_templates()
-            return templates
-
-        # initializing only templates needed for given subtype
-        if subtype == 'goal':
-            __init_goal_templates()
-        elif subtype == 'assistance':
-            __init_assistance_templates()
-        elif subtype == 'penalty':
-            __init_penalty_templates()
-        elif subtype == 'own_goal':
-            __init_own_goal_templates()
-        elif subtype == 'yellow_card':
-            __init_yellow_card_templates()
-        elif subtype == 'red_card':
-            __init_red_card_templates()
-        elif subtype == 'draw':
-            __init_result_draw_templates()
-        elif subtype == 'lose':
-            __init_result_lose_templates()
-        elif subtype == 'win':
-            __init_result_win_templates()
-        elif subtype == 'nice':
-            __init_nice_templates()
-        elif subtype == 'action':
-            __init_action_templates()
+    def __transform_round_numbers(minute: int, dativ: bool) -> str:
+        """
+        Transforms round number with a chance of 50% to an expression consisting only words (no numbers).
+        :param minute: number of minute that need to be expressed
+        :param dativ: if the expression needs fourth(False) or third(True) case
+        :return: string expression that describes number of minutes
+        """
+        words = TemplateCatalog.ROUND_NUMBERS.get(minute)
+        ret_val = (words[0] if dativ else words[1]) if words is not None else ""
+
+        if random.randint(0, 1) == 1:
+            return ret_val
         else:
-            pass
+            return TemplateCatalog.__get_numerals_as_text(minute, dativ)
 
-        return templates
+    @staticmethod
+    def __get_player_strings(player: Data.Player) -> List[str]:
+        """Auxiliary function to create strings of player templates."""
+        return [player.full_name, player.full_name_reversed, player.last_name, f"hráč s číslem {player.number}"]
 
     @staticmethod
-    def __get_templates_verb(first_init: bool, subtype: str) -> List[Template]:
-        """
-        Creates templates that can lexicalize certain verbs.
-        :param first_init: bool value if it is first initialization - if True, initialize every single entity template.
-        (and also the rest of the arguments are then irrelevant)
-        :param subtype: subtype of the verb as string.
-        :return: List of verb templates.
-        """
-
-        def __init_result_win_templates():
-            """Auxiliary function to create win templates."""
-            verb_type = 'win'
-            templates.append(Template.create(type_, verb_type, 'porazit'))
-            templates.append(Template.create(type_, verb_type, 'rozdrtit'))
-            templates.append(Template.create(type_, verb_type, 'deklasovat'))
-
-        def __init_result_draw_templates():
-            """Auxiliary function to create draw templates."""
-            verb_type = 'draw'
-            templates.append(Template.create(type_, verb_type, 'remizovat'))
-
-        def __init_result_lose_templates():
-            """Auxiliary function to create lose templates."""
-            verb_type = 'lose'
-            templates.append(Template.create(type_, verb_type, 'prohrát'))
-
-        def __init_goal_templates():
-            """Auxiliary function to create goal templates."""
-            verb_type = 'goal'
-            templates.append(Template.create(type_, verb_type, 'vstřelit'))
-            templates.append(Template.create(type_, verb_type, 'vsítit'))
-            templates.append(Template.create(type_, verb_type, 'dát'))
-
-        def __init_score_change_templates():
-            """Auxiliary function to create change of score templates."""
-            verb_type = 'score_change'
-            templates.append(Template.create(type_, verb_type, 'změnit'))
-            templates.append(Template.create(type_, verb_type, 'upravit'))
-            templates.append(Template.create(type_, verb_type, 'zvýšit'))
-
-        def __init_penalty_templates():
-            """Auxiliary function to create penalty templates."""
-            verb_type = 'penalty'
-            templates.append(Template.create(type_, verb_type, 'proměnit'))
-            templates.append(Template.create(type_, verb_type, 'dát'))
-
-        def __init_failed_penalty_templates():
-            """Auxiliary function to create failed penalty templates."""
-            verb_type = 'failed_penalty'
-            templates.append(Template.create(type_, verb_type, 'zpackat'))
-            templates.append(Template.create(type_, verb_type, 'neproměnit'))
-            templates.append(Template.create(type_, verb_type, 'nedat'))
-
-        def __init_substitution_templates():
-            """Auxiliary function to create substitution templates."""
-            verb_type = 'substitution'
-            templates.append(Template.create(type_, verb_type, 'střídat'))
-            templates.append(Template.create(type_, verb_type, 'vystřídat'))
-
-        def __init_card_templates():
-            """Auxiliary function to create card templates."""
-            verb_type = 'card'
-            templates.append(Template.create(type_, verb_type, 'dostat'))
-            templates.append(Template.create(type_, verb_type, 'obdržet'))
-            templates.append(Template.create(type_, verb_type, 'vyfasovat'))
-
-        type_ = 'v'
-        templates: List[Template] = []
-
-        if first_init:   # initializing every template when first init
-            __init_result_win_templates()
-            __init_result_draw_templates()
-            __init_result_lose_templates()
-            __init_goal_templates()
-            __init_score_change_templates()
-            __init_penalty_templates()
-            __init_failed_penalty_templates()
-            __init_substitution_templates()
-            __init_card_templates()
-            return templates
-
-        # initializing only templates needed for given subtype
-        if subtype == 'win':
-            __init_result_win_templates()
-        elif subtype == 'draw':
-            __init_result_draw_templates()
-        elif subtype == 'lose':
-            __init_result_lose_templates()
-        elif subtype == 'goal':
-            __init_goal_templates()
-        elif subtype == 'score_change':
-            __init_score_change_templates()
-        elif subtype == 'penalty':
-            __init_penalty_templates()
-        elif subtype == 'failed_penalty':
-            __init_failed_penalty_templates()
-        elif subtype == 'substitution':
-            __init_substitution_templates()
-        elif subtype == 'card':
-            __init_card_templates()
-        else:
-            pass
+    def __get_times_strings(times: List[Data.Time]) -> List[str]:
+        """Auxiliary function to create strings of templates of more times (e.g. goals of one player)."""
+        ordinals = [f"{t.base}." if t.added == 0 else f"{t.base}.+{t.added}." for t in times]
+        return [f"v {', '.join(ordinals[:-1])} a {ordinals[-1]} minutě"]
+
+    @staticmethod
+    def __get_goals_strings(count: int) -> List[str]:
+        """Auxiliary function to create strings of templates of number of goals (cardinal number with noun)."""
+        words = {2: 'dva góly', 3: 'tři góly', 4: 'čtyři góly'}
+        return [words.get(count, f"{count} gólů")]
 
-        return templates
+    @staticmethod
+    def __get_substitution_count_strings(count: int) -> List[str]:
+        """Auxiliary function to create strings of templates of number of substitutions (multiplicative numeral)."""
+        words = {2: 'dvakrát', 3: 'třikrát', 4: 'čtyřikrát'}
+        return [words.get(count, f"{count}krát")]
 
     @staticmethod
-    def __get_possible_templates(id_: str, explicit_data: Types.ExplicitEntityData, msg: dp.Message) -> List[Template]:
+    def __get_substitutions_strings(substitutions: List[dp.Message.Substitution]) -> List[str]:
+        """Auxiliary function to create strings of templates of list of substitutions (already in Geneea format)."""
+
+        def get_list(get_name) -> str:
+            pairs = [MorphParams.create('1-.-0-.-.').apply_to_string(get_name(s.participant_in)) + ' za ' +
+                     MorphParams.create('4-.-0-.-.').apply_to_string(get_name(s.participant_out))
+                     for s in substitutions]
+            return ', '.join(pairs[:-1]) + ' a ' + pairs[-1]
+
+        return [get_list(lambda p: p.last_name), get_list(lambda p: p.full_name)]
+
+
+TEMPLATE_CATALOG: TemplateCatalog = TemplateCatalog.create()
+
+
+class TemplateHandler:
+    """Class for handling template choices systematically.
+    Templates are taken from the catalog, the handler stores only information about templates used
+    in the article in frequency table, which maps template id to the auxiliary TemplateFrequency class.
+    """
+    catalog: TemplateCatalog
+    frequency_table: Dict[str, TemplateFrequency]
+    previous_msg_time: Data.Time
+
+    def __init__(self, catalog: TemplateCatalog = TEMPLATE_CATALOG):
+        """
+        Initializing frequency table attribute.
+        :param catalog: Catalog of every template (default is TEMPLATE_CATALOG).
+        """
+        self.catalog = catalog
+        self.frequency_table = {id_: TemplateFrequency.create(id_, count) for (id_, count) in catalog.counts.items()}
+        self.previous_msg_time = None
+
+    def get_previous_msg_time(self):
+        return self.previous_msg_time
+
+    def __get_possible_templates(self, id_: str, explicit_data: Types.ExplicitEntityData,
+                                 msg: dp.Message) -> Tuple[Template, ...]:
         """
         Returns list of all possible templates given information about the cosnstituent.
         :param id_: String id of the templates.
         :param explicit_data: Type of explicit entity date (needed only for entity).
         :param msg: Message
-        :return: List of all possible templates.
+        :return: Tuple of all possible templates.
         """
 
         constituent_type: str = id_.split('-')[0]
-        subtype: str = id_.split('-')[1]
-        possibilities: List[Template] = []
+        data = None
 
         if constituent_type == 'e':  # ENTITY
             # data variable only used when const_type is entity
             data = TemplateHandler.__get_msg_data(explicit_data, msg)
-            possibilities = TemplateHandler.__get_templates_entity(first_init=False, subtype=subtype, data=data)
-        elif constituent_type == 'w':  # WORD
-            possibilities = TemplateHandler.__get_templates_word(first_init=False, subtype=subtype)
-        elif constituent_type == 'v':  # VERB
-            possibilities = TemplateHandler.__get_templates_verb(first_init=False, subtype=subtype)
-        else:
-            pass
+        elif id_ == 'v-score_change':   # verb is chosen according to the score timeline
+            id_ = 'v-' + TemplateHandler.__get_score_change_subtype(msg)
+
+        return self.catalog.get_templates(id_, data)
 
-        return possibilities
+    @staticmethod
+    def __get_score_change_subtype(msg: dp.Message) -> str:
+        """
+        Returns subtype of the verb expressing what the goal did with the score.
+        :param msg: Message.Goal
+        :return: subtype of the verb template (general score_change if the goal is not in the score timeline)
+        """
+
+        score_event: Data.ScoreEvent = getattr(msg, 'score_event', None)
+        if score_event is None:
+            return 'score_change'
+        elif score_event.change == Types.ScoreChange.GO_AHEAD:
+            return 'go_ahead'
+        elif score_event.change == Types.ScoreChange.EQUALIZER:
+            return 'equalizer'
+        elif score_event.change == Types.ScoreChange.EXTEND_LEAD:
+            return 'extend_lead'
+        else:
+            return 'reduce_deficit'
 
     def get_template(self, id_: str, explicit_data: Types.ExplicitEntityData, msg: dp.Message) -> Template:
         """
@@ -704,13 +510,13 @@ class TemplateHandler:
         :return: picked Template
         """
 
-        possibilities = TemplateHandler.__get_possible_templates(id_, explicit_data, msg)
+        possibilities = self.__get_possible_templates(id_, explicit_data, msg)
         chosen_template = self.__choose_template(possibilities)
         if not type(msg) == dp.Message.Result:
             self.previous_msg_time = msg.time
         return chosen_template
 
-    def __choose_template(self, possibilities: List[Template]) -> Template:
+    def __choose_template(self, possibilities: Tuple[Template, ...]) -> Template:
         """
         Chooses template from all possible templates using this algorithm:
         1) if we haven't used every template - pick one randomly
@@ -732,32 +538,25 @@ class TemplateHandler:
 
         if len(freq.unused_indices) != 0:
             # when there are non used templates left, choose one from them randomly
-            chosen_index = random.choice(freq.unused_indices)
+            chosen_index = freq.choose_unused_index()
         else:
             # when every template is already used, choose one from all existing randomly except last used
             if len(possibilities) == 1:  # only one option
                 chosen_index = 0
             else:
-                possible_indices = []
-                for i in range(len(possibilities)):   # extracting possible indices - every except the last_used
-                    if i != freq.last_used:
-                        possible_indices.append(i)
-                chosen_index = random.choice(possible_indices)
+                chosen_index = freq.choose_index_except_last_used(len(possibilities))
 
         freq.last_used = chosen_index   # change last used to currently chosen
-        freq.remove_from_unused_indices(chosen_index)   # update unused_indices
         return possibilities[chosen_index]
 
     def __get_template_frequency(self, id_: str) -> TemplateFrequency:
         """
         Returns wanted record from frequency table.
         :param id_: template's string id
-        :return: TemplateFrequency
+        :return: TemplateFrequency (None if there is no template with the id)
         """
 
-        for f in self.frequency_table:
-            if f.id == id_:
-                return f
+        return self.frequency_table.get(id_)
 
     @staticmethod
     def __get_msg_data(explicit_data: Types.ExplicitEntityData, msg: dp.Message):
@@ -786,49 +585,58 @@ class TemplateHandler:
             return msg.team_home
         elif explicit_data == Types.ExplicitEntityData.TEAM_AWAY:
             return msg.team_away
+        elif explicit_data == Types.ExplicitEntityData.GOAL_COUNT:
+            return msg.goal_count
+        elif explicit_data == Types.ExplicitEntityData.YELLOW_CARD_COUNT:
+            return msg.yellow_card_count
+        elif explicit_data == Types.ExplicitEntityData.TEAM:
+            return msg.team
+        elif explicit_data == Types.ExplicitEntityData.TIMES:
+            return msg.times
+        elif explicit_data == Types.ExplicitEntityData.SUBSTITUTIONS:
+            return msg.substitutions
+        elif explicit_data == Types.ExplicitEntityData.SUBSTITUTION_COUNT:
+            return msg.substitution_count
         else:
             pass
 
 
 class Constituent:
     """Class to represent sentence constituent.
-    After lexicalization and picking template for this constituent, it can result in more than one word."""
+    After lexicalization and picking template for this constituent, it can result in more than one word.
+    Constituent is shared by every article (SENTENCE_CATALOG), so lexicalization does not change it."""
     id: str
     morph_params: MorphParams
     explicit_data: Types.ExplicitEntityData   # used just for entity constituents
-    string: str   # lexicalized language specific expression
 
     def __init__(self, id_: str, morph_params: str, explicit_data: Types.ExplicitEntityData):
         self.id = id_
         self.morph_params = MorphParams.create(morph_params)
         self.explicit_data = explicit_data
-        self.string = ''
 
-    def lexicalize(self, msg: dp.Message, template_handler: TemplateHandler):
+    def lexicalize(self, msg: dp.Message, template_handler: TemplateHandler) -> str:
         """
-        Lexicalizes constituent.
+        Lexicalizes constituent and transforms lexicalized string into Geneea input using it's morphological
+        parameters.
         :param msg: Message
         :param template_handler: TemplateHandler that will take care of picking suitable template
+        :return: string for Geneea API
         """
-        self.string = template_handler.get_template(self.id, self.explicit_data, msg).string
-
-    def transform_string_for_geneea(self):
-        """Transforms lexicalized string into Geneea input using it's morphological parameters."""
-        self.string = MorphParams.apply_to_string(self.morph_params, self.string)
+        string = template_handler.get_template(self.id, self.explicit_data, msg).string
+        return MorphParams.apply_to_string(self.morph_params, string)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Sentence:
-    """Class to represent sentence."""
+    """Class to represent sentence (shared by every article, message is bound to it by SentenceBinding)."""
     id: str
     simple: bool
-    constituents: List[Union[str, Constituent]]   # constituent can be string or class Constituent (later lexicalized)
-    msg: dp.Message
+    constituents: Tuple[Union[str, Constituent], ...]   # constituent can be string or class Constituent
 
     @staticmethod
     def create(type_: str, subtype: str, simple: bool, constituents: List[Union[str, Constituent]]):
         """
-        Creates instance of the Sentence given it's attributes.
+        Creates immutable instance of the Sentence given it's attributes.
         :param type_: type of the sentence
         :param subtype: subtype of the sentence
         :param simple: bool flag that signalizes if structure of the sentence is simple (simple=True). Otherwise
@@ -837,7 +645,7 @@ class Sentence:
         :return: Sentence
         """
         id_ = Sentence.__init_sentence_id(type_, subtype)
-        return Sentence(id=id_, simple=simple, constituents=constituents, msg=None)
+        return Sentence(id=id_, simple=simple, constituents=tuple(constituents))
 
     @staticmethod
     def __init_sentence_id(type_: str, subtype: str) -> str:
@@ -852,44 +660,28 @@ class Sentence:
             subtype = d + subtype
         return 's' + d + type_ + subtype
 
-    def __eq__(self, other):
-        return self.id == other.id
-
-    def __lt__(self, other):
-        return self.id < other.id
-
-    def lexicalize(self, template_handler: TemplateHandler) -> str:
+    def lexicalize(self, msg: dp.Message, template_handler: TemplateHandler) -> str:
         """
         Lexicalizing whole sentence and also transforming strings into well-build Geneea input.
+        :param msg: Message expressed by the sentence
         :param template_handler: current Template handler
         :return: string for Geneea API
         """
         # lexicalizing every constituent of the sentence
         # using template handler to assign templates for constituents not randomly
-        for c in self.constituents:
-            if type(c) is Constituent:
-                c.lexicalize(self.msg, template_handler)
+        words: List[str] = [c.lexicalize(msg, template_handler) if type(c) is Constituent else c
+                            for c in self.constituents]
 
-        # transforming every constituent string for string version as correct Geneea input
-        for c in self.constituents:
-            if type(c) is Constituent:
-                c.transform_string_for_geneea()
+        return Sentence.__combine_to_string(words)
 
-        return self.__combine_to_string()
-
-    def __combine_to_string(self) -> str:
+    @staticmethod
+    def __combine_to_string(words: List[str]) -> str:
         """
         Combines every constituent of the sentence and creating one string.
         First letter of the sentence is upper case, spaces between constituents, point in the end of the sentence.
+        :param words: Strings of every constituent of the sentence.
         :return: Sentence string.
         """
-        words: List[str] = []
-        for c in self.constituents:
-            if type(c) is Constituent:
-                words.append(c.string)
-            else:
-                words.append(c)
-
         # first letter is upper case
         i = 0
         while not words[0][i].isalpha() and i != len(words[0]):
@@ -899,69 +691,65 @@ class Sentence:
         return ' '.join(words) + '.'
 
 
-class SentenceHandler:
-    """
-    Class for handling assigning and picking suitable sentences for messages.
-    """
-    sentences: List[Sentence]
-    used_sentences: List[Sentence]
+@dataclass(frozen=True)
+class SentenceBinding:
+    """Class binding sentence of the catalog to the message it expresses in the article."""
+    sentence: Sentence
+    msg: dp.Message
 
-    def __init__(self):
-        # when initializing new SentenceHandler we initialize all possible sentences
-        self.sentences = SentenceHandler.__init_all_sentences()
-        self.used_sentences = []
+    @staticmethod
+    def create(sentence: Sentence, msg: dp.Message):
+        """
+        Creates immutable instance of SentenceBinding.
+        :param sentence: Sentence
+        :param msg: Message expressed by the sentence
+        :return: SentenceBinding
+        """
+        return SentenceBinding(sentence=sentence, msg=msg)
 
-    def __find_next_simple(self, start_index: int) -> int:
+    def lexicalize(self, template_handler: TemplateHandler) -> str:
         """
-        In the list of all possible sentences (must be SORTED) we find next simple sentence of the same id.
-        Since at least one simple exists for each sentence id, we have to find a sentence.
-        :param start_index: index of sentences where to start the iteration for finding simple sentence
-        :return: Index of the next simple sentence.
+        Lexicalizing the sentence with data of the message.
+        :param template_handler: current Template handler
+        :return: string for Geneea API
         """
-        index = start_index
-        while not self.sentences[index].simple:
-            index += 1
+        return self.sentence.lexicalize(self.msg, template_handler)
 
-        return index
 
-    def __swap(self, index1: int, index2: int):
+class SentenceCatalog:
+    """Class storing immutable catalog of every sentence bucketed by sentence id.
+    Catalog is static (same for every article), so it is built only once per process (SENTENCE_CATALOG).
+    """
+    buckets: Mapping[str, Tuple[Sentence, ...]]   # sentences of every sentence id
+
+    def __init__(self, buckets: Dict[str, Tuple[Sentence, ...]]):
         """
-        Swaps two sentences in sentence list given their indices.
-        :param index1: Index of the first sentence to swap.
-        :param index2: Index of the second sentence to swap.
+        Initializes catalog, mapping of buckets is read-only.
+        :param buckets: Sentences according to their id.
         """
-        tmp = self.sentences[index1]
-        self.sentences[index1] = self.sentences[index2]
-        self.sentences[index2] = tmp
+        self.buckets = MappingProxyType(buckets)
 
-    def __skip_to_next_sentence_type(self, start_index: int) -> int:
+    @staticmethod
+    def create():
         """
-        Looping through sentences of the same id until new id of the sentence is found.
-        :param start_index:  Start index of the list of sentences.
-        :return: Index where the same sentence id ends.
+        Creates catalog of every sentence that could be used.
+        :return: SentenceCatalog
         """
-        index = start_index
-        while index + 1 < len(self.sentences) and self.sentences[index] == self.sentences[index + 1]:
-            index += 1
-        return index + 1
+        buckets: Dict[str, List[Sentence]] = {}
+        for sentence in SentenceCatalog.__init_all_sentences():
+            buckets.setdefault(sentence.id, []).append(sentence)
+        return SentenceCatalog({id_: tuple(bucket) for (id_, bucket) in buckets.items()})
 
-    def __put_simple_first(self):
-        """Ensures to put simple version of the sentence first for every sentence id."""
-        index = 0
-        while index + 1 < len(self.sentences):
-            if not self.sentences[index].simple:    # if there is not simple version already on the first index
-                simple_index = self.__find_next_simple(index)
-                self.__swap(index, simple_index)
-            index = self.__skip_to_next_sentence_type(index)
-
-    def __randomize_sentences_order(self):
-        """Randomizes order of the sentences following certain rules."""
-        random.shuffle(self.sentences)    # shuffle sentences to make sure sentences order will vary
-        self.sentences.sort()             # sort sentences so that they are grouped by id
-        self.__put_simple_first()           # put simple version first for every sentence id group
+    def get_sentences(self, id_: str) -> Tuple[Sentence, ...]:
+        """
+        Returns every sentence with the given id.
+        :param id_: String id of the sentence.
+        :return: Tuple of sentences (empty if there is no sentence with the id).
+        """
+        return self.buckets.get(id_, ())
 
     @staticmethod
-    def __init_all_sentences():
+    def __init_all_sentences() -> List[Sentence]:
         """Initializes all sentences."""
         def __init_sentence_result():
             """Initializes all sentences for expressing result message."""
@@ -1253,6 +1041,116 @@ class SentenceHandler:
                 Constituent(id_='e-time', morph_params='', explicit_data=Types.ExplicitEntityData.TIME),
                 Constituent(id_='w-penalty', morph_params='', explicit_data=None)]))
 
+        def __init_sentence_season_goal():
+            """Initializes all sentences for expressing season goal message."""
+            type_ = 'n'
+            # id subtypes: first goal of the season = 'f' / next goal of the season = 'n'
+
+            # first goal
+            subtype = 'f'
+            sentences.append(Sentence.create(type_, subtype, True, [
+                Constituent(id_='e-player', morph_params='1-.-0-.-.', explicit_data=Types.ExplicitEntityData.PARTICIPANT),
+                "tím vstřelil svůj první",
+                Constituent(id_='w-goal', morph_params='4-.-.-.-.', explicit_data=None),
+                "v sezóně"]))
+
+            sentences.append(Sentence.create(type_, subtype, True, [
+                "pro",
+                Constituent(id_='e-player', morph_params='4-.-0-.-.', explicit_data=Types.ExplicitEntityData.PARTICIPANT),
+                "to byl první",
+                Constituent(id_='w-goal', morph_params='1-.-.-.-.', explicit_data=None),
+                "sezóny"]))
+
+            # next goal
+            subtype = 'n'
+            sentences.append(Sentence.create(type_, subtype, True, [
+                Constituent(id_='e-player', morph_params='1-.-0-.-.', explicit_data=Types.ExplicitEntityData.PARTICIPANT),
+                "tím vstřelil svůj",
+                Constituent(id_='e-count', morph_params='', explicit_data=Types.ExplicitEntityData.GOAL_COUNT),
+                Constituent(id_='w-goal', morph_params='4-.-.-.-.', explicit_data=None),
+                "v sezóně"]))
+
+            sentences.append(Sentence.create(type_, subtype, True, [
+                "pro",
+                Constituent(id_='e-player', morph_params='4-.-0-.-.', explicit_data=Types.ExplicitEntityData.PARTICIPANT),
+                "to byl už",
+                Constituent(id_='e-count', morph_params='', explicit_data=Types.ExplicitEntityData.GOAL_COUNT),
+                Constituent(id_='w-goal', morph_params='1-.-.-.-.', explicit_data=None),
+                "sezóny"]))
+
+        def __init_sentence_suspension():
+            """Initializes all sentences for expressing suspension message."""
+            type_ = 'u'
+            subtype = ''
+
+            sentences.append(Sentence.create(type_, subtype, True, [
+                Constituent(id_='e-player', morph_params='1-.-0-.-.', explicit_data=Types.ExplicitEntityData.PARTICIPANT),
+                "dostal už",
+                Constituent(id_='e-count', morph_params='', explicit_data=Types.ExplicitEntityData.YELLOW_CARD_COUNT),
+                Constituent(id_='w-yellow_card', morph_params='4-.-2-.-.', explicit_data=None),
+                "v sezóně a v příštím zápase bude chybět"]))
+
+            sentences.append(Sentence.create(type_, subtype, True, [
+                "pro",
+                Constituent(id_='e-player', morph_params='4-.-0-.-.', explicit_data=Types.ExplicitEntityData.PARTICIPANT),
+                "to byla už",
+                Constituent(id_='e-count', morph_params='', explicit_data=Types.ExplicitEntityData.YELLOW_CARD_COUNT),
+                Constituent(id_='w-yellow_card', morph_params='1-.-2-.-.', explicit_data=None),
+                "v sezóně, a proto ho čeká stopka"]))
+
+        def __init_sentence_multiple_substitution():
+            """Initializes all sentences for expressing simultaneous substitutions of one team."""
+            type_ = 'z'
+            subtype = ''
+
+            sentences.append(Sentence.create(type_, subtype, True, [
+                Constituent(id_='e-time', morph_params='', explicit_data=Types.ExplicitEntityData.TIME),
+                Constituent(id_='e-team', morph_params='1-.-.-1-.', explicit_data=Types.ExplicitEntityData.TEAM),
+                Constituent(id_='v-substitution', morph_params='.-0-.-.-1', explicit_data=None),
+                Constituent(id_='e-substitution_count', morph_params='',
+                            explicit_data=Types.ExplicitEntityData.SUBSTITUTION_COUNT),
+                "–",
+                Constituent(id_='e-substitutions', morph_params='',
+                            explicit_data=Types.ExplicitEntityData.SUBSTITUTIONS)]))
+
+            sentences.append(Sentence.create(type_, subtype, True, [
+                Constituent(id_='e-team', morph_params='1-.-.-1-.', explicit_data=Types.ExplicitEntityData.TEAM),
+                Constituent(id_='e-time', morph_params='', explicit_data=Types.ExplicitEntityData.TIME),
+                Constituent(id_='v-substitution', morph_params='.-0-.-.-1', explicit_data=None),
+                "najednou",
+                Constituent(id_='e-substitution_count', morph_params='',
+                            explicit_data=Types.ExplicitEntityData.SUBSTITUTION_COUNT),
+                "–",
+                Constituent(id_='e-substitutions', morph_params='',
+                            explicit_data=Types.ExplicitEntityData.SUBSTITUTIONS)]))
+
+        def __init_sentence_multiple_goal():
+            """Initializes all sentences for expressing more goals of one player (e.g. brace)."""
+            type_ = 'd'
+            subtype = ''
+
+            sentences.append(Sentence.create(type_, subtype, True, [
+                Constituent(id_='e-player', morph_params='1-.-0-.-.', explicit_data=Types.ExplicitEntityData.PARTICIPANT),
+                Constituent(id_='v-goal', morph_params='.-0-.-.-.', explicit_data=None),
+                Constituent(id_='e-goals', morph_params='', explicit_data=Types.ExplicitEntityData.GOAL_COUNT),
+                Constituent(id_='e-times', morph_params='', explicit_data=Types.ExplicitEntityData.TIMES)]))
+
+            sentences.append(Sentence.create(type_, subtype, True, [
+                Constituent(id_='e-times', morph_params='', explicit_data=Types.ExplicitEntityData.TIMES),
+                Constituent(id_='v-goal', morph_params='.-0-.-.-.', explicit_data=None),
+                Constituent(id_='e-player', morph_params='1-.-0-.-.', explicit_data=Types.ExplicitEntityData.PARTICIPANT),
+                Constituent(id_='e-goals', morph_params='', explicit_data=Types.ExplicitEntityData.GOAL_COUNT)]))
+
+            sentences.append(Sentence.create(type_, subtype, False, [
+                Constituent(id_='e-player', morph_params='1-.-0-.-.', explicit_data=Types.ExplicitEntityData.PARTICIPANT),
+                Constituent(id_='v-goal', morph_params='.-0-.-.-.', explicit_data=None),
+                Constituent(id_='e-goals', morph_params='', explicit_data=Types.ExplicitEntityData.GOAL_COUNT),
+                Constituent(id_='e-times', morph_params='', explicit_data=Types.ExplicitEntityData.TIMES),
+                "a",
+                Constituent(id_='v-score_change', morph_params='.-0-.-.-.', explicit_data=None),
+                "na",
+                Constituent(id_='e-score', morph_params='', explicit_data=Types.ExplicitEntityData.CURRENT_SCORE)]))
+
         sentences: List[Sentence] = []
 
         __init_sentence_result()
@@ -1260,62 +1158,84 @@ class SentenceHandler:
         __init_sentence_substitution()
         __init_sentence_card()
         __init_sentence_missed_penalty()
-        sentences.sort()
+        __init_sentence_season_goal()
+        __init_sentence_suspension()
+        __init_sentence_multiple_substitution()
+        __init_sentence_multiple_goal()
         return sentences
 
-    def __try_find_sentence(self, id_: str) -> (bool, int):
+
+SENTENCE_CATALOG: SentenceCatalog = SentenceCatalog.create()
+
+
+class SentenceHandler:
+    """
+    Class for handling assigning and picking suitable sentences for messages.
+    Sentences are taken from the catalog, the handler stores only random order of not yet used sentences
+    for every sentence id needed by the article.
+    """
+    catalog: SentenceCatalog
+    __unused_sentences: Dict[str, List[Sentence]]   # sentence id -> unused sentences (next one is the last)
+
+    def __init__(self, catalog: SentenceCatalog = SENTENCE_CATALOG):
         """
-        Trying to find sentence in all sentences with a certain id.
-        :param id_: String id of the sentence
-        :return: Tuple of boolean an int - bool says if a sentence was found, int is the index
-        (if found == False, then the index is useless)
+        Initializes handler with no sentence used.
+        :param catalog: Catalog of every sentence (default is SENTENCE_CATALOG).
         """
-        for i in range(0, len(self.sentences)):
-            if self.sentences[i].id == id_:
-                return True, i
+        self.catalog = catalog
+        self.__unused_sentences = {}
 
-        return False, None
+    def __get_unused_sentences(self, id_: str) -> List[Sentence]:
+        """
+        Returns unused sentences with a certain id, random order of the sentences is created when the id
+        is needed for the first time.
+        :param id_: String id of the sentence
+        :return: List of unused sentences, the next one to use is the last
+        """
+        unused = self.__unused_sentences.get(id_)
+        if unused is None:
+            unused = list(self.catalog.get_sentences(id_))
+            random.shuffle(unused)   # shuffle sentences to make sure sentences order will vary
+            SentenceHandler.__put_simple_first(unused)
+            self.__unused_sentences[id_] = unused
+        return unused
 
-    def __get_random_used(self, id_: str) -> Sentence:
+    @staticmethod
+    def __put_simple_first(sentences: List[Sentence]):
         """
-        Returns random sentence with given id from already used sentences.
-        :param id_: id of the sentence
-        :return: Sentence
+        Ensures to use simple version of the sentence first (the last sentence is swapped with the nearest
+        simple one, if it is not simple already).
+        :param sentences: Sentences of the same id, the next one to use is the last.
         """
-        valid_sentences: List[Sentence] = []
-        for us in self.used_sentences:
-            if us.id == id_:
-                valid_sentences.append(us)
+        index = len(sentences) - 1
+        while index >= 0 and not sentences[index].simple:
+            index -= 1
 
-        return random.choice(valid_sentences)
+        if 0 <= index < len(sentences) - 1:
+            (sentences[index], sentences[-1]) = (sentences[-1], sentences[index])
 
-    def get_sentence(self, m: dp.Message) -> Sentence:
+    def get_sentence(self, m: dp.Message) -> SentenceBinding:
         """
         Picks suitable sentence given the message.
         :param m: Message
-        :return: Sentence
+        :return: SentenceBinding
         """
         id_ = self.__init_sentence_id(m)
-        (found, sentence_index) = self.__try_find_sentence(id_)
+        unused = self.__get_unused_sentences(id_)
 
-        if found:
-            sentence = self.sentences.pop(sentence_index)
-            sentence.msg = m
-            self.used_sentences.append(sentence)
-            return sentence
-        else:
-            sentence = copy.deepcopy(self.__get_random_used(id_))   # need a new object to dont ruin the previous one
-            sentence.msg = m
-            return sentence
+        if len(unused) != 0:
+            sentence = unused.pop()
+        else:   # every sentence of the id is already used, any of them can be used again
+            sentence = random.choice(self.catalog.get_sentences(id_))
+        return SentenceBinding.create(sentence, m)
 
-    def create_sentences_templates(self, doc_plan: dp.DocumentPlan) -> (Sentence, List[Sentence]):
+    def create_sentences_templates(self, doc_plan: dp.DocumentPlan) -> (SentenceBinding, List[SentenceBinding]):
         """
         Picks suitable sentence for every message.
         Matches sentences with particular data from Message.
         :param doc_plan: DocumentPlan
-        :return: Tuple of sentences - title(Sentence) and body (List[Sentence])
+        :return: Tuple of sentences - title(SentenceBinding) and body (List[SentenceBinding])
         """
-        self.__randomize_sentences_order()   # randomizing sentence order (but sorted)
         title_sentence = self.get_sentence(doc_plan.title)
         body_sentences = [self.get_sentence(msg) for msg in doc_plan.body]
         return title_sentence, body_sentences
@@ -1359,6 +1279,15 @@ class SentenceHandler:
                 subtype = 'r'
             else:  # Types.Card.YELLOW
                 subtype = 'y'
+        elif type(m) is dp.Message.SeasonGoal:
+            type_ = 'n'
+            subtype = 'f' if m.goal_count == 1 else 'n'
+        elif type(m) is dp.Message.Suspension:
+            type_ = 'u'
+        elif type(m) is dp.Message.MultipleSubstitution:
+            type_ = 'z'
+        elif type(m) is dp.Message.MultipleGoal:
+            type_ = 'd'
         else:  # type(m) is dp.Message.MissedPenalty:
             type_ = 'm'
 